@@ -1,31 +1,47 @@
-# noinspection PyUnresolvedReferences
-from prompt_toolkit.styles import Style
-from prompt_toolkit.validation import ValidationError
-from prompt_toolkit.validation import Validator
+import sys
+from importlib import import_module
+from types import ModuleType
+from typing import TYPE_CHECKING
+from typing import Any
+from typing import List
 
 import questionary.version
-from questionary.form import Form
-from questionary.form import FormField
-from questionary.form import form
-from questionary.prompt import prompt
-from questionary.prompt import prompt_async
-from questionary.prompt import unsafe_prompt
-from questionary.prompt import unsafe_prompt_async
-
-# import the shortcuts to create single question prompts
-from questionary.prompts.autocomplete import autocomplete
-from questionary.prompts.checkbox import checkbox
-from questionary.prompts.common import Choice
-from questionary.prompts.common import Separator
-from questionary.prompts.common import print_formatted_text as print
-from questionary.prompts.confirm import confirm
-from questionary.prompts.password import password
-from questionary.prompts.path import path
-from questionary.prompts.press_any_key_to_continue import press_any_key_to_continue
-from questionary.prompts.rawselect import rawselect
-from questionary.prompts.select import select
-from questionary.prompts.text import text
-from questionary.question import Question
+
+if TYPE_CHECKING:
+    # noinspection PyUnresolvedReferences
+    from prompt_toolkit.styles import Style
+    from prompt_toolkit.validation import ValidationError
+    from prompt_toolkit.validation import Validator
+
+    from questionary.batch import answers_from_env
+    from questionary.batch import batch_prompt
+    from questionary.batch import iter_answer_records
+    from questionary.batch import load_answers
+    from questionary.form import Form
+    from questionary.form import FormField
+    from questionary.form import form
+    from questionary.prompt import CompiledPrompt
+    from questionary.prompt import compile
+    from questionary.prompt import prompt
+    from questionary.prompt import prompt_async
+    from questionary.prompt import unsafe_prompt
+    from questionary.prompt import unsafe_prompt_async
+
+    # import the shortcuts to create single question prompts
+    from questionary.prompts.autocomplete import autocomplete
+    from questionary.prompts.checkbox import checkbox
+    from questionary.prompts.common import Choice
+    from questionary.prompts.common import ChoiceTable
+    from questionary.prompts.common import Separator
+    from questionary.prompts.common import print_formatted_text as print
+    from questionary.prompts.confirm import confirm
+    from questionary.prompts.password import password
+    from questionary.prompts.path import path
+    from questionary.prompts.press_any_key_to_continue import press_any_key_to_continue
+    from questionary.prompts.rawselect import rawselect
+    from questionary.prompts.select import select
+    from questionary.prompts.text import text
+    from questionary.question import Question
 
 __version__ = questionary.version.__version__
 
@@ -44,17 +60,97 @@ __all__ = [
     # utility methods
     "print",
     "form",
+    "compile",
     "prompt",
     "prompt_async",
     "unsafe_prompt",
     "unsafe_prompt_async",
+    "batch_prompt",
+    "load_answers",
+    "iter_answer_records",
+    "answers_from_env",
     # commonly used classes
     "Form",
     "FormField",
+    "CompiledPrompt",
     "Question",
     "Choice",
+    "ChoiceTable",
     "Style",
     "Separator",
     "Validator",
     "ValidationError",
 ]
+
+# The public API is imported on first access, importing prompt_toolkit (and
+# all the prompts) takes much longer than most scripts need to get started.
+# Maps each name to the module defining it and its name there.
+_LAZY_ATTRIBUTES = {
+    "Style": ("prompt_toolkit.styles", "Style"),
+    "ValidationError": ("prompt_toolkit.validation", "ValidationError"),
+    "Validator": ("prompt_toolkit.validation", "Validator"),
+    "Form": ("questionary.form", "Form"),
+    "FormField": ("questionary.form", "FormField"),
+    "form": ("questionary.form", "form"),
+    "compile": ("questionary.prompt", "compile"),
+    "CompiledPrompt": ("questionary.prompt", "CompiledPrompt"),
+    "prompt": ("questionary.prompt", "prompt"),
+    "prompt_async": ("questionary.prompt", "prompt_async"),
+    "unsafe_prompt": ("questionary.prompt", "unsafe_prompt"),
+    "unsafe_prompt_async": ("questionary.prompt", "unsafe_prompt_async"),
+    "batch_prompt": ("questionary.batch", "batch_prompt"),
+    "load_answers": ("questionary.batch", "load_answers"),
+    "iter_answer_records": ("questionary.batch", "iter_answer_records"),
+    "answers_from_env": ("questionary.batch", "answers_from_env"),
+    "autocomplete": ("questionary.prompts.autocomplete", "autocomplete"),
+    "checkbox": ("questionary.prompts.checkbox", "checkbox"),
+    "Choice": ("questionary.prompts.common", "Choice"),
+    "ChoiceTable": ("questionary.prompts.common", "ChoiceTable"),
+    "Separator": ("questionary.prompts.common", "Separator"),
+    "print": ("questionary.prompts.common", "print_formatted_text"),
+    "confirm": ("questionary.prompts.confirm", "confirm"),
+    "password": ("questionary.prompts.password", "password"),
+    "path": ("questionary.prompts.path", "path"),
+    "press_any_key_to_continue": (
+        "questionary.prompts.press_any_key_to_continue",
+        "press_any_key_to_continue",
+    ),
+    "rawselect": ("questionary.prompts.rawselect", "rawselect"),
+    "select": ("questionary.prompts.select", "select"),
+    "text": ("questionary.prompts.text", "text"),
+    "Question": ("questionary.question", "Question"),
+}
+
+
+def __getattr__(name: str) -> Any:
+    try:
+        module_name, attribute = _LAZY_ATTRIBUTES[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+
+    value = getattr(import_module(module_name), attribute)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> List[str]:
+    return sorted(set(globals()) | set(__all__))
+
+
+class _Package(ModuleType):
+    """Keeps ``form`` and ``prompt`` referring to the functions.
+
+    Importing the submodules of the same name would otherwise replace the
+    functions with the modules in the package namespace."""
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        if (
+            isinstance(value, ModuleType)
+            and value.__name__ == f"{__name__}.{name}"
+            and name in _LAZY_ATTRIBUTES
+        ):
+            return
+        super().__setattr__(name, value)
+
+
+sys.modules[__name__].__class__ = _Package
@@ -0,0 +1,180 @@
+"""Answer questions without a terminal, e.g. in CI.
+
+The answers are read from answer files or environment variables instead of
+asking the user. No prompt_toolkit application is created.
+"""
+
+import json
+import os
+from typing import Any
+from typing import Dict
+from typing import Iterable
+from typing import Iterator
+from typing import Mapping
+from typing import Optional
+from typing import Union
+
+from questionary.prompt import compile
+
+AnswerSource = Union[Mapping[str, Any], str, "os.PathLike[str]"]
+
+YAML_SUFFIXES = (".yaml", ".yml")
+
+
+def _load_yaml_module() -> Any:
+    try:
+        import yaml
+    except ImportError as e:
+        raise ImportError(
+            "Reading YAML answer files requires PyYAML, install it using "
+            "`pip install pyyaml`."
+        ) from e
+    return yaml
+
+
+def _is_yaml(path: "Union[str, os.PathLike[str]]") -> bool:
+    return os.fspath(path).lower().endswith(YAML_SUFFIXES)
+
+
+def load_answers(path: "Union[str, os.PathLike[str]]") -> Dict[str, Any]:
+    """Load the answers to questions from a JSON or YAML file.
+
+    The file contains a single mapping from question names to answers.
+    Files ending in ``.yaml`` or ``.yml`` are read as YAML (requires
+    PyYAML), all other files as JSON.
+
+    Args:
+        path: Path of the answer file.
+
+    Returns:
+        Answers by question name.
+    """
+    with open(path, encoding="utf-8") as f:
+        if _is_yaml(path):
+            answers = _load_yaml_module().safe_load(f)
+        else:
+            answers = json.load(f)
+
+    if not isinstance(answers, dict):
+        raise ValueError(f"Answer file {os.fspath(path)} must contain a mapping.")
+    return answers
+
+
+def iter_answer_records(
+    path: "Union[str, os.PathLike[str]]",
+) -> Iterator[Dict[str, Any]]:
+    """Read many answer records from a file, one record at a time.
+
+    Supported are JSON Lines files (``.jsonl``, one record per line), YAML
+    files (``.yaml`` or ``.yml``, one record per document or a list of
+    records) and JSON files (a list of records or a single record). JSON
+    Lines and multi-document YAML files are read lazily, so they can be
+    larger than the available memory.
+
+    Args:
+        path: Path of the answer file.
+
+    Returns:
+        The answer records in the file.
+    """
+    name = os.fspath(path)
+
+    with open(path, encoding="utf-8") as f:
+        if name.lower().endswith(".jsonl"):
+            documents: Iterable[Any] = (json.loads(line) for line in f if line.strip())
+        elif _is_yaml(path):
+            documents = _load_yaml_module().safe_load_all(f)
+        else:
+            documents = [json.load(f)]
+
+        for document in documents:
+            records = document if isinstance(document, list) else [document]
+            for record in records:
+                if not isinstance(record, dict):
+                    raise ValueError(
+                        f"Answer records in {name} must be mappings, "
+                        f"got {record!r}."
+                    )
+                yield record
+
+
+def answers_from_env(
+    prefix: str = "QUESTIONARY_", environ: Optional[Mapping[str, str]] = None
+) -> Dict[str, str]:
+    """Read the answers to questions from environment variables.
+
+    A variable named ``prefix`` followed by the upper-cased question name
+    answers the question, e.g. ``QUESTIONARY_FIRST_NAME`` answers the
+    ``first_name`` question. Confirm answers can be spelled as ``y``,
+    ``yes``, ``true`` or ``1`` (and their negations), checkbox answers as
+    a comma separated list.
+
+    Args:
+        prefix: Prefix of the variables holding answers.
+
+        environ: Variables to read, defaults to :data:`os.environ`.
+
+    Returns:
+        Answers by (lower-cased) question name.
+    """
+    if environ is None:
+        environ = os.environ
+
+    return {
+        key.removeprefix(prefix).lower(): value
+        for key, value in environ.items()
+        if key.startswith(prefix) and len(key) > len(prefix)
+    }
+
+
+def batch_prompt(
+    questions: Union[Dict[str, Any], Iterable[Mapping[str, Any]]],
+    source: AnswerSource,
+    answers: Optional[Mapping[str, Any]] = None,
+    **kwargs: Any,
+) -> Dict[str, Any]:
+    """Answer the questions from an answer source instead of asking them.
+
+    The questions are configured like for :func:`~questionary.prompt`, and
+    their options are treated the same way: ``when`` decides if a question
+    is answered, questions without an answer in ``source`` use their
+    (callable) ``default``, answers have to pass ``validate`` and are
+    passed to ``filter``. Answers of select, rawselect and checkbox
+    questions have to be values of their choices. The messages of
+    ``print`` questions are not printed.
+
+    To answer the same questions many times, e.g. for every record of
+    :func:`iter_answer_records`, use :meth:`CompiledPrompt.answer_many
+    <questionary.CompiledPrompt.answer_many>` of :func:`~questionary.compile`.
+
+    Example:
+        >>> import questionary
+        >>> questionary.batch_prompt(
+        ...     [{"type": "confirm", "name": "deploy", "message": "Deploy?"}],
+        ...     {"deploy": "yes"},
+        ... )
+        {'deploy': True}
+
+    Args:
+        questions: A list of question configs representing questions to
+                   answer.
+
+        source: Answers by question name, or the path of a JSON or YAML
+                answer file (see :func:`load_answers`).
+
+        answers: Default answers.
+
+        kwargs: Additional options passed to every question.
+
+    Returns:
+        Dictionary of question answers.
+
+    Raises:
+        PromptParameterException: A question misses a required option.
+        ValueError: A question config is invalid, a question has no answer
+                    or an answer is invalid.
+    """
+    if not isinstance(source, Mapping):
+        source = load_answers(source)
+
+    return compile(questions, **kwargs).answer(source, answers)
@@ -24,15 +24,40 @@ INDICATOR_SELECTED = "●"
 # Item prefix to identify unselected items in a checkbox list
 INDICATOR_UNSELECTED = "○"
 
+# Line shown above a virtualized list when choices are scrolled out of view
+MORE_CHOICES_ABOVE = "  ↑ {} more"
+
+# Line shown below a virtualized list when choices are scrolled out of view
+MORE_CHOICES_BELOW = "  ↓ {} more"
+
+# Shown while choices are still arriving from an asynchronous source
+LOADING_CHOICES = "Loading…"
+
+# Terminal rows a virtualized list leaves free for the question, the scroll
+# indicators, the search string and the validation toolbar
+VIEWPORT_RESERVED_ROWS = 6
+
 # Prefix displayed in front of questions
 DEFAULT_QUESTION_PREFIX = "?"
 
 # Message shown when a user aborts a question prompt using CTRL-C
 DEFAULT_KBI_MESSAGE = "\nCancelled by user\n"
 
+# Seconds without typing before a completion runs in the background
+DEFAULT_COMPLETION_DELAY = 0.1
+
+# Seconds to wait for further input before validating with a coroutine
+DEFAULT_VALIDATION_DELAY = 0.1
+
+# Seconds within which typed digits add up to a single choice number
+NUMBER_JUMP_TIMEOUT = 1.0
+
 # Default text shown when the input is invalid
 INVALID_INPUT = "Invalid input"
 
+# Shown while submitted input is still being validated
+VALIDATING_INPUT = "Validating…"
+
 # Default message style
 DEFAULT_STYLE = Style(
     [
@@ -47,6 +72,10 @@ DEFAULT_STYLE = Style(
             "search_none",
             "noinherit fg:#FF0000 bold",
         ),  # submitted answer text behind the question
+        (
+            "search_match",
+            "underline",
+        ),  # characters of a choice matched by a fuzzy search
         ("pointer", ""),  # pointer used in select and checkbox prompts
         ("selected", ""),  # style for a selected item of a checkbox
         ("separator", ""),  # separator in lists
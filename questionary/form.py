@@ -1,8 +1,19 @@
+from contextlib import ExitStack
+from typing import TYPE_CHECKING
 from typing import Any
+from typing import Callable
 from typing import Dict
+from typing import List
 from typing import NamedTuple
+from typing import Optional
 from typing import Sequence
+from typing import Tuple
 
+import prompt_toolkit.patch_stdout
+from prompt_toolkit import Application
+from prompt_toolkit.utils import Event
+
+from questionary import utils
 from questionary.constants import DEFAULT_KBI_MESSAGE
 from questionary.question import Question
 
@@ -32,6 +43,179 @@ def form(**kwargs: Question) -> "Form":
     return Form(*(FormField(k, q) for k, q in kwargs.items()))
 
 
+# settings of a question's application, which are taken over while the
+# question is asked in a single application form (not all of them exist in
+# every prompt toolkit version, e.g. ``cursor`` was added in 3.0.20)
+_FIELD_APPLICATION_ATTRIBUTES = (
+    "_color_depth",
+    "clipboard",
+    "cursor",
+    "editing_mode",
+    "erase_when_done",
+    "mouse_support",
+    "paste_mode",
+    "style_transformation",
+)
+
+# the single application form renders the answered questions with these
+# private methods of prompt toolkit 3, without them the questions are asked
+# in an application each
+_SINGLE_APPLICATION_SUPPORTED = utils.is_prompt_toolkit_3() and all(
+    hasattr(Application, method)
+    for method in ("_redraw", "_request_absolute_cursor_position")
+)
+
+if TYPE_CHECKING:
+    _ApplicationBase = Application[Dict[str, Any]]
+else:
+    # applications are not generic in prompt toolkit 2
+    _ApplicationBase = Application
+
+
+class _FormApplication(_ApplicationBase):
+    """Asks the questions of a form one after another in one application.
+
+    The layout, key bindings and style of the question being asked are
+    swapped in. A question answering exits the application of the question,
+    here this renders the answered question and moves on to the next one.
+    The terminal stays in raw mode for the whole form and keys typed ahead
+    are passed on to the next question. The render and key press events of
+    the form are passed on to the application of the question, e.g. to
+    trace it.
+
+    Input and output are those of the first question."""
+
+    def __init__(self, form_fields: Sequence[FormField]) -> None:
+        self.form_fields = form_fields
+        self.answers: Dict[str, Any] = {}
+        self._field_index = 0
+        self._rendering_answered_field = False
+        # the question being asked, see `Question.asking`
+        self.asking = ExitStack()
+
+        first = form_fields[0].question.application
+        super().__init__(layout=first.layout, input=first.input, output=first.output)
+
+        self._forward_events(
+            self.before_render,
+            self.after_render,
+            lambda app: (app.before_render, app.after_render),
+        )
+        self._forward_events(
+            self.key_processor.before_key_press,
+            self.key_processor.after_key_press,
+            lambda app: (
+                app.key_processor.before_key_press,
+                app.key_processor.after_key_press,
+            ),
+        )
+
+    @property
+    def _field_application(self) -> "Application[Any]":
+        return self.form_fields[self._field_index].question.application
+
+    def _forward_events(
+        self,
+        before: "Event[Any]",
+        after: "Event[Any]",
+        get_events: Callable[["Application[Any]"], Tuple["Event[Any]", "Event[Any]"]],
+    ) -> None:
+        # the question which got the `before` event gets the `after` event,
+        # even if a key press moved on to the next question in between
+        pending: List["Event[Any]"] = []
+
+        def forward_before(_: Any) -> None:
+            field_before, field_after = get_events(self._field_application)
+            pending.append(field_after)
+            field_before.fire()
+
+        def forward_after(_: Any) -> None:
+            if pending:
+                pending.pop().fire()
+
+        before.add_handler(forward_before)
+        after.add_handler(forward_after)
+
+    @property
+    def is_done(self) -> bool:
+        return self._rendering_answered_field or super().is_done
+
+    def _activate_field(self, index: int) -> None:
+        self._field_index = index
+        question = self.form_fields[index].question
+        self.asking.close()
+        self.asking.enter_context(question.asking())
+
+        application = question.application
+        self.layout = application.layout
+        self.key_bindings = application.key_bindings
+        self.style = application.style
+        for attribute in _FIELD_APPLICATION_ATTRIBUTES:
+            if hasattr(application, attribute):
+                setattr(self, attribute, getattr(application, attribute))
+
+        # run by this application instead, as the question's one never runs
+        self.pre_run_callables.extend(application.pre_run_callables)
+        del application.pre_run_callables[:]
+
+    def _reset_field(self) -> None:
+        # the part of `Application.reset` concerning the question
+        self.layout.reset()
+        self._field_application.on_reset.fire()
+
+        if not self.layout.current_control.is_focusable():
+            for w in self.layout.find_all_windows():
+                if w.content.is_focusable():
+                    self.layout.current_window = w
+
+    def reset(self) -> None:
+        if not self.is_running:
+            # resetting on creation, the questions are set up once it runs
+            super().reset()
+            return
+
+        self.answers = {}
+        self._activate_field(0)
+        super().reset()
+        self._reset_field()
+
+    def exit(
+        self,
+        result: Any = None,
+        exception: Optional[Any] = None,
+        style: str = "",
+    ) -> None:
+        if exception is not None:
+            super().exit(exception=exception, style=style)
+            return
+
+        self.answers[self.form_fields[self._field_index].key] = result
+        if self._field_index == len(self.form_fields) - 1:
+            super().exit(result=self.answers, style=style)
+            return
+
+        # leave the answered question on the screen, like it would be after
+        # its own application finished
+        self.exit_style = style
+        self._rendering_answered_field = True
+        try:
+            self._redraw(render_as_done=True)
+        finally:
+            self._rendering_answered_field = False
+            self.exit_style = ""
+
+        self.asking.close()
+
+        self._activate_field(self._field_index + 1)
+        self._reset_field()
+        for c in self.pre_run_callables:
+            c()
+        del self.pre_run_callables[:]
+
+        self._request_absolute_cursor_position()
+        self.invalidate()
+
+
 class Form:
     """Multi question prompts. Questions are asked one after another.
 
@@ -45,7 +229,18 @@ class Form:
     def __init__(self, *form_fields: FormField) -> None:
         self.form_fields = form_fields
 
-    def unsafe_ask(self, patch_stdout: bool = False) -> Dict[str, Any]:
+    def _asked_fields(self) -> List[FormField]:
+        return [f for f in self.form_fields if not f.question.should_skip_question]
+
+    def _with_skipped_answers(self, answers: Dict[str, Any]) -> Dict[str, Any]:
+        return {
+            f.key: answers[f.key] if f.key in answers else f.question.default
+            for f in self.form_fields
+        }
+
+    def unsafe_ask(
+        self, patch_stdout: bool = False, single_application: bool = False
+    ) -> Dict[str, Any]:
         """Ask the questions synchronously and return user response.
 
         Does not catch keyboard interrupts.
@@ -54,12 +249,39 @@ class Form:
             patch_stdout: Ensure that the prompt renders correctly if other threads
                           are printing to stdout.
 
+            single_application: Ask all questions in one application, instead
+                                of running the application of each question.
+                                The terminal is set up only once for the
+                                whole form, which avoids a noticeable delay
+                                between the questions over slow connections.
+                                Falls back to asking the questions one by
+                                one if the installed prompt toolkit version
+                                does not support it.
+
         Returns:
             The answers from the form.
         """
-        return {f.key: f.question.unsafe_ask(patch_stdout) for f in self.form_fields}
+        if not single_application or not _SINGLE_APPLICATION_SUPPORTED:
+            return {
+                f.key: f.question.unsafe_ask(patch_stdout) for f in self.form_fields
+            }
+
+        fields = self._asked_fields()
+        if not fields:
+            return self._with_skipped_answers({})
 
-    async def unsafe_ask_async(self, patch_stdout: bool = False) -> Dict[str, Any]:
+        app = _FormApplication(fields)
+        with app.asking:
+            if patch_stdout:
+                with prompt_toolkit.patch_stdout.patch_stdout():
+                    answers = app.run()
+            else:
+                answers = app.run()
+        return self._with_skipped_answers(answers)
+
+    async def unsafe_ask_async(
+        self, patch_stdout: bool = False, single_application: bool = False
+    ) -> Dict[str, Any]:
         """Ask the questions using asyncio and return user response.
 
         Does not catch keyboard interrupts.
@@ -68,16 +290,39 @@ class Form:
             patch_stdout: Ensure that the prompt renders correctly if other threads
                           are printing to stdout.
 
+            single_application: Ask all questions in one application, instead
+                                of running the application of each question.
+
         Returns:
             The answers from the form.
         """
-        return {
-            f.key: await f.question.unsafe_ask_async(patch_stdout)
-            for f in self.form_fields
-        }
+        if not single_application or not _SINGLE_APPLICATION_SUPPORTED:
+            return {
+                f.key: await f.question.unsafe_ask_async(patch_stdout)
+                for f in self.form_fields
+            }
+
+        fields = self._asked_fields()
+        if not fields:
+            return self._with_skipped_answers({})
+
+        if not utils.ACTIVATED_ASYNC_MODE:
+            await utils.activate_prompt_toolkit_async_mode()
+
+        app = _FormApplication(fields)
+        with app.asking:
+            if patch_stdout:
+                with prompt_toolkit.patch_stdout.patch_stdout():
+                    answers = await app.run_async()
+            else:
+                answers = await app.run_async()
+        return self._with_skipped_answers(answers)
 
     def ask(
-        self, patch_stdout: bool = False, kbi_msg: str = DEFAULT_KBI_MESSAGE
+        self,
+        patch_stdout: bool = False,
+        kbi_msg: str = DEFAULT_KBI_MESSAGE,
+        single_application: bool = False,
     ) -> Dict[str, Any]:
         """Ask the questions synchronously and return user response.
 
@@ -87,17 +332,23 @@ class Form:
 
             kbi_msg: The message to be printed on a keyboard interrupt.
 
+            single_application: Ask all questions in one application, instead
+                                of running the application of each question.
+
         Returns:
             The answers from the form.
         """
         try:
-            return self.unsafe_ask(patch_stdout)
+            return self.unsafe_ask(patch_stdout, single_application)
         except KeyboardInterrupt:
             print(kbi_msg)
             return {}
 
     async def ask_async(
-        self, patch_stdout: bool = False, kbi_msg: str = DEFAULT_KBI_MESSAGE
+        self,
+        patch_stdout: bool = False,
+        kbi_msg: str = DEFAULT_KBI_MESSAGE,
+        single_application: bool = False,
     ) -> Dict[str, Any]:
         """Ask the questions using asyncio and return user response.
 
@@ -107,11 +358,14 @@ class Form:
 
             kbi_msg: The message to be printed on a keyboard interrupt.
 
+            single_application: Ask all questions in one application, instead
+                                of running the application of each question.
+
         Returns:
             The answers from the form.
         """
         try:
-            return await self.unsafe_ask_async(patch_stdout)
+            return await self.unsafe_ask_async(patch_stdout, single_application)
         except KeyboardInterrupt:
             print(kbi_msg)
             return {}
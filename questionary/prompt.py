@@ -1,17 +1,29 @@
+import asyncio
 from typing import Any
 from typing import Callable
 from typing import Dict
 from typing import Iterable
+from typing import Iterator
+from typing import List
 from typing import Mapping
 from typing import Optional
+from typing import Sequence
+from typing import Set
+from typing import Tuple
 from typing import Union
 
+from prompt_toolkit.document import Document
 from prompt_toolkit.output import ColorDepth
+from prompt_toolkit.validation import ValidationError
 
 from questionary import utils
 from questionary.constants import DEFAULT_KBI_MESSAGE
+from questionary.constants import INVALID_INPUT
 from questionary.prompts import AVAILABLE_PROMPTS
 from questionary.prompts import prompt_by_name
+from questionary.prompts.common import Choice
+from questionary.prompts.common import Separator
+from questionary.prompts.common import build_validator
 from questionary.prompts.common import print_formatted_text
 from questionary.question import Question
 
@@ -24,6 +36,448 @@ class PromptParameterException(ValueError):
         super().__init__(f"You must provide a `{message}` value", errors)
 
 
+# spellings of confirm answers read from text, e.g. environment variables
+_CONFIRM_ANSWERS = {
+    "y": True,
+    "yes": True,
+    "true": True,
+    "1": True,
+    "n": False,
+    "no": False,
+    "false": False,
+    "0": False,
+}
+
+
+def _choice_values(choices: Any) -> Optional[List[Any]]:
+    """Values of the selectable choices, ``None`` if they can't be listed."""
+    if not isinstance(choices, Iterable):
+        return None  # an asynchronous choice source
+
+    values = []
+    for c in choices:
+        if isinstance(c, Separator):
+            continue
+        choice = Choice.build(c)
+        if not choice.disabled:
+            values.append(choice.value)
+    return values
+
+
+def _default_selection(name: str, choices: Any, default: Any) -> Optional[List[Any]]:
+    """Values a checkbox starts with, ``None`` if the choices can't be listed.
+
+    Like in the checkbox, these are the checked choices and the choice
+    matching ``default``."""
+    if not isinstance(choices, Iterable):
+        return None  # an asynchronous choice source
+
+    values = []
+    found_default = default is None
+    for c in choices:
+        if isinstance(c, Separator):
+            continue
+        choice = Choice.build(c)
+        if isinstance(default, Choice):
+            is_default = default == choice
+        else:
+            is_default = default is not None and default == choice.value
+        found_default = found_default or is_default
+        if choice.checked or is_default:
+            values.append(choice.value)
+
+    if not found_default:
+        raise ValueError(
+            f"Invalid default for {name} question: {default!r} is not a choice"
+        )
+    return values
+
+
+def _match_choice(name: str, answer: Any, values: List[Any]) -> Any:
+    if answer in values:
+        return answer
+
+    # answers read from text match choices by their string representation
+    for value in values:
+        if str(value) == answer:
+            return value
+
+    raise ValueError(f"Invalid answer for {name} question: {answer!r} is not a choice")
+
+
+# options of a question config which can be callables of the answers
+_CALLABLE_OPTIONS = ("when", "choices", "default")
+
+_MISSING = object()
+
+
+class _TrackedAnswers(Mapping[str, Any]):
+    """Read-only view of answers, recording which of them are looked at."""
+
+    def __init__(self, answers: Dict[str, Any]) -> None:
+        self._answers = answers
+        self.accessed: Set[str] = set()
+        self.iterated = False
+
+    def __getitem__(self, key: str) -> Any:
+        self.accessed.add(key)
+        return self._answers[key]
+
+    def __iter__(self) -> Iterator[str]:
+        self.iterated = True
+        return iter(self._answers)
+
+    def __len__(self) -> int:
+        self.iterated = True
+        return len(self._answers)
+
+    def is_current(self, answers: Mapping[str, Any]) -> bool:
+        """Whether the answers looked at are the same in ``answers``."""
+        if self.iterated and answers.keys() != self._answers.keys():
+            return False
+
+        keys = self._answers if self.iterated else self.accessed
+        return all(
+            answers.get(k, _MISSING) is self._answers.get(k, _MISSING) for k in keys
+        )
+
+
+class _QuestionPlan:
+    """The validated configuration of a single question.
+
+    Everything that does not depend on the answers to previous questions is
+    done once, when the plan is created and :meth:`prepare` is called.
+
+    Args:
+        question_config: A configuration dictionary for a single question.
+
+        true_color: Use true color output.
+
+        kwargs: Default options of the question.
+    """
+
+    def __init__(
+        self, question_config: Mapping[str, Any], true_color: bool, **kwargs: Any
+    ) -> None:
+        question_config = dict(question_config)
+        # import the question
+        if "type" not in question_config:
+            raise PromptParameterException("type")
+        # every type except 'print' needs a name
+        if "name" not in question_config and question_config["type"] != "print":
+            raise PromptParameterException("name")
+
+        _kwargs = kwargs.copy()
+        _kwargs.update(question_config)
+
+        self.type = _kwargs.pop("type")
+        self.filter = _kwargs.pop("filter", None)
+        self.name = (
+            _kwargs.pop("name", None) if self.type == "print" else _kwargs.pop("name")
+        )
+        self.when = _kwargs.pop("when", None)
+
+        if true_color:
+            _kwargs["color_depth"] = ColorDepth.TRUE_COLOR
+
+        if self.when and not callable(question_config["when"]):
+            raise ValueError("'when' needs to be function that accepts a dict argument")
+
+        self.question_config = question_config
+        self.kwargs = _kwargs
+        self.create_question_func: Optional[Callable[..., Question]] = None
+        self.prepared = False
+
+    def option_callables(self) -> Dict[str, Callable[[Mapping[str, Any]], Any]]:
+        """The options of the question which are evaluated on the answers."""
+        return {
+            option: self.question_config[option]
+            for option in _CALLABLE_OPTIONS
+            if callable(self.question_config.get(option))
+        }
+
+    def is_asked(
+        self, answers: Dict[str, Any], options: Optional[Dict[str, Any]] = None
+    ) -> bool:
+        """Evaluate the ``when`` condition of the question.
+
+        Args:
+            answers: The answers given so far.
+
+            options: Already evaluated callable options of the question.
+        """
+        if not self.when:
+            return True
+
+        if options and "when" in options:
+            return bool(options["when"])
+
+        try:
+            return bool(self.question_config["when"](answers))
+        except Exception as exception:
+            raise ValueError(
+                f"Problem in 'when' check of " f"{self.name} question: {exception}"
+            ) from exception
+
+    def prepare(self) -> None:
+        """Validate the remaining options and resolve the question type."""
+        if self.prepared:
+            return
+
+        # handle 'print' type
+        if self.type == "print":
+            if "message" not in self.kwargs:
+                raise PromptParameterException("message")
+
+            # questions can take 'input' arg but print_formatted_text does not
+            # Remove 'input', if present, to avoid breaking during tests
+            self.kwargs.pop("input", None)
+            self.prepared = True
+            return
+
+        if self.filter:
+            # at least a little sanity check!
+            if not callable(self.filter):
+                raise ValueError(
+                    "'filter' needs to be function that accepts an argument"
+                )
+
+        self.create_question_func = prompt_by_name(self.type)
+
+        if not self.create_question_func:
+            raise ValueError(
+                f"No question type '{self.type}' found. "
+                f"Known question types are {', '.join(AVAILABLE_PROMPTS)}."
+            )
+
+        missing_args = list(
+            utils.missing_arguments(self.create_question_func, self.kwargs)
+        )
+        if missing_args:
+            raise PromptParameterException(missing_args[0])
+
+        self.prepared = True
+
+    def create(
+        self, answers: Dict[str, Any], options: Optional[Dict[str, Any]] = None
+    ) -> Optional[Tuple[Question, Callable[[Any], None]]]:
+        """Create the question, or print the message of a 'print' question.
+
+        Args:
+            answers: The answers given so far.
+
+            options: Already evaluated callable options of the question.
+
+        Returns:
+            A question to be asked and a callable to handle the answer
+        """
+        options = options or {}
+        _kwargs = self.kwargs.copy()
+        name = self.name
+
+        if self.type == "print":
+            message = _kwargs.pop("message")
+            print_formatted_text(message, **_kwargs)
+            if name:
+                answers[name] = None
+            return None
+
+        choices = self.question_config.get("choices")
+        if "choices" in options:
+            _kwargs["choices"] = options["choices"]
+        elif choices is not None and callable(choices):
+            _kwargs["choices"] = choices(answers)
+
+        if "default" in options:
+            _kwargs["default"] = options["default"]
+        elif callable(self.question_config.get("default")):
+            _kwargs["default"] = self.question_config["default"](answers)
+
+        assert self.create_question_func is not None
+        question = self.create_question_func(**_kwargs)
+
+        def on_answer(answer):
+            self.store_answer(answer, answers)
+
+        return question, on_answer
+
+    def store_answer(self, answer: Any, answers: Dict[str, Any]) -> None:
+        """Filter the answer to the question and add it to ``answers``."""
+        if answer is None:
+            return
+
+        if self.filter:
+            try:
+                answer = self.filter(answer)
+            except Exception as exception:
+                raise ValueError(
+                    f"Problem processing 'filter' of {self.name} "
+                    f"question: {exception}"
+                ) from exception
+        answers[self.name] = answer
+
+    def answer(self, source: Mapping[str, Any], answers: Dict[str, Any]) -> None:
+        """Answer the question from ``source``, without asking it.
+
+        Falls back to the default of the question if ``source`` has no
+        answer, for a checkbox to its checked choices and the choice of its
+        default. The answer is checked like the input of the question would
+        be, it has to be one of the choices and pass the validation.
+
+        Raises:
+            ValueError: There is no answer or the answer is invalid.
+        """
+        name = self.name
+
+        if self.type == "print":
+            if name:
+                answers[name] = None
+            return
+
+        choices = None
+        if self.type in ("select", "rawselect", "checkbox"):
+            choices = self.question_config.get("choices")
+            if callable(choices):
+                choices = choices(answers)
+            else:
+                choices = self.kwargs.get("choices")
+
+        default = self.kwargs.get("default", _MISSING)
+        if callable(self.question_config.get("default")):
+            default = self.question_config["default"](answers)
+
+        answer: Any
+        answered = name in source
+        if self.type == "press_any_key_to_continue":
+            answer = None
+        elif answered:
+            answer = source[name]
+        elif self.type == "checkbox":
+            answer = _default_selection(
+                name, choices, None if default is _MISSING else default
+            )
+            if answer is None:
+                raise ValueError(f"No answer for {name} question")
+        elif default is not _MISSING:
+            answer = default
+            if self.type in ("select", "rawselect") and isinstance(
+                default, (Choice, dict)
+            ):
+                answer = Choice.build(default).value
+        else:
+            raise ValueError(f"No answer for {name} question")
+
+        if self.type == "confirm" and isinstance(answer, str):
+            try:
+                answer = _CONFIRM_ANSWERS[answer.strip().lower()]
+            except KeyError:
+                raise ValueError(
+                    f"Invalid answer for {name} question: {answer!r} is not "
+                    f"yes or no"
+                ) from None
+
+        if self.type == "checkbox" and isinstance(answer, str):
+            answer = [a.strip() for a in answer.split(",") if a.strip()]
+
+        if self.type in ("select", "rawselect", "checkbox"):
+            values = _choice_values(choices)
+            if values is not None:
+                if self.type == "checkbox":
+                    if answered:
+                        # the default selection is made of choice values
+                        answer = [_match_choice(name, a, values) for a in answer]
+                else:
+                    answer = _match_choice(name, answer, values)
+
+        validate = self.kwargs.get("validate")
+        if validate:
+            if self.type == "checkbox":
+                verdict = validate(answer)
+                if verdict is not True:
+                    raise ValueError(
+                        f"Invalid answer for {name} question: "
+                        f"{INVALID_INPUT if verdict is False else verdict}"
+                    )
+            else:
+                validator = build_validator(validate)
+                try:
+                    validator.validate(Document(str(answer)))  # type: ignore[union-attr]
+                except ValidationError as e:
+                    raise ValueError(
+                        f"Invalid answer for {name} question: {e.message}"
+                    ) from e
+
+        self.store_answer(answer, answers)
+
+
+class _OptionPrefetcher:
+    """Evaluates the callable options of upcoming questions ahead of time.
+
+    The callables run in a thread pool while the user answers the current
+    question, each on a snapshot of the answers given so far. A result is
+    only used if the answers the callable looked at did not change since,
+    otherwise (or if it failed) the option is evaluated again as usual.
+    """
+
+    def __init__(self, plans: Sequence[_QuestionPlan]) -> None:
+        self._plans = plans
+        self._prefetches: Dict[
+            Tuple[int, str], Tuple["asyncio.Future[Any]", _TrackedAnswers]
+        ] = {}
+
+    def schedule(self, answers: Dict[str, Any], start: int) -> None:
+        """Evaluate the options of the questions from index ``start`` on.
+
+        Options are not evaluated again while the answers they looked at
+        stay the same, not even if they failed (e.g. looking up an answer
+        not given yet)."""
+        loop = asyncio.get_running_loop()
+
+        for index in range(start, len(self._plans)):
+            for option, func in self._plans[index].option_callables().items():
+                prefetch = self._prefetches.get((index, option))
+                if prefetch is not None:
+                    future, tracked = prefetch
+                    if not future.done():
+                        continue
+                    if not future.cancelled():
+                        future.exception()  # mark a failure as handled
+                        if tracked.is_current(answers):
+                            continue
+
+                tracked = _TrackedAnswers(dict(answers))
+                future = loop.run_in_executor(None, func, tracked)
+                self._prefetches[(index, option)] = (future, tracked)
+
+    async def options(self, index: int, answers: Dict[str, Any]) -> Dict[str, Any]:
+        """The evaluated options of a question, which are valid for ``answers``."""
+        options = {}
+        for option in _CALLABLE_OPTIONS:
+            prefetch = self._prefetches.pop((index, option), None)
+            if prefetch is None:
+                continue
+
+            future, tracked = prefetch
+            try:
+                value = await future
+            except Exception:
+                continue  # evaluated again, raising the error where it used to
+
+            if tracked.is_current(answers):
+                options[option] = value
+        return options
+
+    def close(self) -> None:
+        """Drop all prefetched results and cancel pending evaluations."""
+        for future, _ in self._prefetches.values():
+            if future.done():
+                if not future.cancelled():
+                    future.exception()  # mark a failure as handled
+            else:
+                future.cancel()
+        self._prefetches.clear()
+
+
 def parse_question_config(
     question_config, answers, patch_stdout, true_color, **kwargs: Any
 ) -> Optional[tuple[Question, Callable[[Any], None]]]:
@@ -41,95 +495,232 @@ def parse_question_config(
     Returns:
         A question to be asked and a callable to handle the answer
     """
-    question_config = dict(question_config)
-    # import the question
-    if "type" not in question_config:
-        raise PromptParameterException("type")
-    # every type except 'print' needs a name
-    if "name" not in question_config and question_config["type"] != "print":
-        raise PromptParameterException("name")
-
-    _kwargs = kwargs.copy()
-    _kwargs.update(question_config)
-
-    _type = _kwargs.pop("type")
-    _filter = _kwargs.pop("filter", None)
-    name = _kwargs.pop("name", None) if _type == "print" else _kwargs.pop("name")
-    when = _kwargs.pop("when", None)
-
-    if true_color:
-        _kwargs["color_depth"] = ColorDepth.TRUE_COLOR
-
-    if when:
-        # at least a little sanity check!
-        if callable(question_config["when"]):
-            try:
-                if not question_config["when"](answers):
-                    return None
-            except Exception as exception:
-                raise ValueError(
-                    f"Problem in 'when' check of " f"{name} question: {exception}"
-                ) from exception
-        else:
-            raise ValueError("'when' needs to be function that accepts a dict argument")
+    plan = _QuestionPlan(question_config, true_color, **kwargs)
+    if not plan.is_asked(answers):
+        return None
+
+    plan.prepare()
+    return plan.create(answers)
+
+
+class CompiledPrompt:
+    """A list of questions validated once, which can be asked many times.
+
+    This class should not be invoked directly, instead use :func:`compile`.
+    """
+
+    def __init__(self, plans: Sequence[_QuestionPlan]) -> None:
+        self._plans = plans
+
+    def _questions(
+        self, answers: Dict[str, Any]
+    ) -> Iterator[Tuple[Question, Callable[[Any], None]]]:
+        for plan in self._plans:
+            if not plan.is_asked(answers):
+                continue
+
+            res = plan.create(answers)
+            if res is not None:
+                yield res
+
+    def answer(
+        self,
+        source: Mapping[str, Any],
+        answers: Optional[Mapping[str, Any]] = None,
+    ) -> Dict[str, Any]:
+        """Answer the questions from ``source`` instead of asking them.
+
+        See :func:`~questionary.batch_prompt` for how the questions are
+        answered.
+
+        Args:
+            source: Answers by question name.
+
+            answers: Default answers.
+
+        Returns:
+            Dictionary of question answers.
+
+        Raises:
+            ValueError: A question has no answer or the answer is invalid.
+        """
+        _answers = dict(answers or {})
+
+        for plan in self._plans:
+            if plan.is_asked(_answers):
+                plan.answer(source, _answers)
+
+        return _answers
+
+    def answer_many(
+        self, sources: Iterable[Mapping[str, Any]]
+    ) -> Iterator[Dict[str, Any]]:
+        """Answer the questions once for each answer source.
+
+        The answers are produced one after another, so ``sources`` can be
+        a stream of records too large to be loaded at once (e.g. from
+        :func:`~questionary.iter_answer_records`).
+
+        Args:
+            sources: Answers by question name, one mapping per record.
+
+        Returns:
+            The answers of each record.
+        """
+        for source in sources:
+            yield self.answer(source)
+
+    def unsafe_ask(
+        self,
+        answers: Optional[Mapping[str, Any]] = None,
+        patch_stdout: bool = False,
+    ) -> Dict[str, Any]:
+        """Ask the questions synchronously and return user response.
+
+        Does not catch keyboard interrupts.
+
+        Args:
+            answers: Default answers.
+
+            patch_stdout: Ensure that the prompt renders correctly if other threads
+                          are printing to stdout.
+
+        Returns:
+            Dictionary of question answers.
+        """
+        _answers = dict(answers or {})
+
+        for question, on_answer in self._questions(_answers):
+            on_answer(question.unsafe_ask(patch_stdout))
+
+        return _answers
+
+    async def unsafe_ask_async(
+        self,
+        answers: Optional[Mapping[str, Any]] = None,
+        patch_stdout: bool = False,
+    ) -> Dict[str, Any]:
+        """Ask the questions using asyncio and return user response.
+
+        Does not catch keyboard interrupts.
+
+        Args:
+            answers: Default answers.
+
+            patch_stdout: Ensure that the prompt renders correctly if other threads
+                          are printing to stdout.
+
+        Returns:
+            Dictionary of question answers.
+        """
+        _answers = dict(answers or {})
+
+        for question, on_answer in self._questions(_answers):
+            on_answer(await question.unsafe_ask_async(patch_stdout))
+
+        return _answers
 
-    # handle 'print' type
-    if _type == "print":
+    def ask(
+        self,
+        answers: Optional[Mapping[str, Any]] = None,
+        patch_stdout: bool = False,
+        kbi_msg: str = DEFAULT_KBI_MESSAGE,
+    ) -> Dict[str, Any]:
+        """Ask the questions synchronously and return user response.
+
+        Args:
+            answers: Default answers.
+
+            patch_stdout: Ensure that the prompt renders correctly if other threads
+                          are printing to stdout.
+
+            kbi_msg: The message to be printed on a keyboard interrupt.
+
+        Returns:
+            Dictionary of question answers.
+        """
         try:
-            message = _kwargs.pop("message")
-        except KeyError as e:
-            raise PromptParameterException("message") from e
+            return self.unsafe_ask(answers, patch_stdout)
+        except KeyboardInterrupt:
+            print(kbi_msg)
+            return {}
+
+    async def ask_async(
+        self,
+        answers: Optional[Mapping[str, Any]] = None,
+        patch_stdout: bool = False,
+        kbi_msg: str = DEFAULT_KBI_MESSAGE,
+    ) -> Dict[str, Any]:
+        """Ask the questions using asyncio and return user response.
+
+        Args:
+            answers: Default answers.
+
+            patch_stdout: Ensure that the prompt renders correctly if other threads
+                          are printing to stdout.
+
+            kbi_msg: The message to be printed on a keyboard interrupt.
+
+        Returns:
+            Dictionary of question answers.
+        """
+        try:
+            return await self.unsafe_ask_async(answers, patch_stdout)
+        except KeyboardInterrupt:
+            print(kbi_msg)
+            return {}
 
-        # questions can take 'input' arg but print_formatted_text does not
-        # Remove 'input', if present, to avoid breaking during tests
-        _kwargs.pop("input", None)
 
-        print_formatted_text(message, **_kwargs)
-        if name:
-            answers[name] = None
-        return None
+def compile(
+    questions: Union[Dict[str, Any], Iterable[Mapping[str, Any]]],
+    true_color: bool = False,
+    **kwargs: Any,
+) -> CompiledPrompt:
+    """Validate question configs once, to ask them repeatedly.
+
+    The configs are checked and the question types are resolved when
+    compiling, instead of every time the questions are asked. ``when``,
+    ``filter`` and callable ``choices`` and ``default`` options are still
+    evaluated for every run.
+
+    Example:
+        >>> import questionary
+        >>> questions = questionary.compile(
+        ...     [{"type": "confirm", "name": "again", "message": "Again?"}]
+        ... )
+        >>> while questions.ask().get("again"):
+        ...     pass
 
-    choices = question_config.get("choices")
-    if choices is not None and callable(choices):
-        calculated_choices = choices(answers)
-        question_config["choices"] = calculated_choices
-        _kwargs["choices"] = calculated_choices
+    See :func:`unsafe_prompt` for possible question configurations.
 
-    if _filter:
-        # at least a little sanity check!
-        if not callable(_filter):
-            raise ValueError("'filter' needs to be function that accepts an argument")
+    Args:
+        questions: A list of question configs representing questions to
+                   ask.
 
-    if callable(question_config.get("default")):
-        _kwargs["default"] = question_config["default"](answers)
+        true_color: Use true color output.
 
-    create_question_func = prompt_by_name(_type)
+        kwargs: Additional options passed to every question.
 
-    if not create_question_func:
-        raise ValueError(
-            f"No question type '{_type}' found. "
-            f"Known question types are {', '.join(AVAILABLE_PROMPTS)}."
-        )
+    Returns:
+        :class:`CompiledPrompt`: The compiled questions, ready to be asked
+        (using ``.ask()``).
 
-    missing_args = list(utils.missing_arguments(create_question_func, _kwargs))
-    if missing_args:
-        raise PromptParameterException(missing_args[0])
+    Raises:
+        PromptParameterException: A question misses a required option.
+        ValueError: A question config is invalid.
+    """
 
-    question = create_question_func(**_kwargs)
+    if isinstance(questions, dict):
+        questions = [questions]
 
-    def on_answer(answer):
-        if answer is not None:
-            if _filter:
-                try:
-                    answer = _filter(answer)
-                except Exception as exception:
-                    raise ValueError(
-                        f"Problem processing 'filter' of {name} "
-                        f"question: {exception}"
-                    ) from exception
-            answers[name] = answer
+    plans = [
+        _QuestionPlan(question_config, true_color, **kwargs)
+        for question_config in questions
+    ]
+    for plan in plans:
+        plan.prepare()
 
-    return question, on_answer
+    return CompiledPrompt(plans)
 
 
 async def prompt_async(
@@ -138,6 +729,7 @@ async def prompt_async(
     patch_stdout: bool = False,
     true_color: bool = False,
     kbi_msg: str = DEFAULT_KBI_MESSAGE,
+    prefetch: bool = False,
     **kwargs: Any,
 ) -> Dict[str, Any]:
     """Prompt the user for input on all the questions using asyncio.
@@ -170,6 +762,9 @@ async def prompt_async(
         kbi_msg: The message to be printed on a keyboard interrupt.
         true_color: Use true color output.
 
+        prefetch: Evaluate callable options of the upcoming questions ahead
+                  of time, see :func:`unsafe_prompt_async`.
+
         color_depth: Color depth to use. If ``true_color`` is set to true then this
                      value is ignored.
 
@@ -186,7 +781,7 @@ async def prompt_async(
 
     try:
         return await unsafe_prompt_async(
-            questions, answers, patch_stdout, true_color, **kwargs
+            questions, answers, patch_stdout, true_color, prefetch, **kwargs
         )
     except KeyboardInterrupt:
         print(kbi_msg)
@@ -257,6 +852,7 @@ async def unsafe_prompt_async(
     answers: Optional[Mapping[str, Any]] = None,
     patch_stdout: bool = False,
     true_color: bool = False,
+    prefetch: bool = False,
     **kwargs: Any,
 ) -> Dict[str, Any]:
     """Prompt the user for input on all the questions using asyncio.
@@ -286,6 +882,13 @@ async def unsafe_prompt_async(
 
         true_color: Use true color output.
 
+        prefetch: Evaluate callable ``when``, ``choices`` and ``default``
+                  options of the upcoming questions in a thread pool, while
+                  the user answers the current question. A result is only
+                  used if the answers the callable looked up did not change
+                  in the meantime. The callables have to be safe to run
+                  concurrently and more than once.
+
         color_depth: Color depth to use. If ``true_color`` is set to true then this
                      value is ignored.
 
@@ -308,6 +911,11 @@ async def unsafe_prompt_async(
 
     answers = dict(answers or {})
 
+    if prefetch:
+        return await _unsafe_prompt_async_prefetched(
+            questions, answers, patch_stdout, true_color, **kwargs
+        )
+
     for question_config in questions:
         res = parse_question_config(
             question_config, answers, patch_stdout, true_color, **kwargs
@@ -325,6 +933,44 @@ async def unsafe_prompt_async(
     return answers
 
 
+async def _unsafe_prompt_async_prefetched(
+    questions: Iterable[Mapping[str, Any]],
+    answers: Dict[str, Any],
+    patch_stdout: bool,
+    true_color: bool,
+    **kwargs: Any,
+) -> Dict[str, Any]:
+    plans = [
+        _QuestionPlan(question_config, true_color, **kwargs)
+        for question_config in questions
+    ]
+    prefetcher = _OptionPrefetcher(plans)
+
+    try:
+        prefetcher.schedule(answers, 0)
+
+        for index, plan in enumerate(plans):
+            options = await prefetcher.options(index, answers)
+            if not plan.is_asked(answers, options):
+                continue
+
+            plan.prepare()
+            res = plan.create(answers, options)
+
+            if res is not None:
+                (question, on_answer) = res
+
+                answer = await question.unsafe_ask_async(patch_stdout)
+
+                on_answer(answer)
+
+            prefetcher.schedule(answers, index + 1)
+    finally:
+        prefetcher.close()
+
+    return answers
+
+
 def unsafe_prompt(
     questions: Union[Dict[str, Any], Iterable[Mapping[str, Any]]],
     answers: Optional[Mapping[str, Any]] = None,
@@ -1,29 +1,56 @@
-from questionary.prompts import autocomplete
-from questionary.prompts import checkbox
-from questionary.prompts import confirm
-from questionary.prompts import password
-from questionary.prompts import path
-from questionary.prompts import press_any_key_to_continue
-from questionary.prompts import rawselect
-from questionary.prompts import select
-from questionary.prompts import text
-
-AVAILABLE_PROMPTS = {
-    "autocomplete": autocomplete.autocomplete,
-    "confirm": confirm.confirm,
-    "text": text.text,
-    "select": select.select,
-    "rawselect": rawselect.rawselect,
-    "password": password.password,
-    "checkbox": checkbox.checkbox,
-    "path": path.path,
-    "press_any_key_to_continue": press_any_key_to_continue.press_any_key_to_continue,
+from importlib import import_module
+from typing import Any
+from typing import Callable
+from typing import Dict
+from typing import Iterator
+from typing import Mapping
+from typing import Tuple
+
+# module and function of each prompt, the modules are only imported when a
+# prompt is used for the first time
+_PROMPTS: Dict[str, Tuple[str, str]] = {
+    "autocomplete": ("autocomplete", "autocomplete"),
+    "confirm": ("confirm", "confirm"),
+    "text": ("text", "text"),
+    "select": ("select", "select"),
+    "rawselect": ("rawselect", "rawselect"),
+    "password": ("password", "password"),
+    "checkbox": ("checkbox", "checkbox"),
+    "path": ("path", "path"),
+    "press_any_key_to_continue": (
+        "press_any_key_to_continue",
+        "press_any_key_to_continue",
+    ),
     # backwards compatible names
-    "list": select.select,
-    "rawlist": rawselect.rawselect,
-    "input": text.text,
+    "list": ("select", "select"),
+    "rawlist": ("rawselect", "rawselect"),
+    "input": ("text", "text"),
 }
 
 
+class _PromptRegistry(Mapping[str, Callable[..., Any]]):
+    """Maps the names of the prompts to their functions, importing them lazily."""
+
+    def __getitem__(self, name: str) -> Callable[..., Any]:
+        module_name, function = _PROMPTS[name]
+        return getattr(import_module(f"{__name__}.{module_name}"), function)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(_PROMPTS)
+
+    def __len__(self) -> int:
+        return len(_PROMPTS)
+
+
+AVAILABLE_PROMPTS: Mapping[str, Callable[..., Any]] = _PromptRegistry()
+
+
 def prompt_by_name(name):
     return AVAILABLE_PROMPTS.get(name)
+
+
+def __getattr__(name: str) -> Any:
+    # the prompt modules used to be imported with the package
+    if any(name == module_name for module_name, _ in _PROMPTS.values()):
+        return import_module(f"{__name__}.{name}")
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
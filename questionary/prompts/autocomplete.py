@@ -1,12 +1,22 @@
+import inspect
+from bisect import bisect_left
+from bisect import bisect_right
+from itertools import accumulate
+from itertools import islice
 from typing import Any
+from typing import AsyncIterable
 from typing import Callable
 from typing import Dict
 from typing import Iterable
+from typing import Iterator
 from typing import List
 from typing import Optional
+from typing import Sequence
 from typing import Tuple
 from typing import Union
+from typing import cast
 
+from prompt_toolkit.application.current import get_app
 from prompt_toolkit.completion import CompleteEvent
 from prompt_toolkit.completion import Completer
 from prompt_toolkit.completion import Completion
@@ -17,9 +27,14 @@ from prompt_toolkit.shortcuts.prompt import CompleteStyle
 from prompt_toolkit.shortcuts.prompt import PromptSession
 from prompt_toolkit.styles import Style
 
+from questionary import utils
+from questionary.constants import DEFAULT_COMPLETION_DELAY
 from questionary.constants import DEFAULT_QUESTION_PREFIX
+from questionary.constants import LOADING_CHOICES
+from questionary.prompts.common import DebouncedCompleter
 from questionary.prompts.common import build_validator
 from questionary.question import Question
+from questionary.question import traceable
 from questionary.styles import merge_styles_default
 
 
@@ -99,9 +114,132 @@ class WordCompleter(Completer):
             )
 
 
+class IndexedWordCompleter(WordCompleter):
+    """A :class:`WordCompleter` for long lists of choices.
+
+    Instead of checking every choice on each keystroke, the choices are
+    sorted once: prefix matches are found with a binary search and matches
+    in the middle of a choice by scanning a single string joining all
+    choices, which only needs to run until enough matches are found.
+
+    Completions are created lazily, prefix matches first, and at most
+    ``max_completions`` of them are returned. The index is only rebuilt when
+    the content of the choices changes, so a callable source may return a
+    new list on every call.
+
+    Args:
+        max_completions: Maximum number of completions. Defaults to the
+                         number of rows of the terminal, which is the most
+                         the completion menu can display.
+    """
+
+    # separates the choices in the string scanned for middle matches
+    _SEPARATOR = "\0"
+
+    max_completions: Optional[int]
+
+    def __init__(
+        self,
+        choices: Union[List[str], Callable[[], List[str]]],
+        ignore_case: bool = True,
+        meta_information: Optional[Dict[str, Any]] = None,
+        match_middle: bool = True,
+        max_completions: Optional[int] = None,
+    ) -> None:
+        super().__init__(
+            choices,
+            ignore_case=ignore_case,
+            meta_information=meta_information,
+            match_middle=match_middle,
+        )
+        self.max_completions = max_completions
+
+        self._indexed_choices: Optional[List[str]] = None
+        self._sorted_keys: List[str] = []
+        self._sorted_choices: List[str] = []
+        self._joined_keys = ""
+        self._offsets: List[int] = []
+
+    def _build_index(self, choices: Sequence[str]) -> None:
+        keys = list(map(str.lower, choices)) if self.ignore_case else list(choices)
+        order = sorted(range(len(keys)), key=keys.__getitem__)
+        self._sorted_keys = list(map(keys.__getitem__, order))
+        self._sorted_choices = list(map(choices.__getitem__, order))
+        self._joined_keys = self._SEPARATOR.join(self._sorted_keys)
+        # start of each key in the joined string
+        self._offsets = [0]
+        self._offsets.extend(
+            accumulate(len(key) + len(self._SEPARATOR) for key in self._sorted_keys)
+        )
+
+        # a copy, so that changes of a mutable list are noticed
+        self._indexed_choices = list(choices)
+
+    def _matches(self, word_before_cursor: str) -> Iterator[Tuple[int, int]]:
+        """Sorted position and match index of the matching choices."""
+
+        keys = self._sorted_keys
+
+        first = bisect_left(keys, word_before_cursor)
+        for i in range(first, len(keys)):
+            if not keys[i].startswith(word_before_cursor):
+                break
+            yield i, 0
+
+        if not self.match_middle or not word_before_cursor:
+            return
+
+        joined = self._joined_keys
+        offsets = self._offsets
+        position = joined.find(word_before_cursor)
+        while position != -1:
+            i = bisect_right(offsets, position) - 1
+            if position != offsets[i]:
+                # matches at the start were already found above
+                yield i, position - offsets[i]
+            # only the first match in each choice is of interest
+            position = joined.find(word_before_cursor, offsets[i + 1])
+
+    def get_completions(
+        self, document: Document, complete_event: CompleteEvent
+    ) -> Iterable[Completion]:
+        choices = self._choices()
+        if not isinstance(choices, list):
+            choices = list(choices)
+        # comparing is linear, but much cheaper than sorting the choices again
+        if choices != self._indexed_choices:
+            self._build_index(choices)
+
+        # Get word/text before cursor.
+        word_before_cursor = document.text_before_cursor
+
+        if self.ignore_case:
+            word_before_cursor = word_before_cursor.lower()
+
+        max_completions = self.max_completions
+        if max_completions is None:
+            max_completions = get_app().output.get_size().rows
+
+        for i, index in islice(self._matches(word_before_cursor), max_completions):
+            choice = self._sorted_choices[i]
+
+            display_meta = self.meta_information.get(choice, "")
+            display = self._display_for_choice(choice, index, word_before_cursor)
+
+            yield Completion(
+                choice,
+                start_position=-len(choice),
+                display=display.formatted_text,
+                display_meta=display_meta,
+                style="class:answer",
+                selected_style="class:selected",
+            )
+
+
+@traceable
 def autocomplete(
     message: str,
-    choices: List[str],
+    choices: Union[List[str], Callable[[], AsyncIterable[List[str]]]],
     default: str = "",
     qmark: str = DEFAULT_QUESTION_PREFIX,
     completer: Optional[Completer] = None,
@@ -111,6 +249,9 @@ def autocomplete(
     complete_style: CompleteStyle = CompleteStyle.COLUMN,
     validate: Any = None,
     style: Optional[Style] = None,
+    use_index: bool = False,
+    complete_in_thread: bool = False,
+    completion_delay: float = DEFAULT_COMPLETION_DELAY,
     **kwargs: Any,
 ) -> Question:
     """Prompt the user to enter a message with autocomplete help.
@@ -139,7 +280,12 @@ def autocomplete(
     Args:
         message: Question text
 
-        choices: Items shown in the selection, this contains items as strings
+        choices: Items shown in the selection, this contains items as strings.
+                 Can also be an async generator function yielding batches
+                 (lists) of items. The items are added to the completions
+                 while the user is typing, until all of them have arrived a
+                 loading indicator is shown. Asynchronous choices require
+                 prompt toolkit 3.
 
         default: Default return value (single value).
 
@@ -168,17 +314,47 @@ def autocomplete(
                   This can either be a function accepting the input and
                   returning a boolean, or an class reference to a
                   subclass of the prompt toolkit Validator class.
+                  A coroutine function (e.g. querying a database) runs in
+                  the background while typing, without blocking the input.
 
         style: A custom color and style for the question parts. You can
                configure colors as well as font types for different elements.
 
+        use_index: Index the choices once for faster completions of long lists.
+                   Prefix matches are then shown first, in alphabetical order,
+                   and only as many completions as the terminal has rows.
+                   Ignored if a ``completer`` is given.
+
+        complete_in_thread: Compute the completions in a background thread,
+                            once no text was typed for ``completion_delay``
+                            seconds, so that typing never waits for them.
+                            Useful if the completer (or a ``choices``
+                            callable) is slow.
+
+        completion_delay: Seconds to wait for further input before completing
+                          in the background, only used if
+                          ``complete_in_thread`` is set and with prompt
+                          toolkit 3.
+
     Returns:
         :class:`Question`: Question instance, ready to be prompted (using ``.ask()``).
     """
     merged_style = merge_styles_default([style])
 
+    choices_provider = None
+    if inspect.isasyncgenfunction(choices):
+        if not utils.is_prompt_toolkit_3():
+            raise ValueError("Asynchronous choices require prompt_toolkit 3.")
+        # the completer works on this list, which is filled while prompting
+        choices_provider, choices = choices, []
+    # an asynchronous provider has been replaced by the list it fills
+    words = cast(List[str], choices)
+
     def get_prompt_tokens() -> List[Tuple[str, str]]:
-        return [("class:qmark", qmark), ("class:question", " {} ".format(message))]
+        tokens = [("class:qmark", qmark), ("class:question", " {} ".format(message))]
+        if choices_provider is not None:
+            tokens.append(("class:instruction", "({}) ".format(LOADING_CHOICES)))
+        return tokens
 
     def get_meta_style(meta: Optional[Dict[str, Any]]) -> Optional[Dict[str, Any]]:
         if meta:
@@ -190,16 +366,24 @@ def autocomplete(
     validator = build_validator(validate)
 
     if completer is None:
-        if not choices:
+        if not words and choices_provider is None:
             raise ValueError("No choices is given, you should use Text question.")
         # use the default completer
-        completer = WordCompleter(
-            choices,
+        completer_class = IndexedWordCompleter if use_index else WordCompleter
+        completer = completer_class(
+            words,
             ignore_case=ignore_case,
             meta_information=get_meta_style(meta_information),
             match_middle=match_middle,
         )
 
+    if complete_in_thread:
+        if utils.is_prompt_toolkit_3():
+            completer = DebouncedCompleter(completer, completion_delay)
+        else:
+            # prompt toolkit 2 completes in a thread, but without a delay
+            kwargs["complete_in_thread"] = True
+
     p: PromptSession = PromptSession(
         get_prompt_tokens,
         lexer=SimpleLexer("class:answer"),
@@ -211,4 +395,33 @@ def autocomplete(
     )
     p.default_buffer.reset(Document(default))
 
-    return Question(p.app)
+    if choices_provider is not None:
+        provided_choices = words
+
+        async def load_choices() -> None:
+            nonlocal choices_provider
+            assert choices_provider is not None
+
+            try:
+                async for batch in choices_provider():
+                    provided_choices.extend(batch)
+
+                    # refresh an open completion menu, unless the user is
+                    # already navigating it
+                    complete_state = p.default_buffer.complete_state
+                    if complete_state and complete_state.complete_index is None:
+                        p.default_buffer.start_completion(select_first=False)
+                    get_app().invalidate()
+            finally:
+                choices_provider = None
+                get_app().invalidate()
+
+        def start_loading() -> None:
+            get_app().create_background_task(load_choices())
+
+        p.app.pre_run_callables.append(start_loading)
+
+    def reset() -> None:
+        p.default_buffer.reset(Document(default))
+
+    return Question(p.app, reset=reset)
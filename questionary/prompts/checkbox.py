@@ -1,10 +1,8 @@
-import string
 from typing import Any
 from typing import Callable
 from typing import Dict
 from typing import List
 from typing import Optional
-from typing import Sequence
 from typing import Tuple
 from typing import Union
 
@@ -20,15 +18,22 @@ from questionary.constants import DEFAULT_SELECTED_POINTER
 from questionary.constants import INVALID_INPUT
 from questionary.prompts import common
 from questionary.prompts.common import Choice
+from questionary.prompts.common import ChoicesSource
 from questionary.prompts.common import InquirerControl
 from questionary.prompts.common import Separator
 from questionary.question import Question
+from questionary.question import traceable
 from questionary.styles import merge_styles_default
 
+# Disable the default inverted colours bottom-toolbar behaviour (for the error
+# message). However it can be re-enabled with a custom style.
+NO_REVERSE_BOTTOM_TOOLBAR_STYLE = Style([("bottom-toolbar", "noreverse")])
 
+
+@traceable
 def checkbox(
     message: str,
-    choices: Sequence[Union[str, Choice, Dict[str, Any]]],
+    choices: ChoicesSource,
     default: Optional[str] = None,
     validate: Callable[[List[str]], Union[bool, str]] = lambda a: True,
     qmark: str = DEFAULT_QUESTION_PREFIX,
@@ -40,9 +45,11 @@ def checkbox(
     use_emacs_keys: bool = True,
     use_search_filter: bool = False,
     search_matcher: Optional[Callable[[str, Choice], bool]] = None,
+    use_fuzzy_search: bool = False,
     instruction: Optional[str] = None,
     show_description: bool = True,
     cycle_list: bool = True,
+    virtualize: bool = False,
     **kwargs: Any,
 ) -> Question:
     """Ask the user to select from a list of items.
@@ -74,7 +81,14 @@ def checkbox(
         choices: Items shown in the selection, this can contain :class:`Choice` or
                  or :class:`Separator` objects or simple items as strings. Passing
                  :class:`Choice` objects, allows you to configure the item more
-                 (e.g. preselecting it or disabling it).
+                 (e.g. preselecting it or disabling it). Instead of a sequence,
+                 an iterator, generator or asynchronous iterator can be passed.
+                 It is consumed lazily, only loading the choices needed to
+                 display the list. An async generator function yielding
+                 batches (lists) of choices can be passed as well, the list
+                 is populated while the user is already navigating it.
+                 Asynchronous choices require prompt toolkit 3.
+                 Very long lists are best passed as a :class:`ChoiceTable`.
 
         default: Default return value (single value). If you want to preselect
                  multiple items, use ``Choice("foo", checked=True)`` instead.
@@ -102,7 +116,9 @@ def checkbox(
                         to initially set the pointer position to.
 
         use_arrow_keys: Allow the user to select items from the list using
-                        arrow keys.
+                        arrow keys. `Home`, `End`, `PageUp` and `PageDown`
+                        jump to the first, last, previous or next screen of
+                        items.
 
         use_jk_keys: Allow the user to select items from the list using
                      `j` (down) and `k` (up) keys.
@@ -122,6 +138,13 @@ def checkbox(
                         returns whether the choice matches. Only takes effect
                         when ``use_search_filter`` is enabled.
 
+        use_fuzzy_search: Match choices containing the characters of the search
+                          string in order, instead of the search string itself
+                          (e.g. ``"pza"`` matches ``"Pizza"``). The results are
+                          ranked by how well they match and the matched
+                          characters are highlighted. Only takes effect when
+                          ``use_search_filter`` is enabled.
+
         instruction: A message describing how to navigate the menu.
 
         show_description: Display description of current selection if available.
@@ -130,6 +153,10 @@ def checkbox(
                     When False, cursor stops at the ends and does not wrap around.
                     Default is True.
 
+        virtualize: Only render the choices around the pointer which fit on
+                    the screen, plus indicators for the choices scrolled out
+                    of view. Keeps redrawing fast for very long lists.
+
     Returns:
         :class:`Question`: Question instance, ready to be prompted (using ``.ask()``).
     """
@@ -145,15 +172,10 @@ def checkbox(
             "Cannot use j/k keys with prefix filter search, since j/k can be part of the prefix."
         )
 
-    merged_style = merge_styles_default(
-        [
-            # Disable the default inverted colours bottom-toolbar behaviour (for
-            # the error message). However it can be re-enabled with a custom
-            # style.
-            Style([("bottom-toolbar", "noreverse")]),
-            style,
-        ]
-    )
+    if use_fuzzy_search and search_matcher is not None:
+        raise ValueError("Cannot use a custom search_matcher with fuzzy search.")
+
+    merged_style = merge_styles_default([NO_REVERSE_BOTTOM_TOOLBAR_STYLE, style])
 
     if not callable(validate):
         raise ValueError("validate must be callable")
@@ -165,6 +187,8 @@ def checkbox(
         initial_choice=initial_choice,
         show_description=show_description,
         search_matcher=search_matcher,
+        virtualize=virtualize,
+        use_fuzzy_search=use_fuzzy_search,
     )
 
     def get_prompt_tokens() -> List[Tuple[str, str]]:
@@ -245,6 +269,9 @@ def checkbox(
 
     @bindings.add(" ", eager=True)
     def toggle(_event):
+        if not ic.choices:
+            return  # still waiting for the first asynchronous choice
+
         pointed_choice = ic.get_pointed_at().value
         if pointed_choice in ic.selected_options:
             ic.selected_options.remove(pointed_choice)
@@ -255,6 +282,7 @@ def checkbox(
 
     @bindings.add(Keys.ControlI if use_search_filter else "i", eager=True)
     def invert(_event):
+        ic.load_choices()
         inverted_selection = [
             c.value
             for c in ic.choices
@@ -268,6 +296,7 @@ def checkbox(
 
     @bindings.add(Keys.ControlA if use_search_filter else "a", eager=True)
     def all(_event):
+        ic.load_choices()
         all_selected = True  # all choices have been selected
         for c in ic.choices:
             if (
@@ -279,50 +308,23 @@ def checkbox(
                 ic.selected_options.append(c.value)
                 all_selected = False
         if all_selected:
-            ic.selected_options = []
+            ic.selected_options.clear()
 
         perform_validation(get_selected_values())
 
     def move_cursor_down(event):
-        # Stepping once
-        ic.select_next()
-
-        # If wrap disabled and we wrapped back to the first element, undo it
-        if not cycle_list and ic.get_pointed_at() == ic.choices[0]:
-            ic.select_previous()
-            return
-
-        # Skipping over any separators or disabled items
-        while not ic.is_selection_valid():
-            ic.select_next()
+        ic.select_next_valid(cycle=cycle_list)
 
     def move_cursor_up(event):
-        # Stepping once
-        ic.select_previous()
-
-        # If wrap disabled and we wrapped back to the last element, undo it
-        if not cycle_list and ic.get_pointed_at() == ic.choices[-1]:
-            ic.select_next()
-            return
-
-        # Skipping over any separators or disabled items
-        while not ic.is_selection_valid():
-            ic.select_previous()
+        ic.select_previous_valid(cycle=cycle_list)
 
     if use_search_filter:
-
-        def search_filter(event):
-            ic.add_search_character(event.key_sequence[0].key)
-
-        for character in string.printable:
-            if character in string.whitespace:
-                continue
-            bindings.add(character, eager=True)(search_filter)
-        bindings.add(Keys.Backspace, eager=True)(search_filter)
+        common.add_search_filter_bindings(bindings, ic)
 
     if use_arrow_keys:
         bindings.add(Keys.Down, eager=True)(move_cursor_down)
         bindings.add(Keys.Up, eager=True)(move_cursor_up)
+        common.add_page_bindings(bindings, ic)
 
     if use_jk_keys:
         bindings.add("j", eager=True)(move_cursor_down)
@@ -341,15 +343,18 @@ def checkbox(
             ic.is_answered = True
             event.app.exit(result=selected_values)
 
-    @bindings.add(Keys.Any)
-    def other(_event):
-        """Disallow inserting other text."""
+    if not use_search_filter:
 
-    return Question(
-        Application(
-            layout=layout,
-            key_bindings=bindings,
-            style=merged_style,
-            **utils.used_kwargs(kwargs, Application.__init__),
-        )
+        @bindings.add(Keys.Any)
+        def other(_event):
+            """Disallow inserting other text."""
+
+    app: Application[Any] = Application(
+        layout=layout,
+        key_bindings=bindings,
+        style=merged_style,
+        **utils.used_kwargs(kwargs, Application.__init__),
     )
+    common.load_choices_in_background(app, ic)
+
+    return Question(app, reset=ic.reset)
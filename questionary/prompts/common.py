@@ -1,17 +1,46 @@
+import asyncio
 import inspect
+import re
+import string
+import time
+from bisect import bisect_left
+from concurrent.futures import ThreadPoolExecutor
+from itertools import accumulate
+from itertools import islice
+from typing import AbstractSet
 from typing import Any
+from typing import AsyncGenerator
+from typing import AsyncIterable
+from typing import AsyncIterator
+from typing import Awaitable
 from typing import Callable
 from typing import Dict
+from typing import Iterable
+from typing import Iterator
 from typing import List
+from typing import NamedTuple
 from typing import Optional
 from typing import Sequence
 from typing import Tuple
 from typing import Union
+from typing import cast
+from typing import overload
 
 from prompt_toolkit import PromptSession
+from prompt_toolkit.application import Application
+from prompt_toolkit.application import get_app
+from prompt_toolkit.buffer import Buffer
+from prompt_toolkit.buffer import ValidationState
+from prompt_toolkit.completion import CompleteEvent
+from prompt_toolkit.completion import Completer
+from prompt_toolkit.completion import Completion
+from prompt_toolkit.document import Document
+from prompt_toolkit.eventloop import generator_to_async_generator
 from prompt_toolkit.filters import Always
 from prompt_toolkit.filters import Condition
 from prompt_toolkit.filters import IsDone
+from prompt_toolkit.key_binding import KeyBindings
+from prompt_toolkit.key_binding.key_processor import KeyPressEvent
 from prompt_toolkit.keys import Keys
 from prompt_toolkit.layout import ConditionalContainer
 from prompt_toolkit.layout import FormattedTextControl
@@ -24,11 +53,20 @@ from prompt_toolkit.styles import Style
 from prompt_toolkit.validation import ValidationError
 from prompt_toolkit.validation import Validator
 
+from questionary import utils
+from questionary.constants import DEFAULT_COMPLETION_DELAY
 from questionary.constants import DEFAULT_SELECTED_POINTER
 from questionary.constants import DEFAULT_STYLE
+from questionary.constants import DEFAULT_VALIDATION_DELAY
 from questionary.constants import INDICATOR_SELECTED
 from questionary.constants import INDICATOR_UNSELECTED
 from questionary.constants import INVALID_INPUT
+from questionary.constants import LOADING_CHOICES
+from questionary.constants import MORE_CHOICES_ABOVE
+from questionary.constants import MORE_CHOICES_BELOW
+from questionary.constants import NUMBER_JUMP_TIMEOUT
+from questionary.constants import VALIDATING_INPUT
+from questionary.constants import VIEWPORT_RESERVED_ROWS
 
 # This is a cut-down version of `prompt_toolkit.formatted_text.AnyFormattedText`
 # which does not exist in v2 of prompt_toolkit
@@ -61,6 +99,17 @@ class Choice:
         description: Optional description of the item that can be displayed.
     """
 
+    # no instance dictionary, long lists create many choices
+    __slots__ = (
+        "title",
+        "value",
+        "disabled",
+        "checked",
+        "description",
+        "__shortcut_key",
+        "__auto_shortcut",
+    )
+
     title: FormattedText
     """Display string for the choice"""
 
@@ -182,6 +231,8 @@ class Choice:
 class Separator(Choice):
     """Used to space/separate choices group."""
 
+    __slots__ = ("line",)
+
     default_separator: str = "-" * 15
     """The default separator used if none is specified"""
 
@@ -199,6 +250,494 @@ class Separator(Choice):
         super().__init__(self.line, None, "-")
 
 
+class ChoiceTable(Sequence[Choice]):
+    """A long list of choices, stored column by column.
+
+    Instead of a :class:`Choice` object per choice, the table only keeps a
+    list per attribute. The :class:`Choice` of a row is created when it is
+    accessed (e.g. to render it) and can be discarded afterwards, which
+    saves a lot of memory for lists with hundreds of thousands of choices.
+
+    A table can be passed as ``choices`` to :meth:`select` and
+    :meth:`checkbox`. Separators, preselected choices and shortcuts are not
+    supported.
+
+    Example:
+        >>> import questionary
+        >>> table = questionary.ChoiceTable(
+        ...     titles=["Pizza", "Pasta", "Salad"],
+        ...     values=["pizza", "pasta", "salad"],
+        ...     disabled=[None, "sold out", None],
+        ... )
+        >>> table[1].title
+        'Pasta'
+
+    Args:
+        titles: Text shown for each choice in the selection list.
+
+        values: Value returned for each choice, when it is selected. If
+                unset, the titles are used.
+
+        disabled: For each choice, whether it can not be selected (see
+                  ``disabled`` of :class:`Choice`). If unset, all choices can
+                  be selected.
+
+        descriptions: Optional description of each choice.
+    """
+
+    __slots__ = ("titles", "values", "disabled", "descriptions")
+
+    titles: Sequence[FormattedText]
+    values: Sequence[Any]
+    disabled: Optional[Sequence[Optional[Union[str, bool]]]]
+    descriptions: Optional[Sequence[Optional[str]]]
+
+    def __init__(
+        self,
+        titles: Sequence[FormattedText],
+        values: Optional[Sequence[Any]] = None,
+        disabled: Optional[Sequence[Optional[Union[str, bool]]]] = None,
+        descriptions: Optional[Sequence[Optional[str]]] = None,
+    ) -> None:
+        for name, column in (
+            ("values", values),
+            ("disabled", disabled),
+            ("descriptions", descriptions),
+        ):
+            if column is not None and len(column) != len(titles):
+                raise ValueError(
+                    f"A ChoiceTable needs as many {name} as titles, "
+                    f"got {len(column)} {name} for {len(titles)} titles."
+                )
+
+        self.titles = titles
+        # the columns are shared, not copied
+        self.values = values if values is not None else titles
+        self.disabled = disabled
+        self.descriptions = descriptions
+
+    def __len__(self) -> int:
+        return len(self.titles)
+
+    @overload
+    def __getitem__(self, index: int) -> Choice:
+        ...
+
+    @overload
+    def __getitem__(self, index: slice) -> "ChoiceTable":
+        ...
+
+    def __getitem__(self, index: Union[int, slice]) -> Union[Choice, "ChoiceTable"]:
+        if isinstance(index, slice):
+            return ChoiceTable(
+                self.titles[index],
+                self.values[index],
+                self.disabled[index] if self.disabled is not None else None,
+                self.descriptions[index] if self.descriptions is not None else None,
+            )
+
+        return Choice(
+            self.titles[index],
+            self.values[index],
+            disabled=self.disabled[index] if self.disabled is not None else None,
+            shortcut_key=False,
+            description=(
+                self.descriptions[index] if self.descriptions is not None else None
+            ),
+        )
+
+    def is_disabled(self, index: int) -> bool:
+        """Whether the choice in row ``index`` can not be selected."""
+        return self.disabled is not None and bool(self.disabled[index])
+
+    def __repr__(self) -> str:
+        return "ChoiceTable({} choices)".format(len(self))
+
+
+def _is_selectable_row(choices: Sequence[Choice], index: int) -> bool:
+    if isinstance(choices, ChoiceTable):
+        # without creating the choice of the row
+        return not choices.is_disabled(index)
+    return _is_selectable(choices[index])
+
+
+# Choices are either given as a sequence, as an (asynchronous) iterable, which is
+# consumed lazily while the prompt is shown, or as an async generator function
+# yielding batches of choices
+ChoicesSource = Union[
+    Sequence[Union[str, Choice, Dict[str, Any]]],
+    Iterable[Union[str, Choice, Dict[str, Any]]],
+    AsyncIterable[Union[str, Choice, Dict[str, Any]]],
+    Callable[[], AsyncIterable[Iterable[Union[str, Choice, Dict[str, Any]]]]],
+]
+
+
+async def _single_choice_batches(
+    choices: AsyncIterable[Union[str, Choice, Dict[str, Any]]],
+) -> AsyncIterator[List[Union[str, Choice, Dict[str, Any]]]]:
+    async for c in choices:
+        yield [c]
+
+
+class FuzzySearchIndex:
+    """Index over the titles of a choice list for fuzzy searching.
+
+    A title matches a search string if it contains all of its characters in
+    order (e.g. ``"qst"`` matches ``"questionary"``), ignoring the case.
+    Titles are lower-cased once when they are added and joined into a single
+    text with one title per line, a search then runs in the regular
+    expression engine instead of looping over the titles in Python.
+
+    Args:
+        texts: Titles of the choices, in the order of the choices.
+    """
+
+    def __init__(self, texts: Iterable[str] = ()) -> None:
+        self._texts: List[str] = []
+        # the titles joined so far and the offset of each of them in it
+        self._joined = ""
+        self._line_starts: List[int] = []
+        self.extend(texts)
+
+    def __len__(self) -> int:
+        return len(self._texts)
+
+    def add(self, text: str) -> None:
+        """Add the title of the next choice to the index.
+
+        The title is only joined to the others on the next search, so adding
+        many titles one by one does not copy the joined text each time."""
+        self._texts.append(text.lower().replace("\n", " "))
+
+    def extend(self, texts: Iterable[str]) -> None:
+        """Add the titles of the next choices to the index."""
+        self._texts.extend(text.lower().replace("\n", " ") for text in texts)
+        self._join()
+
+    def _join(self) -> None:
+        """Append the titles added since the last search to the joined text."""
+        joined_count = len(self._line_starts)
+        added = self._texts[joined_count:]
+        if not added:
+            return
+
+        self._line_starts.extend(
+            accumulate(
+                (len(text) + 1 for text in added[:-1]), initial=len(self._joined)
+            )
+        )
+        self._joined += "\n".join(added) + "\n"
+
+    @staticmethod
+    def match_positions(search: str, text: str) -> Optional[List[int]]:
+        """Positions of the characters of ``search`` in ``text``.
+
+        A substring match is preferred, otherwise each character is matched
+        at its first occurrence after the previous one."""
+
+        search = search.lower()
+        text = text.lower()
+
+        start = text.find(search)
+        if start != -1:
+            return list(range(start, start + len(search)))
+
+        positions = []
+        position = -1
+        for char in search:
+            position = text.find(char, position + 1)
+            if position == -1:
+                return None
+            positions.append(position)
+        return positions
+
+    def search(
+        self,
+        search: str,
+        candidates: Optional[Sequence[int]] = None,
+        limit: Optional[int] = None,
+    ) -> List[int]:
+        """Find the titles matching ``search``.
+
+        Titles containing the search string come first, ordered by where it
+        starts (so prefix matches are ranked highest). They are followed by
+        the titles only containing the characters in order, the ones with the
+        characters closest together first. Equally ranked titles keep the
+        order of the choices.
+
+        Args:
+            search: The search string.
+
+            candidates: Only consider the titles with these indices (e.g. the
+                        result of a search for a prefix of ``search``).
+
+            limit: Stop once the best ``limit`` matches are known (e.g. a
+                   short search string often has enough prefix matches) and
+                   only return these. All matches are returned if every title
+                   had to be looked at anyway.
+
+        Returns:
+            Indices of the matching titles, best matches first.
+        """
+
+        search = search.lower()
+        # the characters of the search string in order, on a single line,
+        # each one at its first occurrence after the previous one
+        pattern = re.compile(
+            re.escape(search[:1])
+            + "".join(f"[^\n{c}]*{c}" for c in map(re.escape, search[1:]))
+        )
+
+        if candidates is not None and len(candidates) * 8 < len(self._texts):
+            # few candidates (e.g. after narrowing down a search), search them
+            # one by one, in the order of the titles
+            starts: Dict[int, int] = {}
+            spans: Dict[int, int] = {}
+            for i in sorted(candidates):
+                text = self._texts[i]
+                start = text.find(search)
+                if start != -1:
+                    starts[i] = start
+                elif len(search) > 1:
+                    match = pattern.search(text)
+                    if match is not None:
+                        spans[i] = match.end() - match.start()
+            return _ranked(starts, spans)
+
+        allowed = set(candidates) if candidates is not None else None
+        return self._search_joined(search, pattern, allowed, limit)
+
+    def _search_joined(
+        self,
+        search: str,
+        pattern: "re.Pattern[str]",
+        allowed: Optional[AbstractSet[int]],
+        limit: Optional[int],
+    ) -> List[int]:
+        """Search all titles at once, in the joined text.
+
+        Prefix matches are looked for first, if there are ``limit`` of them
+        the search is done. Otherwise the titles containing the search string
+        are found, the regular expression then only runs on the lines between
+        them."""
+
+        self._join()
+        joined = self._joined
+        line_starts = self._line_starts
+        count = len(line_starts)
+
+        if limit is not None:
+            prefix_matches = list(islice(self._prefix_matches(search, allowed), limit))
+            if len(prefix_matches) == limit:
+                return prefix_matches
+
+        def line_end(line: int) -> int:
+            # where the next line starts
+            return line_starts[line + 1] if line + 1 < count else len(joined)
+
+        # both map the index of a matching title to its rank, in the order of
+        # the titles, so sorting by rank keeps that order for equal ranks
+        starts: Dict[int, int] = {}
+        spans: Dict[int, int] = {}
+
+        contained = []
+        line = 0
+        position = 0
+        while True:
+            start = joined.find(search, position)
+            if start == -1:
+                break
+            line += joined.count("\n", position, start)
+            if allowed is None or line in allowed:
+                starts[line] = start - line_starts[line]
+            contained.append(line)
+            position = line_end(line)
+            line += 1
+
+        if len(search) < 2:
+            return _ranked(starts, spans)
+        if limit is not None and len(starts) >= limit:
+            # the titles only containing the characters rank lower
+            return _ranked(starts, spans)[:limit]
+
+        # the gaps between the lines containing the search string
+        gap_starts = [0] + [line + 1 for line in contained]
+        gap_ends = [line_starts[line] for line in contained] + [len(joined)]
+        for line, end in zip(gap_starts, gap_ends):
+            if line >= count:
+                break
+            position = line_starts[line]
+            while True:
+                match = pattern.search(joined, position, end)
+                if match is None:
+                    break
+                line += joined.count("\n", position, match.start())
+                if allowed is None or line in allowed:
+                    spans[line] = match.end() - match.start()
+                position = line_end(line)
+                line += 1
+
+        return _ranked(starts, spans)
+
+    def _prefix_matches(
+        self, search: str, allowed: Optional[AbstractSet[int]]
+    ) -> Iterator[int]:
+        """Indices of the titles starting with ``search``, in their order."""
+
+        joined = self._joined
+        if joined.startswith(search) and (allowed is None or 0 in allowed):
+            yield 0
+
+        needle = "\n" + search
+        position = joined.find(needle)
+        while position != -1:
+            line = bisect_left(self._line_starts, position + 1)
+            if allowed is None or line in allowed:
+                yield line
+            position = joined.find(needle, position + 1)
+
+
+def _ranked(starts: Dict[int, int], spans: Dict[int, int]) -> List[int]:
+    """Titles containing the search string, then the other matches."""
+    return sorted(starts, key=starts.__getitem__) + sorted(spans, key=spans.__getitem__)
+
+
+class _SearchResult(NamedTuple):
+    search_filter: str
+    choices: List[Choice]
+    # the indices of the matching choices (set for fuzzy searches and searches
+    # of a table) and, for fuzzy searches only, the matched title positions,
+    # computed once a choice is displayed (by id)
+    indices: Optional[List[int]] = None
+    positions: Optional[Dict[int, Optional[List[int]]]] = None
+    # false if a fuzzy search only ranked the best matches so far
+    complete: bool = True
+
+
+def _highlight_positions(
+    style: str, text: str, positions: List[int]
+) -> List[Tuple[str, str]]:
+    """Split ``text`` into fragments, marking the characters at ``positions``."""
+
+    fragments = []
+    matched = set(positions)
+    start = 0
+    for i in range(1, len(text) + 1):
+        if i == len(text) or (i in matched) != (start in matched):
+            fragment_style = (
+                style + " class:search_match" if start in matched else style
+            )
+            fragments.append((fragment_style, text[start:i]))
+            start = i
+    return fragments
+
+
+class _UnhashableValue:
+    """Wrapper to store an unhashable choice value in a :class:`SelectedOptions`.
+
+    All wrapped values share one hash, so lookups fall back to comparing them
+    with ``==`` (the same way a :obj:`list` does)."""
+
+    __slots__ = ("value",)
+
+    def __init__(self, value: Any) -> None:
+        self.value = value
+
+    def __hash__(self) -> int:
+        return 0
+
+    def __eq__(self, other: object) -> bool:
+        return isinstance(other, _UnhashableValue) and self.value == other.value
+
+
+def _is_selectable(choice: Choice) -> bool:
+    return not isinstance(choice, Separator) and not choice.disabled
+
+
+class _SkipTable:
+    """Index of the next and the previous selectable choice of each choice.
+
+    Moving the pointer over long runs of separators and disabled choices
+    takes constant time. The table is extended as choices are appended to
+    the list, ``-1`` marks that there is no such choice."""
+
+    def __init__(self, choices: Sequence[Choice]) -> None:
+        self.choices = choices
+        self.next: List[int] = []
+        self.previous: List[int] = []
+        self.first = -1
+        self.last = -1
+        self.update()
+
+    def update(self) -> None:
+        """Add the choices appended to the list since the last update."""
+        for i in range(len(self.next), len(self.choices)):
+            self.previous.append(self.last)
+            self.next.append(-1)
+            if not _is_selectable_row(self.choices, i):
+                continue
+
+            # every index since the last selectable choice is waiting for
+            # this one, so each entry is only set once
+            for j in range(max(self.last, 0), i):
+                self.next[j] = i
+            if self.first == -1:
+                self.first = i
+            self.last = i
+
+
+class SelectedOptions:
+    """Values of the selected choices, in the order they got selected.
+
+    Behaves like the :obj:`list` used before, but membership checks, adding
+    and removing values are backed by a :obj:`dict` and therefore take
+    constant time for hashable values."""
+
+    def __init__(self, values: Iterable[Any] = ()) -> None:
+        self._values: Dict[Any, Any] = {}
+        for value in values:
+            self.append(value)
+
+    @staticmethod
+    def _key(value: Any) -> Any:
+        try:
+            hash(value)
+        except TypeError:
+            return _UnhashableValue(value)
+        return value
+
+    def append(self, value: Any) -> None:
+        """Select ``value``, does nothing if it is already selected."""
+        self._values.setdefault(self._key(value), value)
+
+    def remove(self, value: Any) -> None:
+        """Deselect ``value``, raises a :obj:`ValueError` if it isn't selected."""
+        try:
+            del self._values[self._key(value)]
+        except KeyError:
+            raise ValueError(f"{value!r} is not selected") from None
+
+    def clear(self) -> None:
+        self._values.clear()
+
+    def __contains__(self, value: Any) -> bool:
+        return self._key(value) in self._values
+
+    def __iter__(self) -> Iterator[Any]:
+        return iter(self._values.values())
+
+    def __len__(self) -> int:
+        return len(self._values)
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, (SelectedOptions, list)):
+            return list(self) == list(other)
+        return NotImplemented
+
+    def __repr__(self) -> str:
+        return "SelectedOptions({!r})".format(list(self))
+
+
 class InquirerControl(FormattedTextControl):
     SHORTCUT_KEYS = [
         "1",
@@ -241,7 +780,6 @@ class InquirerControl(FormattedTextControl):
 
     choices: List[Choice]
     default: Optional[Union[str, Choice, Dict[str, Any]]]
-    selected_options: List[Any]
     search_filter: Union[str, None] = None
     use_indicator: bool
     use_shortcuts: bool
@@ -250,10 +788,13 @@ class InquirerControl(FormattedTextControl):
     pointed_at: int
     is_answered: bool
     show_description: bool
+    virtualize: bool
+    shortcut_page_size: Optional[int]
+    use_number_jump: bool
 
     def __init__(
         self,
-        choices: Sequence[Union[str, Choice, Dict[str, Any]]],
+        choices: ChoicesSource,
         default: Optional[Union[str, Choice, Dict[str, Any]]] = None,
         pointer: Optional[str] = DEFAULT_SELECTED_POINTER,
         use_indicator: bool = True,
@@ -263,6 +804,10 @@ class InquirerControl(FormattedTextControl):
         use_arrow_keys: bool = True,
         initial_choice: Optional[Union[str, Choice, Dict[str, Any]]] = None,
         search_matcher: Optional[Callable[[str, Choice], bool]] = None,
+        virtualize: bool = False,
+        use_fuzzy_search: bool = False,
+        shortcut_page_size: Optional[int] = None,
+        use_number_jump: bool = False,
         **kwargs: Any,
     ):
         self.use_indicator = use_indicator
@@ -272,18 +817,69 @@ class InquirerControl(FormattedTextControl):
         self.use_arrow_keys = use_arrow_keys
         self.default = default
         self.pointer = pointer
+        self.virtualize = virtualize
+        self.shortcut_page_size = shortcut_page_size
+        self._viewport_start = 0
+        self._shortcut_tables: List[Dict[str, int]] = []
+        self.use_number_jump = use_number_jump
+        # index of the choice with number n + 1, and number of each choice index
+        self._number_index: List[int] = []
+        self._choice_numbers: Dict[int, int] = {}
+        self._typed_number = ""
+        self._last_digit_time = 0.0
 
         if isinstance(default, Choice):
             default = default.value
 
-        choices_values = [
-            choice.value for choice in choices if isinstance(choice, Choice)
-        ]
+        self._choice_source: Optional[Iterator[Union[str, Choice, Dict[str, Any]]]]
+        self._choice_source = None
+        self._async_choice_batches: Optional[
+            AsyncIterable[Iterable[Union[str, Choice, Dict[str, Any]]]]
+        ] = None
+
+        if inspect.isasyncgenfunction(choices) or isinstance(choices, AsyncIterable):
+            if initial_choice is not None:
+                raise ValueError(
+                    "An `initial_choice` can not be used with asynchronous choices."
+                )
+            if not utils.is_prompt_toolkit_3():
+                raise ValueError("Asynchronous choices require prompt_toolkit 3.")
+            if inspect.isasyncgenfunction(choices):
+                # a provider yielding batches of choices
+                self._async_choice_batches = choices()
+            else:
+                self._async_choice_batches = _single_choice_batches(
+                    cast(AsyncIterable[Union[str, Choice, Dict[str, Any]]], choices)
+                )
+            choices = []
+        elif not isinstance(choices, Sequence):
+            # only pull as many choices as needed to validate the default
+            # values, the rest is loaded once it needs to be displayed
+            # asynchronous sources are handled above, what is left is iterable
+            self._choice_source = iter(
+                cast(Iterable[Union[str, Choice, Dict[str, Any]]], choices)
+            )
+            choices = []
+            for wanted in (default, initial_choice):
+                if wanted is not None:
+                    self._prefetch_until(choices, wanted)
+
+        if not self.all_choices_loaded:
+            # lazily loaded choices can only be rendered one screen at a time
+            self.virtualize = True
+
+        choices_values: Sequence[Any]
+        if isinstance(choices, ChoiceTable):
+            choices_values = choices.values
+        else:
+            choices_values = [
+                choice.value for choice in choices if isinstance(choice, Choice)
+            ]
 
         if (
             default is not None
-            and default not in choices
             and default not in choices_values
+            and default not in choices
         ):
             raise ValueError(
                 f"Invalid `default` value passed. The value (`{default}`) "
@@ -293,6 +889,8 @@ class InquirerControl(FormattedTextControl):
 
         if initial_choice is None:
             pointed_at = None
+        elif isinstance(choices, ChoiceTable) and initial_choice in choices_values:
+            pointed_at = choices_values.index(initial_choice)
         elif initial_choice in choices:
             pointed_at = choices.index(initial_choice)
         elif initial_choice in choices_values:
@@ -317,18 +915,63 @@ class InquirerControl(FormattedTextControl):
         self.selected_options = []
         self.found_in_search = False
         self.search_matcher = search_matcher
+        self.use_fuzzy_search = use_fuzzy_search
+        self._fuzzy_index: Optional[FuzzySearchIndex] = None
+        self._filter_cache: List[_SearchResult] = []
+        self._skip_table: Optional[_SkipTable] = None
 
+        self._initial_pointed_at = pointed_at
         self._init_choices(choices, pointed_at)
+        if use_fuzzy_search:
+            # built once, choices loaded later on are added to it
+            self._fuzzy_index = FuzzySearchIndex(self._choice_search_texts())
+        while not self._pointer_placed and self._choice_source is not None:
+            self.load_choices(len(self.choices) + 1)
         self._assign_shortcut_keys()
+        if use_number_jump:
+            self._number_choices()
 
         super().__init__(self._get_choice_tokens, **kwargs)
 
-        if not self.is_selection_valid():
+        if self.choices and not self.is_selection_valid():
             raise ValueError(
                 f"Invalid 'initial_choice' value ('{initial_choice}'). "
                 f"It must be a selectable value."
             )
 
+    def reset(self) -> None:
+        """Restore the state from before the question was asked.
+
+        Allows to ask a question again: the pointer and selection are set
+        back to their defaults and the search filter is cleared."""
+
+        self.is_answered = False
+        self.submission_attempted = False
+        self.error_message = None
+        self.search_filter = None
+        self.found_in_search = False
+        self._reset_filter_cache()
+        self._viewport_start = 0
+        self._typed_number = ""
+
+        self.selected_options = self._get_initial_selection()
+        if self._initial_pointed_at is not None:
+            self.pointed_at = self._initial_pointed_at
+        else:
+            self.pointed_at = next(
+                (i for i in range(len(self.choices)) if not self._is_disabled_row(i)),
+                0,
+            )
+
+    @property
+    def selected_options(self) -> SelectedOptions:
+        """Values of the selected choices."""
+        return self._selected_options
+
+    @selected_options.setter
+    def selected_options(self, values: Iterable[Any]) -> None:
+        self._selected_options = SelectedOptions(values)
+
     def _is_selected(self, choice: Choice):
         if isinstance(self.default, Choice):
             compare_default = self.default == choice
@@ -336,11 +979,43 @@ class InquirerControl(FormattedTextControl):
             compare_default = self.default == choice.value
         return choice.checked or compare_default and self.default is not None
 
+    def _get_initial_selection(self) -> List[Any]:
+        if isinstance(self.choices, ChoiceTable):
+            # rows of a table are never checked, only the default is selected
+            if self.default is None or isinstance(self.default, Choice):
+                return []
+            return [v for v in self.choices.values if v == self.default]
+        return [c.value for c in self.choices if self._is_selected(c)]
+
+    def _is_disabled_row(self, index: int) -> bool:
+        if isinstance(self.choices, ChoiceTable):
+            return self.choices.is_disabled(index)
+        return bool(self.choices[index].disabled)
+
     def _assign_shortcut_keys(self):
+        if isinstance(self.choices, ChoiceTable):
+            # shortcuts can not be stored on the rows of a table
+            self._shortcut_tables = []
+            return
+
+        # every page has its own set of shortcuts, without paging all choices
+        # are on a single page
+        page_size = self.shortcut_page_size or max(len(self.choices), 1)
+        self._shortcut_tables = [
+            self._assign_page_shortcut_keys(start, start + page_size)
+            for start in range(0, len(self.choices), page_size)
+        ]
+
+    def _assign_page_shortcut_keys(self, start: int, end: int) -> Dict[str, int]:
+        """Assign the shortcuts of the choices between ``start`` and ``end``.
+
+        Returns the index of the choice selected by each shortcut key."""
+
+        page = self.choices[start:end]
         available_shortcuts = self.SHORTCUT_KEYS[:]
 
         # first, make sure we do not double assign a shortcut
-        for c in self.choices:
+        for c in page:
             if c.shortcut_key is not None:
                 if c.shortcut_key in available_shortcuts:
                     available_shortcuts.remove(c.shortcut_key)
@@ -354,7 +1029,7 @@ class InquirerControl(FormattedTextControl):
                     )
 
         shortcut_idx = 0
-        for c in self.choices:
+        for c in page:
             if c.auto_shortcut and not c.disabled:
                 c.shortcut_key = available_shortcuts[shortcut_idx]
                 shortcut_idx += 1
@@ -362,6 +1037,46 @@ class InquirerControl(FormattedTextControl):
             if shortcut_idx == len(available_shortcuts):
                 break  # fail gracefully if we run out of shortcuts
 
+        return {
+            c.shortcut_key: start + i
+            for i, c in enumerate(page)
+            if isinstance(c.shortcut_key, str) and not c.disabled
+        }
+
+    @property
+    def shortcut_page(self) -> int:
+        """Index of the page of shortcuts the pointer is on."""
+        if not self.shortcut_page_size:
+            return 0
+        return self.pointed_at // self.shortcut_page_size
+
+    @property
+    def shortcut_page_count(self) -> int:
+        return len(self._shortcut_tables)
+
+    def get_shortcut_index(self, key: str) -> Optional[int]:
+        """Index of the choice selected by a shortcut key on the current page."""
+        if self.shortcut_page >= len(self._shortcut_tables):
+            return None
+        return self._shortcut_tables[self.shortcut_page].get(key)
+
+    def select_page(self, offset: int) -> None:
+        """Move the pointer ``offset`` pages of shortcuts forward (or back).
+
+        The pointer is placed on the first selectable choice of the page,
+        pages without selectable choices are skipped."""
+
+        if not self.shortcut_page_size or not self._shortcut_tables:
+            return
+
+        page = self.shortcut_page
+        for _ in range(self.shortcut_page_count):
+            page = (page + offset) % self.shortcut_page_count
+            table = self._shortcut_tables[page]
+            if table:
+                self.pointed_at = min(table.values())
+                return
+
     def _init_choices(
         self,
         choices: Sequence[Union[str, Choice, Dict[str, Any]]],
@@ -369,39 +1084,277 @@ class InquirerControl(FormattedTextControl):
     ):
         # helper to convert from question format to internal format
         self.choices = []
+        self.pointed_at = pointed_at if pointed_at is not None else 0
+        self._pointer_placed = pointed_at is not None
+
+        if isinstance(choices, ChoiceTable):
+            # used as is, the choices of its rows are created on access
+            self.choices = choices  # type: ignore[assignment]
+            self.selected_options = self._get_initial_selection()
+            if not self._pointer_placed:
+                self.pointed_at = next(
+                    (i for i in range(len(choices)) if not choices.is_disabled(i)), 0
+                )
+                self._pointer_placed = True
+            return
+
+        for c in choices:
+            self._append_choice(c)
 
-        if pointed_at is not None:
-            self.pointed_at = pointed_at
+    def _append_choice(self, c: Union[str, Choice, Dict[str, Any]]) -> None:
+        choice = Choice.build(c)
 
-        for i, c in enumerate(choices):
-            choice = Choice.build(c)
+        if self._is_selected(choice):
+            self.selected_options.append(choice.value)
 
-            if self._is_selected(choice):
-                self.selected_options.append(choice.value)
+        if not self._pointer_placed and not choice.disabled:
+            # find the first (available) choice
+            self.pointed_at = len(self.choices)
+            self._pointer_placed = True
 
-            if pointed_at is None and not choice.disabled:
-                # find the first (available) choice
-                self.pointed_at = pointed_at = i
+        if self._fuzzy_index is not None:
+            self._fuzzy_index.add(self._choice_search_text(choice))
 
-            self.choices.append(choice)
+        self.choices.append(choice)
+
+    def _prefetch_until(
+        self, choices: List[Union[str, Choice, Dict[str, Any]]], wanted: Any
+    ) -> None:
+        """Pull choices from the lazy source into ``choices`` until one of
+        them matches ``wanted`` (or the source is exhausted)."""
+
+        if wanted in choices or any(
+            isinstance(c, Choice) and c.value == wanted for c in choices
+        ):
+            return
+
+        assert self._choice_source is not None
+        for c in self._choice_source:
+            choices.append(c)
+            if c == wanted or isinstance(c, Choice) and c.value == wanted:
+                return
+
+        self._choice_source = None
 
     @property
-    def filtered_choices(self):
-        def case_insensitive(search_filter: str, choice: Choice) -> bool:
-            if isinstance(choice.title, str):
-                text = choice.title
-            elif isinstance(choice.title, list):
-                text = "".join(fragment[1] for fragment in choice.title)
-            else:
-                text = ""
+    def all_choices_loaded(self) -> bool:
+        """Whether all choices of a lazy choice source have been loaded."""
+        return self._choice_source is None and self._async_choice_batches is None
+
+    @property
+    def is_loading(self) -> bool:
+        """Whether choices are still arriving from an asynchronous source."""
+        return self._async_choice_batches is not None
+
+    def load_choices(self, count: Optional[int] = None) -> None:
+        """Pull choices from a lazy choice source.
+
+        Args:
+            count: Load choices until at least this many are available. If
+                   ``None``, the source is consumed completely.
+        """
+
+        if self._choice_source is None:
+            return
+
+        loaded = len(self.choices)
+        while count is None or len(self.choices) < count:
+            try:
+                c = next(self._choice_source)
+            except StopIteration:
+                self._choice_source = None
+                break
+            self._append_choice(c)
+
+        if len(self.choices) != loaded:
+            self._reset_filter_cache()
+
+    async def load_choices_async(self) -> None:
+        """Consume an asynchronous choice source, adding the choices to the
+        list as they arrive.
+
+        The list is only redrawn if the new choices can show up on the
+        screen, once loading is done the loading indicator is removed."""
+
+        if self._async_choice_batches is None:
+            return
+
+        try:
+            async for batch in self._async_choice_batches:
+                loaded = len(self.choices)
+                for c in batch:
+                    self._append_choice(c)
+                self._reset_filter_cache()
+
+                if self.search_filter or not self.virtualize:
+                    get_app().invalidate()
+                elif loaded <= self._viewport_start + self._get_viewport_height():
+                    get_app().invalidate()
+        finally:
+            self._async_choice_batches = None
+            get_app().invalidate()
+
+    @staticmethod
+    def _title_search_text(title: FormattedText) -> str:
+        if isinstance(title, str):
+            return title
+        elif isinstance(title, list):
+            return "".join(fragment[1] for fragment in title)
+        else:
+            return ""
+
+    @staticmethod
+    def _choice_search_text(choice: Choice) -> str:
+        return InquirerControl._title_search_text(choice.title)
+
+    def _choice_search_texts(self) -> Iterable[str]:
+        if isinstance(self.choices, ChoiceTable):
+            # straight from the titles column, without creating the choices
+            return map(self._title_search_text, self.choices.titles)
+        return map(self._choice_search_text, self.choices)
+
+    def _filter_choices(
+        self, search_filter: str, count: Optional[int] = None
+    ) -> _SearchResult:
+        """Return all choices matching ``search_filter``.
+
+        Results are cached on a stack of increasingly longer search strings
+        (each entry is a prefix of the one above it). Typing narrows the
+        result of the longest cached prefix instead of rescanning all choices
+        and removing characters pops back to an earlier cached result.
+
+        A fuzzy search only ranks the best matches, as many as fit on the
+        screen, more of them are ranked once the pointer moves on.
+
+        Args:
+            search_filter: The search string.
+
+            count: Number of matches a fuzzy search has to rank at least.
+                   Defaults to the matches shown on the screen.
+        """
+
+        stack = self._filter_cache
+        while stack and not search_filter.startswith(stack[-1].search_filter):
+            stack.pop()
+
+        ranked = 0
+        if stack and stack[-1].search_filter == search_filter:
+            result = stack[-1]
+            if result.complete:
+                return result
+            if count is None:
+                count = self._get_match_count()
+            if len(result.choices) >= count:
+                return result
+            ranked = len(stack.pop().choices)
+
+        if self.use_fuzzy_search:
+            assert self._fuzzy_index is not None
+
+            if count is None:
+                count = self._get_match_count()
+            # ranking twice as many as before, paging through all matches
+            # only ranks them a few times
+            count = max(count, 2 * ranked)
+
+            # like substring matches, fuzzy matches only shrink when the
+            # search string grows, if all of them were ranked
+            narrowed = next((r.indices for r in reversed(stack) if r.complete), None)
+            indices = self._fuzzy_index.search(search_filter, narrowed, count)
+            result = _SearchResult(
+                search_filter,
+                list(map(self.choices.__getitem__, indices)),
+                indices,
+                {},
+                complete=len(indices) != count,
+            )
+        elif self.search_matcher is None and isinstance(self.choices, ChoiceTable):
+            # narrowed like the substring search below, reading the titles
+            # column and only creating the choices of the matching rows
+            titles = self.choices.titles
+            rows = stack[-1].indices if stack else None
+            needle = search_filter.lower()
+            indices = [
+                i
+                for i in (range(len(titles)) if rows is None else rows)
+                if needle in self._title_search_text(titles[i]).lower()
+            ]
+            result = _SearchResult(
+                search_filter, list(map(self.choices.__getitem__, indices)), indices
+            )
+        elif self.search_matcher is None:
+            # substring matches can only shrink when the search string grows,
+            # so it is enough to look at the result of the last prefix
+            candidates = stack[-1].choices if stack else self.choices
+            needle = search_filter.lower()
+            result = _SearchResult(
+                search_filter,
+                [
+                    c
+                    for c in candidates
+                    if needle in self._choice_search_text(c).lower()
+                ],
+            )
+        else:
+            # custom matchers are not necessarily monotonic, rescan everything
+            result = _SearchResult(
+                search_filter,
+                [c for c in self.choices if self.search_matcher(search_filter, c)],
+            )
+
+        stack.append(result)
+        return result
+
+    def _get_match_count(self) -> int:
+        """Number of matches of a fuzzy search needed to render the screen.
+
+        One more than fits the screen, to know if there is more to show."""
+
+        if not self.virtualize:
+            return len(self.choices)
+        return self.pointed_at + self._get_viewport_height() + 1
 
-            return search_filter.lower() in text.lower()
+    def _load_matches(self, count: Optional[int] = None) -> None:
+        """Rank more matches of the current fuzzy search.
 
+        Args:
+            count: Rank matches until at least this many are available. If
+                   ``None``, all matches are ranked.
+        """
+
+        if self.search_filter and self.use_fuzzy_search:
+            self.load_choices()
+            if count is None:
+                count = len(self.choices)
+            self._filter_choices(self.search_filter, count)
+
+    def _get_search_match_positions(self, choice: Choice) -> Optional[List[int]]:
+        """Positions of the title characters matched by a fuzzy search."""
+
+        if not self.search_filter or not self._filter_cache:
+            return None
+
+        result = self._filter_cache[-1]
+        if result.positions is None or result.search_filter != self.search_filter:
+            return None
+
+        if id(choice) not in result.positions:
+            result.positions[id(choice)] = FuzzySearchIndex.match_positions(
+                self.search_filter, self._choice_search_text(choice)
+            )
+        return result.positions[id(choice)]
+
+    def _reset_filter_cache(self) -> None:
+        """Drop all cached search results, e.g. after ``choices`` changed."""
+        self._filter_cache = []
+
+    @property
+    def filtered_choices(self):
         if not self.search_filter:
             return self.choices
 
-        search_matcher = self.search_matcher or case_insensitive
-        filtered = [c for c in self.choices if search_matcher(self.search_filter, c)]
+        self.load_choices()
+        filtered = self._filter_choices(self.search_filter).choices
         self.found_in_search = len(filtered) > 0
         return filtered if self.found_in_search else self.choices
 
@@ -409,6 +1362,87 @@ class InquirerControl(FormattedTextControl):
     def choice_count(self) -> int:
         return len(self.filtered_choices)
 
+    def _get_viewport_height(self) -> int:
+        """Number of choice rows that fit on the screen.
+
+        Rows needed for the question, the scroll indicators, the search string
+        and the validation toolbar are kept free."""
+
+        reserved = VIEWPORT_RESERVED_ROWS
+        if self.show_selected:
+            reserved += 1
+        if self.show_description:
+            reserved += 1
+
+        return max(get_app().output.get_size().rows - reserved, 1)
+
+    def _get_viewport(self, choice_count: int) -> Tuple[int, int]:
+        """Return the ``(start, end)`` range of choices which are rendered.
+
+        The window only scrolls once the pointer leaves it, so moving the
+        cursor inside the visible rows does not shift the list."""
+
+        height = self._get_viewport_height()
+        if choice_count <= height:
+            self._viewport_start = 0
+            return 0, choice_count
+
+        start = self._viewport_start
+        if self.pointed_at < start:
+            start = self.pointed_at
+        elif self.pointed_at >= start + height:
+            start = self.pointed_at - height + 1
+        start = max(min(start, choice_count - height), 0)
+
+        self._viewport_start = start
+        return start, start + height
+
+    def _number_choices(self) -> None:
+        self._number_index = [
+            i for i in range(len(self.choices)) if _is_selectable_row(self.choices, i)
+        ]
+        self._choice_numbers = {
+            index: number for number, index in enumerate(self._number_index, 1)
+        }
+
+    def _jump_to_number(self, number: str) -> bool:
+        n = int(number)
+        if not 1 <= n <= len(self._number_index):
+            return False
+        self.pointed_at = self._number_index[n - 1]
+        return True
+
+    def add_jump_digit(self, digit: str) -> None:
+        """Point at the choice with the number typed so far.
+
+        Digits typed within :data:`NUMBER_JUMP_TIMEOUT` seconds of each other
+        add up to one number, e.g. ``1``, ``2``, ``7`` points at choice 127.
+        A digit which does not extend the number to an existing choice
+        starts a new number."""
+
+        now = time.monotonic()
+        if now - self._last_digit_time > NUMBER_JUMP_TIMEOUT:
+            self._typed_number = ""
+        self._last_digit_time = now
+
+        number = self._typed_number + digit
+        if not self._jump_to_number(number):
+            number = digit if self._jump_to_number(digit) else ""
+        self._typed_number = number
+
+    def _get_shortcut_title(self, index: int, choice: Choice) -> str:
+        if self.use_number_jump:
+            return "{}) ".format(self._choice_numbers.get(index, "-"))
+        if self.use_shortcuts:
+            return choice.get_shortcut_title()
+        return ""
+
+    def _get_shortcut_page_range(self, choice_count: int) -> Tuple[int, int]:
+        """Return the ``(start, end)`` range of the current shortcut page."""
+        assert self.shortcut_page_size
+        start = self.shortcut_page * self.shortcut_page_size
+        return start, min(start + self.shortcut_page_size, choice_count)
+
     def _get_choice_tokens(self):
         tokens = []
 
@@ -454,7 +1488,7 @@ class InquirerControl(FormattedTextControl):
                     )
                 )
             else:
-                shortcut = choice.get_shortcut_title() if self.use_shortcuts else ""
+                shortcut = self._get_shortcut_title(index, choice)
 
                 if selected:
                     if self.use_indicator:
@@ -482,27 +1516,66 @@ class InquirerControl(FormattedTextControl):
                         (fragment[0] + extra_style, fragment[1])
                         for fragment in choice.title
                     )
-                elif selected:
-                    tokens.append(
-                        ("class:selected", "{}{}".format(shortcut, choice.title))
-                    )
-                elif index == self.pointed_at:
-                    tokens.append(
-                        ("class:highlighted", "{}{}".format(shortcut, choice.title))
-                    )
                 else:
-                    tokens.append(("class:text", "{}{}".format(shortcut, choice.title)))
+                    if selected:
+                        style = "class:selected"
+                    elif index == self.pointed_at:
+                        style = "class:highlighted"
+                    else:
+                        style = "class:text"
+
+                    positions = self._get_search_match_positions(choice)
+                    if positions and isinstance(choice.title, str):
+                        if shortcut:
+                            tokens.append((style, shortcut))
+                        tokens.extend(
+                            _highlight_positions(style, choice.title, positions)
+                        )
+                    else:
+                        tokens.append((style, "{}{}".format(shortcut, choice.title)))
 
             tokens.append(("", "\n"))
 
         # prepare the select choices
-        for i, c in enumerate(self.filtered_choices):
-            append(i, c)
+        if self._choice_source is not None:
+            # one more than fits the screen to know if there is more to show
+            self.load_choices(self.pointed_at + self._get_viewport_height() + 1)
+
+        choices = self.filtered_choices
+        if not choices:
+            if self.is_loading:
+                tokens.append(("class:instruction", "  {}".format(LOADING_CHOICES)))
+            return tokens
+
+        start, end = 0, len(choices)
+
+        if self.shortcut_page_size and self.use_shortcuts and not self.search_filter:
+            start, end = self._get_shortcut_page_range(len(choices))
+        elif self.virtualize:
+            start, end = self._get_viewport(len(choices))
+
+        if start > 0:
+            tokens.append(("class:text", MORE_CHOICES_ABOVE.format(start)))
+            tokens.append(("", "\n"))
+
+        for i in range(start, end):
+            append(i, choices[i])
+
+        if end < len(choices):
+            remaining: Union[int, str] = len(choices) - end
+            if not self.all_choices_loaded:
+                remaining = "{}+".format(remaining)
+            tokens.append(("class:text", MORE_CHOICES_BELOW.format(remaining)))
+            tokens.append(("", "\n"))
+
+        if self.is_loading:
+            tokens.append(("class:instruction", "  {}".format(LOADING_CHOICES)))
+            tokens.append(("", "\n"))
 
         current = self.get_pointed_at()
 
         if self.show_selected:
-            answer = current.get_shortcut_title() if self.use_shortcuts else ""
+            answer = self._get_shortcut_title(self.pointed_at, current)
 
             answer += (
                 current.title if isinstance(current.title, str) else current.title[0][1]
@@ -532,15 +1605,123 @@ class InquirerControl(FormattedTextControl):
         return not self.is_selection_disabled() and not self.is_selection_a_separator()
 
     def select_previous(self) -> None:
-        self.pointed_at = (self.pointed_at - 1) % self.choice_count
+        if self.pointed_at == 0:
+            # wrapping around to the end of the list
+            self.load_choices()
+            self._load_matches()
+        if self.choice_count:
+            self.pointed_at = (self.pointed_at - 1) % self.choice_count
 
     def select_next(self) -> None:
-        self.pointed_at = (self.pointed_at + 1) % self.choice_count
+        self.load_choices(self.pointed_at + 2)
+        self._load_matches(self.pointed_at + 2)
+        if self.choice_count:
+            self.pointed_at = (self.pointed_at + 1) % self.choice_count
+
+    def _get_skip_table(self) -> _SkipTable:
+        """The skip table of the displayed (possibly filtered) choices."""
+        choices = self.filtered_choices
+        if self._skip_table is None or self._skip_table.choices is not choices:
+            self._skip_table = _SkipTable(choices)
+        else:
+            self._skip_table.update()
+        return self._skip_table
+
+    def _load_next_choice(self) -> bool:
+        """Load one more choice of a lazy choice source or rank one more match
+        of a fuzzy search, if there is one."""
+        if self._choice_source is not None:
+            self.load_choices(len(self.choices) + 1)
+            return True
+        if self.search_filter and self.use_fuzzy_search:
+            result = self._filter_choices(self.search_filter)
+            if not result.complete:
+                self._load_matches(len(result.choices) + 1)
+                return True
+        return False
+
+    def select_next_valid(self, cycle: bool = True) -> None:
+        """Move the pointer to the next selectable choice.
+
+        Args:
+            cycle: Wrap around from the last to the first choice.
+        """
+        table = self._get_skip_table()
+        if not table.next:
+            return
+
+        while table.next[self.pointed_at] == -1 and self._load_next_choice():
+            table = self._get_skip_table()
+
+        target = table.next[self.pointed_at]
+        if target == -1 and cycle:
+            target = table.first
+        if target != -1:
+            self.pointed_at = target
+
+    def select_previous_valid(self, cycle: bool = True) -> None:
+        """Move the pointer to the previous selectable choice.
+
+        Args:
+            cycle: Wrap around from the first to the last choice.
+        """
+        table = self._get_skip_table()
+        if not table.previous:
+            return
+
+        target = table.previous[self.pointed_at]
+        if target == -1 and cycle:
+            # wrapping around to the end of the list
+            self.load_choices()
+            self._load_matches()
+            target = self._get_skip_table().last
+        if target != -1:
+            self.pointed_at = target
+
+    def select_first_valid(self) -> None:
+        """Move the pointer to the first selectable choice."""
+        table = self._get_skip_table()
+        while table.first == -1 and self._load_next_choice():
+            table = self._get_skip_table()
+        if table.first != -1:
+            self.pointed_at = table.first
+
+    def select_last_valid(self) -> None:
+        """Move the pointer to the last selectable choice."""
+        self.load_choices()
+        self._load_matches()
+        table = self._get_skip_table()
+        if table.last != -1:
+            self.pointed_at = table.last
+
+    def select_page_of_choices(self, pages: int) -> None:
+        """Move the pointer a screen of choices down (or up for negative
+        ``pages``) onto a selectable choice, without wrapping around."""
+
+        rows = pages * self._get_viewport_height()
+        if rows > 0:
+            self.load_choices(self.pointed_at + rows + 1)
+            self._load_matches(self.pointed_at + rows + 1)
+
+        table = self._get_skip_table()
+        if not table.next:
+            return
+
+        target = min(max(self.pointed_at + rows, 0), len(table.next) - 1)
+        if not _is_selectable_row(table.choices, target):
+            ahead, behind = table.next[target], table.previous[target]
+            if rows < 0:
+                ahead, behind = behind, ahead
+            target = ahead if ahead != -1 else behind
+        if target != -1:
+            self.pointed_at = target
 
     def get_pointed_at(self) -> Choice:
         return self.filtered_choices[self.pointed_at]
 
     def get_selected_values(self) -> List[Choice]:
+        # choices that have not been loaded yet might be preselected
+        self.load_choices()
         # get values not labels
         return [
             c
@@ -548,7 +1729,7 @@ class InquirerControl(FormattedTextControl):
             if (not isinstance(c, Separator) and c.value in self.selected_options)
         ]
 
-    def add_search_character(self, char: Keys) -> None:
+    def add_search_character(self, char: Union[Keys, str]) -> None:
         """Adds a character to the search filter"""
         if char == Keys.Backspace:
             self.remove_search_character()
@@ -582,28 +1763,191 @@ class InquirerControl(FormattedTextControl):
         ]
 
 
+def _raise_for_verdict(verdict: Any, text: str) -> None:
+    if verdict is not True:
+        if verdict is False:
+            verdict = INVALID_INPUT
+        raise ValidationError(message=verdict, cursor_position=len(text))
+
+
+def _is_running_in_this_thread(loop: asyncio.AbstractEventLoop) -> bool:
+    try:
+        return asyncio.get_running_loop() is loop
+    except RuntimeError:
+        return False
+
+
+def _is_outdated(document: Document) -> bool:
+    """Whether the text of the current buffer changed since ``document``."""
+    return get_app().current_buffer.text != document.text
+
+
 def build_validator(validate: Any) -> Optional[Validator]:
     if validate:
         if inspect.isclass(validate) and issubclass(validate, Validator):
             return validate()
         elif isinstance(validate, Validator):
             return validate
+        elif inspect.iscoroutinefunction(validate):
+            return DebouncedValidator(validate)
         elif callable(validate):
 
             class _InputValidator(Validator):
                 def validate(self, document):
-                    verdict = validate(document.text)
-                    if verdict is not True:
-                        if verdict is False:
-                            verdict = INVALID_INPUT
-                        raise ValidationError(
-                            message=verdict, cursor_position=len(document.text)
-                        )
+                    _raise_for_verdict(validate(document.text), document.text)
 
             return _InputValidator()
     return None
 
 
+class DebouncedValidator(Validator):
+    """Validates the input with a coroutine function, without blocking input.
+
+    While typing, the input is validated in the background once no text was
+    typed for ``delay`` seconds. A validation is cancelled as soon as the
+    input changes, the validation toolbar shows each result when it arrives.
+    When the input is submitted before its validation finished, submitting
+    is held back until the coroutine function, run on the event loop of
+    the application, returns. Outside of a running application the input
+    is validated in a separate thread and event loop.
+
+    Args:
+        validate: Coroutine function accepting the input and returning a
+                  boolean, or a string with an error message.
+
+        delay: Seconds to wait for further input before validating.
+    """
+
+    validate_function: Callable[[str], Awaitable[Any]]
+    delay: float
+
+    def __init__(
+        self,
+        validate: Callable[[str], Awaitable[Any]],
+        delay: float = DEFAULT_VALIDATION_DELAY,
+    ) -> None:
+        self.validate_function = validate
+        self.delay = delay
+        # the last input validated and its verdict
+        self._last_verdict: Optional[Tuple[str, Any]] = None
+        # the input waiting for its validation to be submitted
+        self._submitting: Optional[str] = None
+
+    async def _validate_text(self, text: str) -> Any:
+        verdict = await self.validate_function(text)
+        self._last_verdict = (text, verdict)
+        return verdict
+
+    def validate(self, document: Document) -> None:
+        text = document.text
+        if self._last_verdict is not None and self._last_verdict[0] == text:
+            verdict = self._last_verdict[1]
+        else:
+            app = get_app()
+            # applications of prompt toolkit 2 have no asyncio loop
+            loop = getattr(app, "loop", None) if app.is_running else None
+            if loop is None:
+                with ThreadPoolExecutor(max_workers=1) as executor:
+                    verdict = executor.submit(
+                        asyncio.run, self._validate_text(text)
+                    ).result()
+            elif not _is_running_in_this_thread(loop):
+                verdict = asyncio.run_coroutine_threadsafe(
+                    self._validate_text(text), loop
+                ).result()
+            else:
+                # can't wait for the loop the input is handled in, submit
+                # again once the verdict is there
+                if self._submitting != text:
+                    self._submitting = text
+                    app.create_background_task(
+                        self._submit_validated(app.current_buffer, text)
+                    )
+                raise ValidationError(
+                    message=VALIDATING_INPUT, cursor_position=len(text)
+                )
+        _raise_for_verdict(verdict, text)
+
+    async def _submit_validated(self, buffer: Buffer, text: str) -> None:
+        try:
+            await self._validate_text(text)
+        finally:
+            self._submitting = None
+
+        if buffer.text == text:
+            buffer.validation_state = ValidationState.UNKNOWN
+            buffer.validate_and_handle()
+
+    async def validate_async(self, document: Document) -> None:
+        await asyncio.sleep(self.delay)
+        if _is_outdated(document):
+            # the buffer validates the new text again
+            return
+
+        task = asyncio.ensure_future(self._validate_text(document.text))
+        try:
+            while not task.done():
+                await asyncio.wait({task}, timeout=self.delay)
+                if _is_outdated(document):
+                    return
+            verdict = task.result()
+        finally:
+            task.cancel()
+
+        _raise_for_verdict(verdict, document.text)
+
+
+class DebouncedCompleter(Completer):
+    """Runs a completer in a background thread once the user stops typing.
+
+    Completions are only computed after no text was typed for ``delay``
+    seconds, so a slow completer never blocks the input and is not run for
+    every keystroke. Requests which are outdated by the time they would start
+    (or while they are producing completions) are dropped. Explicitly
+    requested completions (e.g. pressing tab) start without a delay.
+
+    Args:
+        completer: The completer to run in the background.
+
+        delay: Seconds to wait for further input before completing.
+    """
+
+    completer: Completer
+    delay: float
+
+    def __init__(
+        self, completer: Completer, delay: float = DEFAULT_COMPLETION_DELAY
+    ) -> None:
+        self.completer = completer
+        self.delay = delay
+
+    def get_completions(
+        self, document: Document, complete_event: CompleteEvent
+    ) -> Iterable[Completion]:
+        return self.completer.get_completions(document, complete_event)
+
+    async def get_completions_async(
+        self, document: Document, complete_event: CompleteEvent
+    ) -> AsyncGenerator[Completion, None]:
+        if not complete_event.completion_requested:
+            await asyncio.sleep(self.delay)
+            if _is_outdated(document):
+                # the buffer restarts the completion for the new text
+                return
+
+        completions = generator_to_async_generator(
+            lambda: self.completer.get_completions(document, complete_event)
+        )
+        try:
+            async for completion in completions:
+                if _is_outdated(document):
+                    break
+                yield completion
+        finally:
+            # stops the worker thread
+            await completions.aclose()
+
+
 def _fix_unecessary_blank_lines(ps: PromptSession) -> None:
     """This is a fix for additional empty lines added by prompt toolkit.
 
@@ -623,6 +1967,74 @@ def _fix_unecessary_blank_lines(ps: PromptSession) -> None:
     default_buffer_window.always_hide_cursor = Always()
 
 
+# characters which can be typed into a search filter
+SEARCH_FILTER_CHARACTERS = frozenset(string.printable) - frozenset(string.whitespace)
+
+
+def add_search_filter_bindings(
+    bindings: KeyBindings,
+    ic: InquirerControl,
+    characters: AbstractSet[str] = SEARCH_FILTER_CHARACTERS,
+) -> None:
+    """Add the key bindings typing into the search filter of ``ic``.
+
+    A single catch-all binding handles all ``characters``, any other key
+    without a binding of its own is ignored. Keys bound by the prompt (e.g.
+    the arrow keys) take precedence over it.
+    """
+
+    @bindings.add(Keys.Any)
+    def search_filter(event: KeyPressEvent) -> None:
+        key = event.key_sequence[0].key
+        if key in characters:
+            ic.add_search_character(key)
+
+    @bindings.add(Keys.Backspace, eager=True)
+    def remove_search_character(event: KeyPressEvent) -> None:
+        ic.add_search_character(Keys.Backspace)
+
+
+def add_page_bindings(
+    bindings: KeyBindings, ic: InquirerControl, pages: bool = True
+) -> None:
+    """Add the key bindings moving the pointer of ``ic`` to the first
+    (`Home`) or last (`End`) selectable choice and, if ``pages`` is set,
+    a screen of choices up (`PageUp`) or down (`PageDown`)."""
+
+    @bindings.add(Keys.Home, eager=True)
+    def select_first(event: KeyPressEvent) -> None:
+        ic.select_first_valid()
+
+    @bindings.add(Keys.End, eager=True)
+    def select_last(event: KeyPressEvent) -> None:
+        ic.select_last_valid()
+
+    if not pages:
+        return
+
+    @bindings.add(Keys.PageUp, eager=True)
+    def select_page_up(event: KeyPressEvent) -> None:
+        ic.select_page_of_choices(-1)
+
+    @bindings.add(Keys.PageDown, eager=True)
+    def select_page_down(event: KeyPressEvent) -> None:
+        ic.select_page_of_choices(1)
+
+
+def load_choices_in_background(app: "Application[Any]", ic: InquirerControl) -> None:
+    """Consume an asynchronous choice source of ``ic`` while ``app`` runs."""
+
+    if not ic.is_loading:
+        return
+
+    def start_loading() -> None:
+        # the running application, which is not ``app`` when the question is
+        # asked as part of a form running all questions in one application
+        get_app().create_background_task(ic.load_choices_async())
+
+    app.pre_run_callables.append(start_loading)
+
+
 def create_inquirer_layout(
     ic: InquirerControl,
     get_prompt_tokens: Callable[[], List[Tuple[str, str]]],
@@ -13,9 +13,11 @@ from questionary.constants import NO_OR_YES
 from questionary.constants import YES
 from questionary.constants import YES_OR_NO
 from questionary.question import Question
+from questionary.question import traceable
 from questionary.styles import merge_styles_default
 
 
+@traceable
 def confirm(
     message: str,
     default: bool = True,
@@ -126,8 +128,13 @@ def confirm(
     def other(event):
         """Disallow inserting other text."""
 
+    def reset() -> None:
+        status["answer"] = None
+        status["complete"] = False
+
     return Question(
         PromptSession(
             get_prompt_tokens, key_bindings=bindings, style=merged_style, **kwargs
-        ).app
+        ).app,
+        reset=reset,
     )
@@ -5,8 +5,10 @@ from questionary import Style
 from questionary.constants import DEFAULT_QUESTION_PREFIX
 from questionary.prompts import text
 from questionary.question import Question
+from questionary.question import traceable
 
 
+@traceable
 def password(
     message: str,
     default: str = "",
@@ -45,6 +47,8 @@ def password(
                   This can either be a function accepting the input and
                   returning a boolean, or an class reference to a
                   subclass of the prompt toolkit Validator class.
+                  A coroutine function (e.g. querying a database) runs in
+                  the background while typing, without blocking the input.
 
         qmark: Question prefix displayed in front of the question.
                By default this is a ``?``.
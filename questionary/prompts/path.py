@@ -1,4 +1,8 @@
 import os
+import threading
+import time
+from bisect import bisect_left
+from collections import OrderedDict
 from pathlib import Path
 from typing import Any
 from typing import Callable
@@ -20,20 +24,116 @@ from prompt_toolkit.shortcuts.prompt import CompleteStyle
 from prompt_toolkit.shortcuts.prompt import PromptSession
 from prompt_toolkit.styles import Style
 
+from questionary import utils
+from questionary.constants import DEFAULT_COMPLETION_DELAY
 from questionary.constants import DEFAULT_QUESTION_PREFIX
+from questionary.prompts.common import DebouncedCompleter
 from questionary.prompts.common import build_validator
 from questionary.question import Question
+from questionary.question import traceable
 from questionary.styles import merge_styles_default
 
 
+class DirectoryListingCache:
+    """Caches the entries of directories for path completion.
+
+    A directory is read with a single :func:`os.scandir` pass, which also
+    tells whether an entry is a directory without a separate ``stat`` for
+    most file systems. Listings younger than ``ttl`` seconds are used as is,
+    older ones are reused as long as the modification time of the directory
+    did not change. Only the ``max_size`` most recently used listings are
+    kept.
+
+    Args:
+        ttl: Seconds a listing is used without checking the directory again.
+
+        max_size: Maximum number of cached directory listings.
+    """
+
+    def __init__(self, ttl: float = 1.0, max_size: int = 64) -> None:
+        self.ttl = ttl
+        self.max_size = max_size
+        # directory -> (modification time, time of the last check, entries)
+        self._listings: OrderedDict[
+            str, Tuple[int, float, List[Tuple[str, bool]]]
+        ] = OrderedDict()
+        # completions can run in (more than one) background thread
+        self._lock = threading.Lock()
+
+    def clear(self) -> None:
+        """Forget all cached listings."""
+        with self._lock:
+            self._listings.clear()
+
+    @staticmethod
+    def _scan(directory: str) -> List[Tuple[str, bool]]:
+        entries = []
+        with os.scandir(directory) as it:
+            for entry in it:
+                try:
+                    is_dir = entry.is_dir()
+                except OSError:
+                    is_dir = False
+                entries.append((entry.name, is_dir))
+        entries.sort()
+        return entries
+
+    def entries(self, directory: str) -> List[Tuple[str, bool]]:
+        """Names of the entries of ``directory`` and whether they are directories.
+
+        The entries are sorted by name.
+
+        Raises:
+            OSError: If the directory can not be read.
+        """
+        key = os.path.abspath(directory)
+        now = time.monotonic()
+
+        with self._lock:
+            cached = self._listings.get(key)
+            if cached is not None:
+                self._listings.move_to_end(key)
+                if now - cached[1] < self.ttl:
+                    return cached[2]
+
+        mtime = os.stat(key).st_mtime_ns
+        if cached is not None and cached[0] == mtime:
+            entries = cached[2]
+        else:
+            entries = self._scan(key)
+
+        with self._lock:
+            self._listings[key] = (mtime, now, entries)
+            self._listings.move_to_end(key)
+            while len(self._listings) > self.max_size:
+                self._listings.popitem(last=False)
+        return entries
+
+    def entries_with_prefix(
+        self, directory: str, prefix: str
+    ) -> List[Tuple[str, bool]]:
+        """Like :meth:`entries`, but only the entries starting with ``prefix``."""
+        entries = self.entries(directory)
+        if not prefix:
+            return entries
+
+        start = bisect_left(entries, (prefix,))
+        end = start
+        while end < len(entries) and entries[end][0].startswith(prefix):
+            end += 1
+        return entries[start:end]
+
+
 class GreatUXPathCompleter(PathCompleter):
     """Wraps :class:`prompt_toolkit.completion.PathCompleter`.
 
     Makes sure completions for directories end with a path separator. Also make sure
     the right path separator is used. Checks if `get_paths` returns list of existing
-    directories.
+    directories. Directory listings are cached in :attr:`listing_cache`.
     """
 
+    listing_cache: DirectoryListingCache
+
     def __init__(
         self,
         only_directories: bool = False,
@@ -81,39 +181,68 @@ class GreatUXPathCompleter(PathCompleter):
             min_input_len=min_input_len,
             expanduser=expanduser,
         )
+        self.listing_cache = DirectoryListingCache()
 
     def get_completions(
         self, document: Document, complete_event: CompleteEvent
     ) -> Iterable[Completion]:
         """Get completions.
 
-        Wraps :class:`prompt_toolkit.completion.PathCompleter`. Makes sure completions
+        Works like :class:`prompt_toolkit.completion.PathCompleter`, but reads
+        the directories through :attr:`listing_cache`. Makes sure completions
         for directories end with a path separator. Also make sure the right path
         separator is used.
         """
-        completions = super(GreatUXPathCompleter, self).get_completions(
-            document, complete_event
-        )
+        text = document.text_before_cursor
 
-        for completion in completions:
-            # check if the display value ends with a path separator.
-            # first check if display is properly set
-            styled_display = completion.display[0]
-            # styled display is a formatted text (a tuple of the text and its style)
-            # second tuple entry is the text
-            if styled_display[1][-1] == "/":
-                # replace separator with the OS specific one
-                display_text = styled_display[1][:-1] + os.path.sep
-                # update the styled display with the modified text
-                completion.display[0] = (styled_display[0], display_text)
-                # append the separator to the text as well - unclear why the normal
-                # path completer omits it from the text. this improves UX for the
-                # user, as they don't need to type the separator after auto-completing
-                # a directory
-                completion.text += os.path.sep
-            yield completion
+        if len(text) < self.min_input_len:
+            return
 
+        if self.expanduser:
+            text = os.path.expanduser(text)
 
+        # directories where to look
+        dirname = os.path.dirname(text)
+        if dirname:
+            directories = [
+                os.path.dirname(os.path.join(p, text)) for p in self.get_paths()
+            ]
+        else:
+            directories = self.get_paths()
+
+        # start of the current file name
+        prefix = os.path.basename(text)
+
+        filenames: List[Tuple[str, bool, str]] = []
+        for directory in directories:
+            try:
+                entries = self.listing_cache.entries_with_prefix(directory, prefix)
+            except OSError:
+                continue
+            filenames.extend((name, is_dir, directory) for name, is_dir in entries)
+
+        filenames.sort(key=lambda f: f[0])
+
+        for filename, is_dir, directory in filenames:
+            if self.only_directories and not is_dir:
+                continue
+
+            full_name = os.path.join(directory, filename)
+            if not self.file_filter(full_name):
+                continue
+
+            completion = filename[len(prefix) :]  # noqa: E203
+            if is_dir:
+                # append the separator to the text as well - this improves UX
+                # for the user, as they don't need to type the separator after
+                # auto-completing a directory
+                completion += os.path.sep
+                filename += os.path.sep
+
+            yield Completion(text=completion, start_position=0, display=filename)
+
+
+@traceable
 def path(
     message: str,
     default: Path | str = "",
@@ -126,6 +255,8 @@ def path(
     file_filter: Optional[Callable[[str], bool]] = None,
     complete_style: CompleteStyle = CompleteStyle.MULTI_COLUMN,
     min_input_len: int = 0,
+    complete_in_thread: bool = False,
+    completion_delay: float = DEFAULT_COMPLETION_DELAY,
     **kwargs: Any,
 ) -> Question:
     """A text input for a file or directory path with autocompletion enabled.
@@ -162,6 +293,8 @@ def path(
                   This can either be a function accepting the input and
                   returning a boolean, or an class reference to a
                   subclass of the prompt toolkit Validator class.
+                  A coroutine function (e.g. querying a database) runs in
+                  the background while typing, without blocking the input.
 
         completer: A custom completer to use in the prompt. For more information,
                    see `this <https://python-prompt-toolkit.readthedocs.io/en/master/pages/asking_for_input.html#a-custom-completer>`_.
@@ -189,6 +322,16 @@ def path(
                        least this long. Defaults to 0. This option does not do
                        anything if a custom ``completer`` is passed.
 
+        complete_in_thread: Compute the completions in a background thread,
+                            once no text was typed for ``completion_delay``
+                            seconds, so that typing never waits for them.
+                            Useful if the file system is slow.
+
+        completion_delay: Seconds to wait for further input before completing
+                          in the background, only used if
+                          ``complete_in_thread`` is set and with prompt
+                          toolkit 3.
+
     Returns:
         :class:`Question`: Question instance, ready to be prompted (using ``.ask()``).
     """  # noqa: W505, E501
@@ -235,6 +378,13 @@ def path(
 
         b.start_completion(select_first=False)
 
+    if complete_in_thread:
+        if utils.is_prompt_toolkit_3():
+            completer = DebouncedCompleter(completer, completion_delay)
+        else:
+            # prompt toolkit 2 completes in a thread, but without a delay
+            kwargs["complete_in_thread"] = True
+
     p: PromptSession = PromptSession(
         get_prompt_tokens,
         lexer=SimpleLexer("class:answer"),
@@ -247,4 +397,7 @@ def path(
     )
     p.default_buffer.reset(Document(str(default)))
 
-    return Question(p.app)
+    def reset() -> None:
+        p.default_buffer.reset(Document(str(default)))
+
+    return Question(p.app, reset=reset)
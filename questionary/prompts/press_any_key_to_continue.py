@@ -8,9 +8,11 @@ from prompt_toolkit.keys import Keys
 from prompt_toolkit.styles import Style
 
 from questionary.question import Question
+from questionary.question import traceable
 from questionary.styles import merge_styles_default
 
 
+@traceable
 def press_any_key_to_continue(
     message: Optional[str] = None,
     style: Optional[Style] = None,
@@ -11,8 +11,10 @@ from questionary.constants import DEFAULT_SELECTED_POINTER
 from questionary.prompts import select
 from questionary.prompts.common import Choice
 from questionary.question import Question
+from questionary.question import traceable
 
 
+@traceable
 def rawselect(
     message: str,
     choices: Sequence[Union[str, Choice, Dict[str, Any]]],
@@ -20,6 +22,8 @@ def rawselect(
     qmark: str = DEFAULT_QUESTION_PREFIX,
     pointer: Optional[str] = DEFAULT_SELECTED_POINTER,
     style: Optional[Style] = None,
+    shortcut_page_size: Optional[int] = None,
+    use_number_jump: bool = False,
     **kwargs: Any,
 ) -> Question:
     """Ask the user to select one item from a list of choices using shortcuts.
@@ -63,6 +67,16 @@ def rawselect(
         style: A custom color and style for the question parts. You can
                configure colors as well as font types for different elements.
 
+        shortcut_page_size: Show the choices in pages of this many choices,
+                            each page with its own shortcuts. The user moves
+                            between pages using `PageUp` and `PageDown`.
+                            Required for lists of more than 36 choices.
+
+        use_number_jump: Number the choices instead of assigning shortcuts.
+                         The user types the number of a choice to select it,
+                         e.g. ``1``, ``2``, ``7`` in quick succession selects
+                         choice 127.
+
     Returns:
         :class:`Question`: Question instance, ready to be prompted (using ``.ask()``).
     """
@@ -73,9 +87,11 @@ def rawselect(
         qmark,
         pointer,
         style,
-        use_shortcuts=True,
+        use_shortcuts=not use_number_jump,
         use_arrow_keys=False,
         use_jk_keys=False,
         use_emacs_keys=False,
+        shortcut_page_size=shortcut_page_size,
+        use_number_jump=use_number_jump,
         **kwargs,
     )
@@ -1,12 +1,16 @@
 # -*- coding: utf-8 -*-
 
+import inspect
 import string
 from typing import Any
+from typing import AsyncIterable
 from typing import Callable
 from typing import Dict
+from typing import Iterable
 from typing import Optional
 from typing import Sequence
 from typing import Union
+from typing import cast
 
 from prompt_toolkit.application import Application
 from prompt_toolkit.key_binding import KeyBindings
@@ -18,15 +22,19 @@ from questionary.constants import DEFAULT_QUESTION_PREFIX
 from questionary.constants import DEFAULT_SELECTED_POINTER
 from questionary.prompts import common
 from questionary.prompts.common import Choice
+from questionary.prompts.common import ChoicesSource
+from questionary.prompts.common import ChoiceTable
 from questionary.prompts.common import InquirerControl
 from questionary.prompts.common import Separator
 from questionary.question import Question
+from questionary.question import traceable
 from questionary.styles import merge_styles_default
 
 
+@traceable
 def select(
     message: str,
-    choices: Sequence[Union[str, Choice, Dict[str, Any]]],
+    choices: ChoicesSource,
     default: Optional[Union[str, Choice, Dict[str, Any]]] = None,
     qmark: str = DEFAULT_QUESTION_PREFIX,
     pointer: Optional[str] = DEFAULT_SELECTED_POINTER,
@@ -38,9 +46,13 @@ def select(
     use_emacs_keys: bool = True,
     use_search_filter: bool = False,
     search_matcher: Optional[Callable[[str, Choice], bool]] = None,
+    use_fuzzy_search: bool = False,
     show_selected: bool = False,
     show_description: bool = True,
     instruction: Optional[str] = None,
+    virtualize: bool = False,
+    shortcut_page_size: Optional[int] = None,
+    use_number_jump: bool = False,
     **kwargs: Any,
 ) -> Question:
     """A list of items to select **one** option from.
@@ -72,7 +84,14 @@ def select(
         choices: Items shown in the selection, this can contain :class:`Choice` or
                  or :class:`Separator` objects or simple items as strings. Passing
                  :class:`Choice` objects, allows you to configure the item more
-                 (e.g. preselecting it or disabling it).
+                 (e.g. preselecting it or disabling it). Instead of a sequence,
+                 an iterator, generator or asynchronous iterator can be passed.
+                 It is consumed lazily, only loading the choices needed to
+                 display the list. An async generator function yielding
+                 batches (lists) of choices can be passed as well, the list
+                 is populated while the user is already navigating it.
+                 Asynchronous choices require prompt toolkit 3.
+                 Very long lists are best passed as a :class:`ChoiceTable`.
 
         default: A value corresponding to a selectable item in the choices,
                  to initially set the pointer position to.
@@ -102,7 +121,9 @@ def select(
                        not mutually exclusive.
 
         use_arrow_keys: Allow the user to select items from the list using
-                        arrow keys. Arrow keys, j/k keys and shortcuts are not
+                        arrow keys. `Home`, `End`, `PageUp` and `PageDown`
+                        jump to the first, last, previous or next screen of
+                        items. Arrow keys, j/k keys and shortcuts are not
                         mutually exclusive.
 
         use_jk_keys: Allow the user to select items from the list using
@@ -125,27 +146,79 @@ def select(
                         returns whether the choice matches. Only takes effect
                         when ``use_search_filter`` is enabled.
 
+        use_fuzzy_search: Match choices containing the characters of the search
+                          string in order, instead of the search string itself
+                          (e.g. ``"pza"`` matches ``"Pizza"``). The results are
+                          ranked by how well they match and the matched
+                          characters are highlighted. Only takes effect when
+                          ``use_search_filter`` is enabled.
+
         show_selected: Display current selection choice at the bottom of list.
 
         show_description: Display description of current selection if available.
 
+        virtualize: Only render the choices around the pointer which fit on
+                    the screen, plus indicators for the choices scrolled out
+                    of view. Keeps redrawing fast for very long lists.
+
+        shortcut_page_size: Show the choices in pages of this many choices,
+                            each page with its own shortcuts. The user moves
+                            between pages using `PageUp` and `PageDown`. Allows
+                            to use shortcuts with more choices than there are
+                            shortcut keys. Requires ``use_shortcuts``.
+
+        use_number_jump: Number the choices and move the pointer to the choice
+                         with the number the user types, e.g. typing ``1``,
+                         ``2``, ``7`` in quick succession moves to choice 127.
+                         Can not be used together with ``use_shortcuts`` or
+                         ``use_search_filter``, as those use the digits too.
+
     Returns:
         :class:`Question`: Question instance, ready to be prompted (using ``.ask()``).
     """
-    if not (use_arrow_keys or use_shortcuts or use_jk_keys or use_emacs_keys):
+    if not (
+        use_arrow_keys
+        or use_shortcuts
+        or use_jk_keys
+        or use_emacs_keys
+        or use_number_jump
+    ):
         raise ValueError(
             (
                 "Some option to move the selection is required. "
-                "Arrow keys, j/k keys, emacs keys, or shortcuts."
+                "Arrow keys, j/k keys, emacs keys, shortcuts or number jumps."
             )
         )
 
+    if use_number_jump and (use_shortcuts or use_search_filter):
+        raise ValueError(
+            "Cannot use number jumps with shortcuts or search filter, since "
+            "digits can be shortcuts or part of the search string."
+        )
+
     if use_jk_keys and use_search_filter:
         raise ValueError(
             "Cannot use j/k keys with prefix filter search, since j/k can be part of the prefix."
         )
 
+    if use_fuzzy_search and search_matcher is not None:
+        raise ValueError("Cannot use a custom search_matcher with fuzzy search.")
+
+    if use_shortcuts and isinstance(choices, ChoiceTable):
+        raise ValueError("Shortcuts can not be used with a ChoiceTable.")
+
+    if (use_shortcuts or use_number_jump) and not isinstance(choices, Sequence):
+        if isinstance(choices, AsyncIterable) or inspect.isasyncgenfunction(choices):
+            raise ValueError(
+                "Shortcuts and number jumps can not be used with "
+                "asynchronous choices."
+            )
+        # shortcuts and numbers need to be assigned to all choices upfront
+        choices = list(cast(Iterable[Union[str, Choice, Dict[str, Any]]], choices))
+
     if use_shortcuts and use_jk_keys:
+        # shortcuts have turned the choices into a sequence above
+        assert isinstance(choices, Sequence)
         if any(getattr(c, "shortcut_key", "") in ["j", "k"] for c in choices):
             raise ValueError(
                 "A choice is trying to register j/k as a "
@@ -153,17 +226,28 @@ def select(
                 "disable one or the other."
             )
 
-    if choices is None or len(choices) == 0:
+    if choices is None or isinstance(choices, Sequence) and len(choices) == 0:
         raise ValueError("A list of choices needs to be provided.")
 
-    if use_shortcuts:
+    if shortcut_page_size is not None:
+        if not use_shortcuts:
+            raise ValueError("A shortcut_page_size can only be used with shortcuts.")
+        if not 1 <= shortcut_page_size <= len(InquirerControl.SHORTCUT_KEYS):
+            raise ValueError(
+                "The shortcut_page_size must be between 1 and {}, the number "
+                "of keyboard shortcuts that are available."
+                "".format(len(InquirerControl.SHORTCUT_KEYS))
+            )
+    elif use_shortcuts:
+        assert isinstance(choices, Sequence)
         real_len_of_choices = sum(1 for c in choices if not isinstance(c, Separator))
         if real_len_of_choices > len(InquirerControl.SHORTCUT_KEYS):
             raise ValueError(
                 "A list with shortcuts supports a maximum of {} "
                 "choices as this is the maximum number "
                 "of keyboard shortcuts that are available. You "
-                "provided {} choices!"
+                "provided {} choices! Use a shortcut_page_size to "
+                "show them in pages."
                 "".format(len(InquirerControl.SHORTCUT_KEYS), real_len_of_choices)
             )
 
@@ -179,8 +263,15 @@ def select(
         use_arrow_keys=use_arrow_keys,
         initial_choice=default,
         search_matcher=search_matcher,
+        virtualize=virtualize,
+        use_fuzzy_search=use_fuzzy_search,
+        shortcut_page_size=shortcut_page_size,
+        use_number_jump=use_number_jump,
     )
 
+    if not ic.choices and ic.all_choices_loaded:
+        raise ValueError("A list of choices needs to be provided.")
+
     def get_prompt_tokens():
         # noinspection PyListCreation
         tokens = [("class:qmark", qmark), ("class:question", " {} ".format(message))]
@@ -199,12 +290,18 @@ def select(
             if instruction:
                 tokens.append(("class:instruction", instruction))
             else:
-                if use_shortcuts and use_arrow_keys:
-                    instruction_msg = f"(Use shortcuts or arrow keys{', type to filter' if use_search_filter else ''})"
-                elif use_shortcuts and not use_arrow_keys:
-                    instruction_msg = f"(Use shortcuts{', type to filter' if use_search_filter else ''})"
+                paging = ", page up/down for more" if ic.shortcut_page_count > 1 else ""
+                search = ", type to filter" if use_search_filter else ""
+                if use_number_jump:
+                    keys = "numbers"
                 else:
-                    instruction_msg = f"(Use arrow keys{', type to filter' if use_search_filter else ''})"
+                    keys = "shortcuts"
+                if (use_shortcuts or use_number_jump) and use_arrow_keys:
+                    instruction_msg = f"(Use {keys} or arrow keys{paging}{search})"
+                elif use_shortcuts or use_number_jump:
+                    instruction_msg = f"(Use {keys}{paging}{search})"
+                else:
+                    instruction_msg = f"(Use arrow keys{search})"
                 tokens.append(("class:instruction", instruction_msg))
 
         return tokens
@@ -219,49 +316,39 @@ def select(
         event.app.exit(exception=KeyboardInterrupt, style="class:aborting")
 
     if use_shortcuts:
-        # add key bindings for choices
-        for i, c in enumerate(ic.choices):
+        for c in ic.choices:
             if c.shortcut_key is None and not c.disabled and not use_arrow_keys:
                 raise RuntimeError(
                     "{} does not have a shortcut and arrow keys "
                     "for movement are disabled. "
                     "This choice is not reachable.".format(c.title)
                 )
-            if isinstance(c, Separator) or c.shortcut_key is None or c.disabled:
-                continue
 
-            # noinspection PyShadowingNames
-            def _reg_binding(i, keys):
-                # trick out late evaluation with a "function factory":
-                # https://stackoverflow.com/a/3431699
-                @bindings.add(keys, eager=True)
-                def select_choice(event):
-                    ic.pointed_at = i
+    if use_shortcuts and shortcut_page_size is not None:
+
+        @bindings.add(Keys.PageDown, eager=True)
+        def next_page(event):
+            ic.select_page(1)
 
-            _reg_binding(i, c.shortcut_key)
+        @bindings.add(Keys.PageUp, eager=True)
+        def previous_page(event):
+            ic.select_page(-1)
 
     def move_cursor_down(event):
-        ic.select_next()
-        while not ic.is_selection_valid():
-            ic.select_next()
+        ic.select_next_valid()
 
     def move_cursor_up(event):
-        ic.select_previous()
-        while not ic.is_selection_valid():
-            ic.select_previous()
+        ic.select_previous_valid()
 
     if use_search_filter:
-
-        def search_filter(event):
-            ic.add_search_character(event.key_sequence[0].key)
-
-        for character in string.printable:
-            bindings.add(character, eager=True)(search_filter)
-        bindings.add(Keys.Backspace, eager=True)(search_filter)
+        common.add_search_filter_bindings(
+            bindings, ic, common.SEARCH_FILTER_CHARACTERS | {" "}
+        )
 
     if use_arrow_keys:
         bindings.add(Keys.Down, eager=True)(move_cursor_down)
         bindings.add(Keys.Up, eager=True)(move_cursor_up)
+        common.add_page_bindings(bindings, ic, pages=shortcut_page_size is None)
 
     if use_jk_keys:
         bindings.add("j", eager=True)(move_cursor_down)
@@ -273,18 +360,44 @@ def select(
 
     @bindings.add(Keys.ControlM, eager=True)
     def set_answer(event):
+        if not ic.choices:
+            return  # still waiting for the first asynchronous choice
+
         ic.is_answered = True
         event.app.exit(result=ic.get_pointed_at().value)
 
-    @bindings.add(Keys.Any)
-    def other(event):
-        """Disallow inserting other text."""
-
-    return Question(
-        Application(
-            layout=layout,
-            key_bindings=bindings,
-            style=merged_style,
-            **utils.used_kwargs(kwargs, Application.__init__),
-        )
+    if use_shortcuts and not use_search_filter:
+        # when searching, typed shortcut keys are part of the search string
+
+        @bindings.add(Keys.Any)
+        def select_choice(event):
+            """Point at the choice of a shortcut key on the current page,
+            ignore other text."""
+            index = ic.get_shortcut_index(event.key_sequence[0].key)
+            if index is not None:
+                ic.pointed_at = index
+
+    elif use_number_jump:
+
+        @bindings.add(Keys.Any)
+        def jump_to_number(event):
+            """Point at the choice with the typed number, ignore other text."""
+            key = event.key_sequence[0].key
+            if len(key) == 1 and key in string.digits:
+                ic.add_jump_digit(key)
+
+    elif not use_search_filter:
+
+        @bindings.add(Keys.Any)
+        def other(event):
+            """Disallow inserting other text."""
+
+    app: Application[Any] = Application(
+        layout=layout,
+        key_bindings=bindings,
+        style=merged_style,
+        **utils.used_kwargs(kwargs, Application.__init__),
     )
+    common.load_choices_in_background(app, ic)
+
+    return Question(app, reset=ic.reset)
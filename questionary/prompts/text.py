@@ -13,9 +13,11 @@ from questionary.constants import DEFAULT_QUESTION_PREFIX
 from questionary.constants import INSTRUCTION_MULTILINE
 from questionary.prompts.common import build_validator
 from questionary.question import Question
+from questionary.question import traceable
 from questionary.styles import merge_styles_default
 
 
+@traceable
 def text(
     message: str,
     default: str = "",
@@ -55,6 +57,8 @@ def text(
                   This can either be a function accepting the input and
                   returning a boolean, or an class reference to a
                   subclass of the prompt toolkit Validator class.
+                  A coroutine function (e.g. querying a database) runs in
+                  the background while typing, without blocking the input.
 
         qmark: Question prefix displayed in front of the question.
                By default this is a ``?``.
@@ -98,4 +102,7 @@ def text(
     )
     p.default_buffer.reset(Document(default))
 
-    return Question(p.app)
+    def reset() -> None:
+        p.default_buffer.reset(Document(default))
+
+    return Question(p.app, reset=reset)
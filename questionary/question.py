@@ -1,5 +1,15 @@
 import sys
+import time
+from contextlib import nullcontext
+from functools import wraps
+from typing import TYPE_CHECKING
 from typing import Any
+from typing import Callable
+from typing import ContextManager
+from typing import Optional
+from typing import TypeVar
+from typing import Union
+from typing import cast
 
 import prompt_toolkit.patch_stdout
 from prompt_toolkit import Application
@@ -7,6 +17,9 @@ from prompt_toolkit import Application
 from questionary import utils
 from questionary.constants import DEFAULT_KBI_MESSAGE
 
+if TYPE_CHECKING:
+    from questionary.tracing import QuestionTrace
+
 
 class Question:
     """A question to be prompted.
@@ -17,11 +30,85 @@ class Question:
     application: "Application[Any]"
     should_skip_question: bool
     default: Any
+    trace: Optional["QuestionTrace"]
 
-    def __init__(self, application: "Application[Any]") -> None:
+    def __init__(
+        self,
+        application: "Application[Any]",
+        reset: Optional[Callable[[], None]] = None,
+    ) -> None:
         self.application = application
         self.should_skip_question = False
         self.default = None
+        self._reset = reset
+        self._asked = False
+        self.trace = None
+
+    def reset(self) -> None:
+        """Restore the state of the question from before it was asked.
+
+        This happens automatically when a question is asked again, the
+        application is reused instead of creating the question again."""
+
+        if self._reset is not None:
+            self._reset()
+
+    def enable_tracing(
+        self, trace: Optional["QuestionTrace"] = None
+    ) -> "QuestionTrace":
+        """Record how long the phases of asking the question take.
+
+        Tracks rendering, key presses, creating the formatted text of the
+        prompt, validation and completion, every time the question is
+        asked from now on. Enabling tracing again returns the same trace.
+
+        To also record how long building the question takes, pass
+        ``trace=True`` to the function creating it instead, e.g.
+        ``questionary.select("Pick", choices, trace=True).trace``.
+
+        Example:
+            >>> import questionary
+            >>> question = questionary.select("Pick", choices=["a", "b"])
+            >>> trace = question.enable_tracing()
+            >>> question.ask()
+            >>> trace.write("pick.json", format="chrome")
+
+        Args:
+            trace: The trace to record the phases in, e.g. to collect the
+                   phases of several questions in one trace. By default a
+                   new trace is created.
+
+        Returns:
+            :class:`~questionary.tracing.QuestionTrace`: The trace, filled
+            while the question is asked.
+        """
+        if self.trace is None:
+            if trace is None:
+                from questionary.tracing import QuestionTrace
+
+                trace = QuestionTrace()
+
+            self.trace = trace
+            self.trace.install(self.application)
+        return self.trace
+
+    def asking(self) -> ContextManager[Any]:
+        """Context in which the question is asked.
+
+        Resets the question if it was asked before and, with tracing
+        enabled, records the time it is asked. Asking the question enters
+        it, as does a form asking the question in its own application.
+
+        Returns:
+            The context manager to run the application of the question in.
+        """
+        if self._asked:
+            self.reset()
+        self._asked = True
+
+        if self.trace is None:
+            return nullcontext()
+        return self.trace.span("ask", "question")
 
     async def ask_async(
         self, patch_stdout: bool = False, kbi_msg: str = DEFAULT_KBI_MESSAGE
@@ -82,11 +169,12 @@ class Question:
         if self.should_skip_question:
             return self.default
 
-        if patch_stdout:
-            with prompt_toolkit.patch_stdout.patch_stdout():
+        with self.asking():
+            if patch_stdout:
+                with prompt_toolkit.patch_stdout.patch_stdout():
+                    return self.application.run()
+            else:
                 return self.application.run()
-        else:
-            return self.application.run()
 
     def skip_if(self, condition: bool, default: Any = None) -> "Question":
         """Skip the question if flag is set and return the default instead.
@@ -122,13 +210,47 @@ class Question:
         if not utils.ACTIVATED_ASYNC_MODE:
             await utils.activate_prompt_toolkit_async_mode()
 
-        if patch_stdout:
-            with prompt_toolkit.patch_stdout.patch_stdout():
+        with self.asking():
+            if patch_stdout:
+                with prompt_toolkit.patch_stdout.patch_stdout():
+                    r = self.application.run_async()
+            else:
                 r = self.application.run_async()
-        else:
-            r = self.application.run_async()
 
-        if utils.is_prompt_toolkit_3():
-            return await r
-        else:
-            return await r.to_asyncio_future()  # type: ignore[attr-defined]
+            if utils.is_prompt_toolkit_3():
+                return await r
+            else:
+                return await r.to_asyncio_future()  # type: ignore[attr-defined]
+
+
+_Factory = TypeVar("_Factory", bound=Callable[..., Question])
+
+
+def traceable(factory: _Factory) -> _Factory:
+    """Add a ``trace`` argument to a function creating a question.
+
+    ``trace=True``, or a :class:`~questionary.tracing.QuestionTrace` to
+    record in, enables tracing of the question (see
+    :meth:`Question.enable_tracing`), including the time it took to build
+    the question.
+    """
+
+    @wraps(factory)
+    def build(
+        *args: Any, trace: Union[bool, "QuestionTrace"] = False, **kwargs: Any
+    ) -> Question:
+        if trace is False:
+            return factory(*args, **kwargs)
+
+        if trace is True:
+            from questionary.tracing import QuestionTrace
+
+            trace = QuestionTrace()
+
+        start = time.perf_counter()
+        question = factory(*args, **kwargs)
+        trace.add("build", "build", start, time.perf_counter())
+        question.enable_tracing(trace)
+        return question
+
+    return cast(_Factory, build)
@@ -1,15 +1,43 @@
+from collections import OrderedDict
 from typing import List
 from typing import Optional
+from typing import Tuple
 
 import prompt_toolkit.styles
+from prompt_toolkit.styles import BaseStyle
 
 from questionary.constants import DEFAULT_STYLE
 
+# maximum number of distinct style combinations kept by merge_styles_default
+MERGED_STYLES_CACHE_SIZE = 32
+
+# merged styles by the ids of the styles they were merged from
+_merged_styles: "OrderedDict[Tuple[int, ...], Tuple[Tuple[BaseStyle, ...], BaseStyle]]" = (
+    OrderedDict()
+)
+
 
 def merge_styles_default(styles: List[Optional[prompt_toolkit.styles.Style]]):
-    """Merge a list of styles with the Questionary default style."""
-    filtered_styles: list[prompt_toolkit.styles.BaseStyle] = [DEFAULT_STYLE]
+    """Merge a list of styles with the Questionary default style.
+
+    Merging the same style objects again returns the same merged style, so
+    prompts using the same theme share the attributes it already computed.
+    """
+    filtered_styles: list[BaseStyle] = [DEFAULT_STYLE]
     # prompt_toolkit's merge_styles works with ``None`` elements, but it's
     # type-hints says it doesn't.
     filtered_styles.extend([s for s in styles if s is not None])
-    return prompt_toolkit.styles.merge_styles(filtered_styles)
+
+    # styles are looked up by identity, the cached entry keeps them alive so
+    # their ids can not be reused by other objects
+    key = tuple(id(s) for s in filtered_styles)
+    cached = _merged_styles.get(key)
+    if cached is not None and all(a is b for a, b in zip(cached[0], filtered_styles)):
+        _merged_styles.move_to_end(key)
+        return cached[1]
+
+    merged = prompt_toolkit.styles.merge_styles(filtered_styles)
+    _merged_styles[key] = (tuple(filtered_styles), merged)
+    if len(_merged_styles) > MERGED_STYLES_CACHE_SIZE:
+        _merged_styles.popitem(last=False)
+    return merged
@@ -0,0 +1,290 @@
+import json
+import os
+import threading
+import time
+from collections import Counter
+from contextlib import contextmanager
+from typing import Any
+from typing import AsyncGenerator
+from typing import Callable
+from typing import Dict
+from typing import Iterable
+from typing import Iterator
+from typing import List
+from typing import NamedTuple
+from typing import Optional
+from typing import Union
+
+from prompt_toolkit.application import Application
+from prompt_toolkit.completion import CompleteEvent
+from prompt_toolkit.completion import Completer
+from prompt_toolkit.completion import Completion
+from prompt_toolkit.document import Document
+from prompt_toolkit.formatted_text import to_formatted_text
+from prompt_toolkit.layout import FormattedTextControl
+from prompt_toolkit.layout.controls import BufferControl
+from prompt_toolkit.validation import Validator
+
+from questionary import utils
+
+# formats of QuestionTrace.write
+TRACE_FORMATS = ("json", "chrome")
+
+
+class TraceEvent(NamedTuple):
+    """A phase of a traced question.
+
+    Args:
+        name: The name of the phase, e.g. ``"render"``.
+
+        category: The kind of the phase, e.g. ``"key"`` for key presses.
+
+        start: Seconds since the trace started.
+
+        duration: Seconds the phase took.
+
+        thread: Identifier of the thread the phase ran in.
+
+        args: Details about the phase, e.g. the number of tokens rendered.
+    """
+
+    name: str
+    category: str
+    start: float
+    duration: float
+    thread: int
+    args: Dict[str, Any]
+
+
+class QuestionTrace:
+    """Timings of the phases of a question, while it is asked.
+
+    Records the time spent building the question (if it was created with
+    ``trace=True``), asking it, rendering it (the first render separately),
+    handling key presses, creating the formatted text of the prompt (e.g.
+    the list of choices), validating and completing input. Counters sum up
+    renders, key presses, tokens (formatted text fragments) created,
+    validations and completions. Listeners are called with each phase as
+    soon as it is recorded.
+
+    This class should not be invoked directly, instead use
+    :meth:`Question.enable_tracing <questionary.Question.enable_tracing>`.
+    """
+
+    events: List[TraceEvent]
+    counters: "Counter[str]"
+
+    def __init__(self) -> None:
+        self.events = []
+        self.counters = Counter()
+        self._listeners: List[Callable[[TraceEvent], None]] = []
+        self._origin = time.perf_counter()
+
+    def add_listener(self, listener: Callable[[TraceEvent], None]) -> None:
+        """Call ``listener`` with every phase recorded from now on.
+
+        Example:
+            >>> def report_slow(event):
+            ...     if event.duration > 0.05:
+            ...         print(f"slow {event.name}: {event.duration:.3f}s")
+            >>> trace.add_listener(report_slow)
+        """
+        self._listeners.append(listener)
+
+    def add(
+        self,
+        name: str,
+        category: str,
+        start: float,
+        end: float,
+        **args: Any,
+    ) -> None:
+        """Record a phase between ``start`` and ``end`` (``perf_counter`` times)."""
+        event = TraceEvent(
+            name,
+            category,
+            start - self._origin,
+            end - start,
+            threading.get_ident(),
+            args,
+        )
+        self.events.append(event)
+        for listener in self._listeners:
+            listener(event)
+
+    @contextmanager
+    def span(self, name: str, category: str, **args: Any) -> Iterator[Dict[str, Any]]:
+        """Record the phase running in the ``with`` block.
+
+        Yields the details of the phase, which can be extended in the block.
+        """
+        start = time.perf_counter()
+        try:
+            yield args
+        finally:
+            self.add(name, category, start, time.perf_counter(), **args)
+
+    def install(self, application: "Application[Any]") -> None:
+        """Instrument the application of a question."""
+        render_start: Optional[float] = None
+        key_start: Optional[float] = None
+
+        def before_render(_: Any) -> None:
+            nonlocal render_start
+            render_start = time.perf_counter()
+
+        def after_render(_: Any) -> None:
+            if render_start is not None:
+                name = "render" if self.counters["renders"] else "first render"
+                self.add(name, "render", render_start, time.perf_counter())
+                self.counters["renders"] += 1
+
+        def before_key_press(_: Any) -> None:
+            nonlocal key_start
+            key_start = time.perf_counter()
+
+        def after_key_press(_: Any) -> None:
+            if key_start is not None:
+                self.add("key press", "key", key_start, time.perf_counter())
+                self.counters["key_presses"] += 1
+
+        application.before_render += before_render
+        application.after_render += after_render
+        application.key_processor.before_key_press += before_key_press
+        application.key_processor.after_key_press += after_key_press
+
+        for window in application.layout.find_all_windows():
+            control = window.content
+            if isinstance(control, FormattedTextControl) and callable(control.text):
+                control.text = self._traced_text(control.text, type(control).__name__)
+            elif isinstance(control, BufferControl):
+                buffer = control.buffer
+                if buffer.validator is not None:
+                    buffer.validator = _TracedValidator(buffer.validator, self)
+                if buffer.completer is not None:
+                    buffer.completer = _completer_class()(buffer.completer, self)
+
+    def _traced_text(self, get_text: Any, control: str) -> Any:
+        def text() -> Any:
+            with self.span("tokens", "tokens", control=control) as args:
+                fragments = to_formatted_text(get_text())
+                args["tokens"] = len(fragments)
+            self.counters["tokens"] += len(fragments)
+            return fragments
+
+        return text
+
+    def to_json(self) -> Dict[str, Any]:
+        """The trace as a JSON serializable dictionary."""
+        return {
+            "events": [event._asdict() for event in self.events],
+            "counters": dict(self.counters),
+        }
+
+    def to_chrome_trace(self) -> Dict[str, Any]:
+        """The trace in the Chrome trace event format.
+
+        It can be opened in ``chrome://tracing`` or https://ui.perfetto.dev."""
+        pid = os.getpid()
+        events: List[Dict[str, Any]] = [
+            {
+                "name": event.name,
+                "cat": event.category,
+                "ph": "X",
+                "ts": event.start * 1e6,
+                "dur": event.duration * 1e6,
+                "pid": pid,
+                "tid": event.thread,
+                "args": event.args,
+            }
+            for event in self.events
+        ]
+        if self.events:
+            end = max(event.start + event.duration for event in self.events)
+            events.append(
+                {
+                    "name": "counters",
+                    "ph": "C",
+                    "ts": end * 1e6,
+                    "pid": pid,
+                    "args": dict(self.counters),
+                }
+            )
+        return {"traceEvents": events, "displayTimeUnit": "ms"}
+
+    def write(self, path: Union[str, "os.PathLike[str]"], format: str = "json") -> None:
+        """Write the trace to a file.
+
+        Args:
+            path: The file to write.
+
+            format: ``"json"`` (see :meth:`to_json`) or ``"chrome"`` (see
+                    :meth:`to_chrome_trace`).
+        """
+        if format not in TRACE_FORMATS:
+            raise ValueError(
+                f"Unknown trace format '{format}', use one of "
+                f"{', '.join(TRACE_FORMATS)}."
+            )
+
+        data = self.to_json() if format == "json" else self.to_chrome_trace()
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(data, f, default=str)
+
+
+class _TracedValidator(Validator):
+    def __init__(self, validator: Validator, trace: QuestionTrace) -> None:
+        self.validator = validator
+        self.trace = trace
+
+    def validate(self, document: Document) -> None:
+        self.trace.counters["validations"] += 1
+        with self.trace.span("validate", "validation") as args:
+            args["valid"] = False
+            self.validator.validate(document)
+            args["valid"] = True
+
+    async def validate_async(self, document: Document) -> None:
+        self.trace.counters["validations"] += 1
+        with self.trace.span("validate async", "validation") as args:
+            args["valid"] = False
+            await self.validator.validate_async(document)
+            args["valid"] = True
+
+
+class _TracedCompleter(Completer):
+    def __init__(self, completer: Completer, trace: QuestionTrace) -> None:
+        self.completer = completer
+        self.trace = trace
+
+    def get_completions(
+        self, document: Document, complete_event: CompleteEvent
+    ) -> Iterable[Completion]:
+        self.trace.counters["completions"] += 1
+        with self.trace.span("complete", "completion") as args:
+            args["completions"] = 0
+            for completion in self.completer.get_completions(document, complete_event):
+                args["completions"] += 1
+                yield completion
+
+
+class _TracedAsyncCompleter(_TracedCompleter):
+    async def get_completions_async(
+        self, document: Document, complete_event: CompleteEvent
+    ) -> AsyncGenerator[Completion, None]:
+        self.trace.counters["completions"] += 1
+        with self.trace.span("complete async", "completion") as args:
+            args["completions"] = 0
+            async for completion in self.completer.get_completions_async(
+                document, complete_event
+            ):
+                args["completions"] += 1
+                yield completion
+
+
+def _completer_class() -> type:
+    # asynchronous completion works differently in prompt toolkit 2, where
+    # the completer's default implementation calls `get_completions`
+    if utils.is_prompt_toolkit_3():
+        return _TracedAsyncCompleter
+    return _TracedCompleter
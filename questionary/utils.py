@@ -1,9 +1,13 @@
 import inspect
+from functools import lru_cache
 from typing import Any
 from typing import Callable
 from typing import Dict
+from typing import FrozenSet
 from typing import List
+from typing import NamedTuple
 from typing import Set
+from typing import Tuple
 
 ACTIVATED_ASYNC_MODE = False
 
@@ -14,22 +18,55 @@ def is_prompt_toolkit_3() -> bool:
     return ptk_version.startswith("3.")
 
 
-def default_values_of(func: Callable[..., Any]) -> List[str]:
-    """Return all parameter names of ``func`` with a default value."""
+class SignatureInfo(NamedTuple):
+    """Parameter names of a callable, see :func:`signature_info`."""
+
+    arguments: Tuple[str, ...]
+    accepted: FrozenSet[str]
+    defaults: Tuple[str, ...]
+    required: FrozenSet[str]
+
 
-    signature = inspect.signature(func)
-    return [
+def _inspect_signature(func: Callable[..., Any]) -> SignatureInfo:
+    parameters = inspect.signature(func).parameters
+    arguments = tuple(parameters.keys())
+    defaults = tuple(
         k
-        for k, v in signature.parameters.items()
+        for k, v in parameters.items()
         if v.default is not inspect.Parameter.empty
         or v.kind != inspect.Parameter.POSITIONAL_OR_KEYWORD
-    ]
+    )
+    # all args without default values
+    required = arguments[: -len(defaults)] if defaults else arguments
+    return SignatureInfo(arguments, frozenset(arguments), defaults, frozenset(required))
+
+
+_cached_signature_info = lru_cache(maxsize=256)(_inspect_signature)
+
+
+def signature_info(func: Callable[..., Any]) -> SignatureInfo:
+    """Return the parameter names of ``func``.
+
+    The signature of a callable is only inspected once, as this is done for
+    every question created."""
+
+    try:
+        return _cached_signature_info(func)
+    except TypeError:
+        # unhashable callables can not be cached
+        return _inspect_signature(func)
+
+
+def default_values_of(func: Callable[..., Any]) -> List[str]:
+    """Return all parameter names of ``func`` with a default value."""
+
+    return list(signature_info(func).defaults)
 
 
 def arguments_of(func: Callable[..., Any]) -> List[str]:
     """Return the parameter names of the function ``func``."""
 
-    return list(inspect.signature(func).parameters.keys())
+    return list(signature_info(func).arguments)
 
 
 def used_kwargs(kwargs: Dict[str, Any], func: Callable[..., Any]) -> Dict[str, Any]:
@@ -43,24 +80,20 @@ def used_kwargs(kwargs: Dict[str, Any], func: Callable[..., Any]) -> Dict[str, A
         Subset of kwargs which are accepted by ``func``.
     """
 
-    possible_arguments = arguments_of(func)
+    possible_arguments = signature_info(func).accepted
 
     return {k: v for k, v in kwargs.items() if k in possible_arguments}
 
 
 def required_arguments(func: Callable[..., Any]) -> List[str]:
     """Return all arguments of a function that do not have a default value."""
-    defaults = default_values_of(func)
-    args = arguments_of(func)
-
-    if defaults:
-        args = args[: -len(defaults)]
-    return args  # all args without default values
+    info = signature_info(func)
+    return [arg for arg in info.arguments if arg in info.required]
 
 
 def missing_arguments(func: Callable[..., Any], argdict: Dict[str, Any]) -> Set[str]:
     """Return all arguments that are missing to call func."""
-    return set(required_arguments(func)) - set(argdict.keys())
+    return set(signature_info(func).required.difference(argdict.keys()))
 
 
 async def activate_prompt_toolkit_async_mode() -> None:
@@ -0,0 +1,262 @@
+"""Benchmark rendering and key handling of the prompts.
+
+The prompts are driven headlessly, like in the tests, with a pipe input and
+a dummy output. For every prompt and number of choices this measures
+
+* the time from creating the question until it is rendered for the first
+  time,
+* the time from sending a key until the prompt is rendered again and
+* the peak memory allocated while creating and answering the question
+  (in a separate run, as tracing allocations slows everything down).
+
+Run it from the root of the repository, the results are printed as JSON:
+
+    python -m scripts.benchmark --sizes 10 1000 --output benchmark.json
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import platform
+import statistics
+import sys
+import tempfile
+import time
+import tracemalloc
+from typing import Any
+from typing import Callable
+from typing import Dict
+from typing import List
+from typing import NamedTuple
+from typing import Optional
+
+import prompt_toolkit
+from prompt_toolkit.output import DummyOutput
+
+from questionary import Question
+from questionary import __version__
+from questionary import autocomplete
+from questionary import checkbox
+from questionary import path
+from questionary import select
+from tests.utils import KeyInputs
+from tests.utils import execute_with_input_pipe
+
+DEFAULT_SIZES = [10, 1000, 100000]
+
+# seconds to wait for a render before giving up, e.g. if a key got lost
+RENDER_TIMEOUT = 120
+
+
+class Scenario(NamedTuple):
+    """A prompt to benchmark and the keys sent to it."""
+
+    create: Callable[..., Question]
+    # keys sent one by one while measuring, the last one has to answer
+    keys: List[str]
+
+
+def _choices(count: int) -> List[str]:
+    return [f"choice {i:06d}" for i in range(count)]
+
+
+# typed into autocomplete and path, the last characters narrow the matches
+_TYPED = "choice 0001"
+
+
+def _select(count: int, directory: str) -> Scenario:
+    return Scenario(
+        lambda **kwargs: select("Select", _choices(count), **kwargs),
+        [KeyInputs.DOWN] * 3 + [KeyInputs.UP] * 2 + [KeyInputs.ENTER],
+    )
+
+
+def _checkbox(count: int, directory: str) -> Scenario:
+    return Scenario(
+        lambda **kwargs: checkbox("Checkbox", _choices(count), **kwargs),
+        [KeyInputs.SPACE, KeyInputs.DOWN] * 3 + [KeyInputs.ENTER],
+    )
+
+
+def _fuzzy_search(count: int, directory: str) -> Scenario:
+    return Scenario(
+        lambda **kwargs: select(
+            "Search",
+            _choices(count),
+            use_search_filter=True,
+            use_fuzzy_search=True,
+            use_jk_keys=False,
+            virtualize=True,
+            **kwargs,
+        ),
+        # single digits match in the middle of many choices
+        ["9", "9", "1"]
+        + [KeyInputs.DOWN] * 3
+        + [KeyInputs.BACK] * 2
+        + [KeyInputs.ENTER],
+    )
+
+
+def _autocomplete(count: int, directory: str) -> Scenario:
+    return Scenario(
+        lambda **kwargs: autocomplete("Autocomplete", _choices(count), **kwargs),
+        list(_TYPED) + [KeyInputs.BACK] * 2 + [KeyInputs.ENTER],
+    )
+
+
+def _path(count: int, directory: str) -> Scenario:
+    return Scenario(
+        lambda **kwargs: path("Path", os.path.join(directory, ""), **kwargs),
+        # the first enter closes the completion menu, if it is open
+        list(_TYPED) + [KeyInputs.ENTER + KeyInputs.ENTER],
+    )
+
+
+SCENARIOS: Dict[str, Callable[[int, str], Scenario]] = {
+    "select": _select,
+    "checkbox": _checkbox,
+    "fuzzy_search": _fuzzy_search,
+    "autocomplete": _autocomplete,
+    "path": _path,
+}
+
+
+def _run(scenario: Scenario, timings: Optional[Dict[str, Any]] = None) -> None:
+    """Answer the question of a scenario, recording timings if requested."""
+
+    def run(inp) -> None:
+        loop = asyncio.new_event_loop()
+        rendered = asyncio.Event()
+
+        start = time.perf_counter()
+        question = scenario.create(input=inp, output=DummyOutput())
+
+        def after_render(_) -> None:
+            rendered.set()
+
+        question.application.after_render += after_render
+
+        async def answer() -> None:
+            task = asyncio.ensure_future(question.unsafe_ask_async())
+
+            await asyncio.wait_for(rendered.wait(), RENDER_TIMEOUT)
+            first_render = time.perf_counter() - start
+
+            keystrokes = []
+            for key in scenario.keys[:-1]:
+                rendered.clear()
+                sent = time.perf_counter()
+                inp.send_text(key)
+                await asyncio.wait_for(rendered.wait(), RENDER_TIMEOUT)
+                keystrokes.append(time.perf_counter() - sent)
+
+            inp.send_text(scenario.keys[-1])
+            await asyncio.wait_for(task, RENDER_TIMEOUT)
+
+            if timings is not None:
+                timings["first_render"] = first_render
+                timings["keystrokes"] = keystrokes
+
+        try:
+            loop.run_until_complete(answer())
+        finally:
+            loop.close()
+
+    execute_with_input_pipe(run)
+
+
+def _ms(seconds: float) -> float:
+    return round(seconds * 1000, 3)
+
+
+def benchmark(name: str, count: int, repeat: int) -> Dict[str, Any]:
+    """Benchmark one prompt with ``count`` choices."""
+
+    with tempfile.TemporaryDirectory() as directory:
+        # the path prompt completes the files of this directory
+        if name == "path":
+            for choice in _choices(count):
+                open(os.path.join(directory, choice), "w").close()
+
+        scenario = SCENARIOS[name](count, directory)
+
+        first_renders = []
+        keystrokes: List[float] = []
+        for _ in range(repeat):
+            timings: Dict[str, Any] = {}
+            _run(scenario, timings)
+            first_renders.append(timings["first_render"])
+            keystrokes.extend(timings["keystrokes"])
+
+        tracemalloc.start()
+        try:
+            _run(scenario)
+            _, peak_memory = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+
+    keystrokes.sort()
+    return {
+        "prompt": name,
+        "choices": count,
+        "first_render_ms": _ms(statistics.median(first_renders)),
+        "keystroke_ms": {
+            "median": _ms(statistics.median(keystrokes)),
+            "p95": _ms(keystrokes[int(0.95 * (len(keystrokes) - 1))]),
+            "max": _ms(keystrokes[-1]),
+        },
+        "peak_memory_kb": round(peak_memory / 1024),
+    }
+
+
+def main(argv: Optional[List[str]] = None) -> Dict[str, Any]:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--prompts",
+        nargs="+",
+        choices=list(SCENARIOS),
+        default=list(SCENARIOS),
+        help="Prompts to benchmark.",
+    )
+    parser.add_argument(
+        "--sizes",
+        nargs="+",
+        type=int,
+        default=DEFAULT_SIZES,
+        help="Numbers of choices to benchmark every prompt with.",
+    )
+    parser.add_argument(
+        "--repeat",
+        type=int,
+        default=1,
+        help="How often every prompt is answered to measure timings.",
+    )
+    parser.add_argument(
+        "--output", help="File to write the results to, instead of stdout."
+    )
+    args = parser.parse_args(argv)
+
+    report = {
+        "questionary": __version__,
+        "prompt_toolkit": prompt_toolkit.__version__,
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "results": [
+            benchmark(name, count, args.repeat)
+            for name in args.prompts
+            for count in args.sizes
+        ],
+    }
+
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(report, f, indent=2)
+    else:
+        json.dump(report, sys.stdout, indent=2)
+        print()
+    return report
+
+
+if __name__ == "__main__":
+    main()
@@ -1,9 +1,15 @@
 # -*- coding: utf-8 -*-
 
+import time
+
 import pytest
+from prompt_toolkit.completion import CompleteEvent
+from prompt_toolkit.document import Document
 
+from questionary.prompts.autocomplete import IndexedWordCompleter
 from tests.utils import KeyInputs
 from tests.utils import feed_cli_with_input
+from tests.utils import prompt_toolkit_version
 
 
 def test_autocomplete():
@@ -98,3 +104,105 @@ def test_match_middle_autocomplete():
         "autocomplete", message, texts, **kwargs, match_middle=True
     )
     assert result == "python2"
+
+
+@pytest.mark.skipif(
+    prompt_toolkit_version < (3, 0, 0), reason="requires prompt toolkit >= 3.0"
+)
+def test_async_choices_provider_autocomplete():
+    async def choices():
+        yield ["python3"]
+        yield ["python2", "python123"]
+
+    message = "Pick your poison"
+    texts = ["p", KeyInputs.TAB + KeyInputs.TAB + KeyInputs.ENTER + "\r"]
+    result, cli = feed_cli_with_input(
+        "autocomplete", message, texts, sleep_time=0.1, choices=choices
+    )
+    assert result == "python2"
+
+
+def test_indexed_autocomplete():
+    message = "Pick your poison"
+    texts = ["p", KeyInputs.TAB + KeyInputs.TAB + KeyInputs.ENTER + "\r"]
+    kwargs = {
+        "choices": ["python3", "c++", "python2", "cpython"],
+    }
+    result, cli = feed_cli_with_input(
+        "autocomplete", message, texts, use_index=True, **kwargs
+    )
+    # prefix matches are sorted alphabetically
+    assert result == "python3"
+
+
+def test_indexed_completer_matches():
+    completer = IndexedWordCompleter(
+        ["python3", "Cpython", "c++", "python2", "jython"], max_completions=10
+    )
+
+    def completions(text):
+        return [
+            c.text for c in completer.get_completions(Document(text), CompleteEvent())
+        ]
+
+    assert completions("PY") == ["python2", "python3", "Cpython"]
+    assert completions("thon") == ["Cpython", "jython", "python2", "python3"]
+    assert completions("x") == []
+
+    completer.match_middle = False
+    assert completions("py") == ["python2", "python3"]
+
+    completer.max_completions = 1
+    assert completions("py") == ["python2"]
+
+
+def test_indexed_completer_follows_growing_choices():
+    choices = ["python3"]
+    completer = IndexedWordCompleter(choices, max_completions=10)
+
+    def completions(text):
+        return [
+            c.text for c in completer.get_completions(Document(text), CompleteEvent())
+        ]
+
+    assert completions("py") == ["python3"]
+    choices.append("pypy")
+    assert completions("py") == ["pypy", "python3"]
+    choices[0] = "jython"
+    assert completions("py") == ["pypy"]
+
+
+def test_indexed_completer_keeps_index_of_equal_choices():
+    completer = IndexedWordCompleter(
+        lambda: ["python3", "python2", "jython"], max_completions=10
+    )
+
+    indexes = set()
+    for text in ["p", "py", "pyt"]:
+        completions = completer.get_completions(Document(text), CompleteEvent())
+        assert [c.text for c in completions] == ["python2", "python3"]
+        indexes.add(id(completer._sorted_keys))
+
+    # a new list with the same choices does not rebuild the index
+    assert len(indexes) == 1
+
+
+@pytest.mark.skipif(
+    prompt_toolkit_version < (3, 0, 0), reason="requires prompt toolkit >= 3.0"
+)
+def test_autocomplete_in_thread():
+    def choices():
+        time.sleep(0.05)
+        return ["python3", "python2"]
+
+    message = "Pick your poison"
+    texts = ["p", KeyInputs.TAB + KeyInputs.TAB, KeyInputs.ENTER + "\r"]
+    result, cli = feed_cli_with_input(
+        "autocomplete",
+        message,
+        texts,
+        sleep_time=0.5,
+        choices=choices,
+        complete_in_thread=True,
+    )
+    assert result == "python2"
@@ -418,6 +418,24 @@ def test_does_not_wrap_up_when_cycle_list_false():
     assert result == ["foo"]
 
 
+def test_home_and_end_skip_disabled_choices():
+    message = "Foo message"
+    kwargs = {
+        "choices": [Choice("foo", disabled=True), "bar", "bazz", Separator()],
+    }
+    text = (
+        KeyInputs.END
+        + KeyInputs.SPACE
+        + KeyInputs.HOME
+        + KeyInputs.SPACE
+        + KeyInputs.ENTER
+        + "\r"
+    )
+
+    result, cli = feed_cli_with_input("checkbox", message, text, **kwargs)
+    assert result == ["bar", "bazz"]
+
+
 def test_filter_custom_match():
     message = "Foo message"
     kwargs = {"choices": ["abc", "def", "ghi", "Ghi", "jkl"]}
@@ -436,3 +454,45 @@ def test_filter_custom_match():
         **kwargs,
     )
     assert result == ["Ghi"]
+
+
+def test_checkbox_virtualized_long_list():
+    message = "Foo message"
+    kwargs = {"choices": [str(i) for i in range(1000)], "virtualize": True}
+    text = KeyInputs.UP + KeyInputs.SPACE + KeyInputs.ENTER + "\r"
+
+    result, cli = feed_cli_with_input("checkbox", message, text, **kwargs)
+    assert result == ["999"]
+
+
+def test_checkbox_unhashable_values():
+    message = "Foo message"
+    kwargs = {
+        "choices": [
+            Choice("foo", value={"id": 1}),
+            Choice("bar", value={"id": 2}),
+            Choice("baz", value=[3]),
+        ]
+    }
+    text = "i" + KeyInputs.DOWN + KeyInputs.SPACE + KeyInputs.ENTER + "\r"
+
+    result, cli = feed_cli_with_input("checkbox", message, text, **kwargs)
+    assert result == [{"id": 1}, [3]]
+
+
+def test_checkbox_lazy_choices_select_all():
+    message = "Foo message"
+    kwargs = {"choices": (str(i) for i in range(500))}
+    text = "a" + KeyInputs.ENTER + "\r"
+
+    result, cli = feed_cli_with_input("checkbox", message, text, **kwargs)
+    assert result == [str(i) for i in range(500)]
+
+
+def test_checkbox_lazy_choices_preselected():
+    message = "Foo message"
+    kwargs = {"choices": iter(["foo", "bar", Choice("bazz", checked=True)])}
+    text = KeyInputs.SPACE + KeyInputs.ENTER + "\r"
+
+    result, cli = feed_cli_with_input("checkbox", message, text, **kwargs)
+    assert result == ["foo", "bazz"]
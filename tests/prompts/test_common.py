@@ -1,18 +1,28 @@
 import asyncio
 from unittest.mock import Mock
 from unittest.mock import call
+from unittest.mock import patch
 
 import pytest
+from prompt_toolkit.completion import CompleteEvent
+from prompt_toolkit.completion import Completion
 from prompt_toolkit.document import Document
 from prompt_toolkit.input.defaults import create_pipe_input
+from prompt_toolkit.key_binding import KeyBindings
+from prompt_toolkit.keys import Keys
 from prompt_toolkit.output import DummyOutput
 from prompt_toolkit.styles import Attrs
 from prompt_toolkit.validation import ValidationError
 from prompt_toolkit.validation import Validator
 
 from questionary import Choice
+from questionary import ChoiceTable
+from questionary import Separator
 from questionary.prompts import common
+from questionary.prompts.common import DebouncedCompleter
+from questionary.prompts.common import FuzzySearchIndex
 from questionary.prompts.common import InquirerControl
+from questionary.prompts.common import SelectedOptions
 from questionary.prompts.common import build_validator
 from questionary.prompts.common import print_formatted_text
 from tests.utils import prompt_toolkit_version
@@ -27,6 +37,122 @@ def test_to_many_choices_for_shortcut_assignment():
     )
 
 
+def test_number_jump_adds_up_digits_typed_in_time(monkeypatch):
+    ic = InquirerControl([str(i) for i in range(1, 200)], use_number_jump=True)
+    now = 100.0
+    monkeypatch.setattr(common.time, "monotonic", lambda: now)
+
+    for digit in "127":
+        ic.add_jump_digit(digit)
+    assert ic.get_pointed_at().title == "127"
+
+    # a digit beyond the last choice starts a new number
+    ic.add_jump_digit("5")
+    assert ic.get_pointed_at().title == "5"
+
+    now += common.NUMBER_JUMP_TIMEOUT + 1
+    ic.add_jump_digit("3")
+    assert ic.get_pointed_at().title == "3"
+
+
+def test_number_jump_skips_separators_and_disabled_choices():
+    ic = InquirerControl(
+        ["a", Separator(), Choice("b", disabled=True), "c"], use_number_jump=True
+    )
+
+    ic.add_jump_digit("2")
+    assert ic.get_pointed_at().title == "c"
+    assert ("class:highlighted", "2) c") in ic._get_choice_tokens()
+
+
+def test_skip_table_moves_over_unselectable_choices():
+    choices = ["a", Separator(), Choice("b", disabled=True), "c", Separator()]
+    ic = InquirerControl(choices)
+
+    ic.select_next_valid()
+    assert ic.get_pointed_at().title == "c"
+    ic.select_next_valid(cycle=False)
+    assert ic.get_pointed_at().title == "c"
+    ic.select_next_valid()
+    assert ic.get_pointed_at().title == "a"
+    ic.select_previous_valid(cycle=False)
+    assert ic.get_pointed_at().title == "a"
+    ic.select_previous_valid()
+    assert ic.get_pointed_at().title == "c"
+
+
+def test_skip_table_grows_with_lazy_choices():
+    def choices():
+        yield "a"
+        for i in range(1000):
+            yield Choice(str(i), disabled=True)
+        yield "b"
+        yield Separator()
+
+    ic = InquirerControl(choices())
+    ic.select_next_valid()
+    assert ic.get_pointed_at().title == "b"
+    assert not ic.all_choices_loaded
+
+    ic.select_next_valid()
+    assert ic.get_pointed_at().title == "a"
+
+
+def test_choices_have_no_instance_dictionary():
+    assert not hasattr(Choice("foo"), "__dict__")
+    assert not hasattr(Separator(), "__dict__")
+
+
+def test_choice_table_creates_choices_of_rows():
+    table = ChoiceTable(["a", "b", "c"], values=[1, 2, 3], disabled=[None, "no", None])
+
+    assert len(table) == 3
+    assert table[1].title == "b"
+    assert table[1].value == 2
+    assert table[1].disabled == "no"
+    assert [c.value for c in table[::2]] == [1, 3]
+
+    with pytest.raises(ValueError):
+        ChoiceTable(["a", "b"], values=[1])
+
+
+def test_inquirer_control_uses_choice_table_directly():
+    table = ChoiceTable(
+        [str(i) for i in range(100_000)],
+        disabled=[i < 3 for i in range(100_000)],
+    )
+    ic = InquirerControl(table, default="7", virtualize=True)
+
+    assert ic.choices is table
+    assert ic.get_pointed_at().title == "3"
+    assert list(ic.selected_options) == ["7"]
+    ic.select_previous_valid()
+    assert ic.get_pointed_at().title == "99999"
+
+
+@pytest.mark.parametrize("use_fuzzy_search", [False, True])
+def test_searching_a_choice_table_creates_only_matching_choices(use_fuzzy_search):
+    created = []
+
+    class CountingTable(ChoiceTable):
+        def __getitem__(self, index):
+            created.append(index)
+            return super().__getitem__(index)
+
+    table = CountingTable([f"item {i}" for i in range(1000)])
+    ic = InquirerControl(table, virtualize=True, use_fuzzy_search=use_fuzzy_search)
+
+    found = set()
+    for search_filter in ["item 99", "item 999"]:
+        ic.search_filter = search_filter
+        found.update(c.title for c in ic.filtered_choices)
+
+    assert "item 999" in found
+    assert len(found) < 100
+    # besides the pointed at first row
+    assert {table.titles[i] for i in created} - {"item 0"} == found
+
+
 def test_validator_bool_function():
     def validate(t):
         return len(t) == 3
@@ -322,3 +448,304 @@ def test_prompt_show_description():
     ]
     assert ic.pointed_at == 1
     assert ic._get_choice_tokens() == expected_tokens
+
+
+def test_filtered_choices_are_cached_per_search_string():
+    ic = InquirerControl(["abc", "abd", "xyz", "Abe"])
+
+    ic.add_search_character("a")
+    first = ic.filtered_choices
+    assert [c.title for c in first] == ["abc", "abd", "Abe"]
+    assert ic.filtered_choices is first
+
+    ic.add_search_character("b")
+    ic.add_search_character("d")
+    assert [c.title for c in ic.filtered_choices] == ["abd"]
+
+    ic.add_search_character(Keys.Backspace)
+    ic.add_search_character(Keys.Backspace)
+    assert ic.filtered_choices is first
+
+
+def test_filtered_choices_custom_matcher_rescans():
+    calls = []
+
+    def matcher(search: str, choice: Choice) -> bool:
+        calls.append(choice.title)
+        return search in choice.title
+
+    ic = InquirerControl(["ab", "ba", "cc"], search_matcher=matcher)
+
+    ic.add_search_character("a")
+    assert [c.title for c in ic.filtered_choices] == ["ab", "ba"]
+    ic.add_search_character("b")
+    assert [c.title for c in ic.filtered_choices] == ["ab"]
+    assert len(calls) == 6
+
+    # reading the filtered choices again does not call the matcher
+    ic.filtered_choices
+    assert len(calls) == 6
+
+
+def test_virtualized_choice_tokens_only_render_viewport():
+    ic = InquirerControl([str(i) for i in range(100)], virtualize=True)
+    height = ic._get_viewport_height()
+
+    tokens = ic._get_choice_tokens()
+    rendered = [t[1] for t in tokens if t[0] in ("class:highlighted", "class:text")]
+    assert "0" in rendered
+    assert str(height - 1) in rendered
+    assert str(height) not in rendered
+    assert tokens[-1] == ("class:text", "  ↓ {} more".format(100 - height))
+
+    ic.pointed_at = 99
+    tokens = ic._get_choice_tokens()
+    assert tokens[0] == ("class:text", "  ↑ {} more".format(100 - height))
+    assert ("class:highlighted", "99") in tokens
+    assert ("class:text", "  ↓ 0 more") not in tokens
+
+    # moving up inside the viewport does not scroll the list
+    ic.pointed_at = 98
+    assert ic._get_choice_tokens()[0] == tokens[0]
+
+
+def test_virtualized_choice_tokens_short_list_unchanged():
+    choices = ["a", "b", "c"]
+    assert (
+        InquirerControl(choices, virtualize=True)._get_choice_tokens()
+        == InquirerControl(choices)._get_choice_tokens()
+    )
+
+
+def test_selected_options_behave_like_ordered_list():
+    selected = SelectedOptions(["b", {"x": 1}, "a"])
+
+    assert "a" in selected
+    assert {"x": 1} in selected
+    assert "c" not in selected
+    assert selected == ["b", {"x": 1}, "a"]
+
+    selected.append("b")
+    assert len(selected) == 3
+
+    selected.remove({"x": 1})
+    selected.append({"x": 1})
+    assert selected == ["b", "a", {"x": 1}]
+
+    with pytest.raises(ValueError):
+        selected.remove("c")
+
+
+@pytest.mark.skipif(
+    prompt_toolkit_version < (3, 0, 0), reason="requires prompt toolkit >= 3.0"
+)
+def test_loading_indicator_while_async_choices_arrive():
+    batches = asyncio.Queue()
+
+    async def choices():
+        while True:
+            batch = await batches.get()
+            if batch is None:
+                return
+            yield batch
+
+    ic = InquirerControl(choices)
+    assert ic.is_loading
+    assert ic._get_choice_tokens() == [("class:instruction", "  Loading…")]
+
+    async def run():
+        loader = asyncio.ensure_future(ic.load_choices_async())
+        await batches.put(["a", "b"])
+        await asyncio.sleep(0)
+        assert [c.title for c in ic.choices] == ["a", "b"]
+        assert ic._get_choice_tokens()[-1] == ("class:instruction", "  Loading…")
+
+        await batches.put(None)
+        await loader
+
+    asyncio.run(run())
+    assert not ic.is_loading
+    assert ("class:instruction", "  Loading…") not in ic._get_choice_tokens()
+
+
+def test_fuzzy_search_ranks_substring_matches_first():
+    index = FuzzySearchIndex(["Pizza", "pza", "xpza", "p z a", "zap"])
+
+    assert index.search("pza") == [1, 2, 0, 3]
+    assert index.search("PZ") == [1, 2, 0, 3]
+    # narrowing the result of a previous search
+    assert index.search("pza", candidates=[0, 2, 4]) == [2, 0]
+
+
+def test_fuzzy_search_order_does_not_depend_on_earlier_searches():
+    index = FuzzySearchIndex(["xab", "a-b", "ab", "yab", "a--b"] + ["zzz"] * 40)
+    expected = [2, 0, 3, 1, 4]
+
+    assert index.search("ab") == expected
+    # narrowing down earlier results, which are in a different order
+    assert index.search("ab", candidates=[4, 3, 2, 1, 0]) == expected
+    assert index.search("ab", candidates=list(reversed(range(45)))) == expected
+
+
+def test_fuzzy_search_limits_the_ranked_matches():
+    index = FuzzySearchIndex(["ab", "xab", "abc", "a-b", "abd", "yab"])
+    expected = [0, 2, 4, 1, 5, 3]
+
+    assert index.search("ab") == expected
+    # enough prefix matches
+    assert index.search("ab", limit=2) == [0, 2]
+    # enough titles containing the search string
+    assert index.search("ab", limit=4) == [0, 2, 4, 1]
+    # all titles were looked at
+    assert index.search("ab", limit=10) == expected
+    assert index.search("ab", candidates=[5, 3], limit=1) == [5]
+
+
+def test_fuzzy_search_ranks_more_matches_as_the_pointer_moves():
+    choices = [f"item {i}" for i in range(200)] + ["an item"]
+    ic = InquirerControl(choices, virtualize=True, use_fuzzy_search=True)
+    for char in "item":
+        ic.add_search_character(char)
+
+    ranked = len(ic.filtered_choices)
+    assert ranked < len(choices)
+    assert not ic._filter_cache[-1].complete
+
+    for _ in range(ranked + 10):
+        ic.select_next()
+    assert ic.get_pointed_at().title == f"item {ranked + 10}"
+
+    ic.pointed_at = 0
+    ic.select_previous()
+    assert ic.get_pointed_at().title == "an item"
+    assert [c.title for c in ic.filtered_choices] == choices
+
+
+def test_fuzzy_search_index_is_built_with_the_control():
+    ic = InquirerControl(["Pizza", "Pasta"], use_fuzzy_search=True)
+
+    assert ic._fuzzy_index is not None
+    assert len(ic._fuzzy_index) == 2
+
+
+def test_fuzzy_search_match_positions():
+    assert FuzzySearchIndex.match_positions("zz", "Pizza") == [2, 3]
+    assert FuzzySearchIndex.match_positions("pza", "Pizza") == [0, 2, 4]
+    assert FuzzySearchIndex.match_positions("pzb", "Pizza") is None
+
+
+def test_fuzzy_search_highlights_matched_characters():
+    ic = InquirerControl(["Pizza", "Pasta"], use_fuzzy_search=True)
+    ic.add_search_character("p")
+    ic.add_search_character("z")
+
+    assert [c.title for c in ic.filtered_choices] == ["Pizza"]
+    assert ic._get_choice_tokens()[-4:] == [
+        ("class:highlighted class:search_match", "P"),
+        ("class:highlighted", "i"),
+        ("class:highlighted class:search_match", "z"),
+        ("class:highlighted", "za"),
+    ]
+
+
+@pytest.mark.skipif(
+    prompt_toolkit_version < (3, 0, 0), reason="requires prompt toolkit >= 3.0"
+)
+def test_debounced_completer_skips_outdated_requests():
+    completer = Mock()
+    completer.get_completions.return_value = [Completion("python")]
+    debounced = DebouncedCompleter(completer, delay=0.01)
+
+    async def completions(document, buffer_text, completion_requested=False):
+        app = Mock()
+        app.current_buffer.text = buffer_text
+        event = CompleteEvent(completion_requested=completion_requested)
+        with patch.object(common, "get_app", return_value=app):
+            return [c async for c in debounced.get_completions_async(document, event)]
+
+    document = Document("py")
+    assert asyncio.run(completions(document, "py")) == [Completion("python")]
+    # the user typed on while waiting
+    assert asyncio.run(completions(document, "pyt")) == []
+    assert completer.get_completions.call_count == 1
+
+
+def test_search_filter_bindings_only_add_characters():
+    ic = InquirerControl(["foo", "bar"])
+    bindings = KeyBindings()
+    common.add_search_filter_bindings(bindings, ic)
+
+    # a single binding for all characters, plus backspace
+    assert len(bindings.bindings) == 2
+    search_filter = bindings.get_bindings_for_keys(("x",))[0].handler
+
+    for key in ["f", Keys.ControlI, " ", "\n", Keys.Left, "o"]:
+        search_filter(Mock(key_sequence=[Mock(key=key)]))
+
+    assert ic.search_filter == "fo"
+
+
+def test_build_validator_with_coroutine_function():
+    async def validate(text):
+        await asyncio.sleep(0)
+        return text == "ok" or "Not ok"
+
+    validator = common.build_validator(validate)
+    assert isinstance(validator, common.DebouncedValidator)
+
+    validator.validate(Document("ok"))
+    with pytest.raises(ValidationError, match="Not ok"):
+        validator.validate(Document("nok"))
+
+
+def test_debounced_validator_drops_outdated_input():
+    calls = []
+
+    async def validate(text):
+        calls.append(text)
+        return False
+
+    validator = common.DebouncedValidator(validate, delay=0.01)
+    app = Mock()
+
+    with patch.object(common, "get_app", return_value=app):
+        app.current_buffer.text = "new"
+        asyncio.run(validator.validate_async(Document("old")))
+        assert calls == []
+
+        app.current_buffer.text = "old"
+        with pytest.raises(ValidationError):
+            asyncio.run(validator.validate_async(Document("old")))
+        assert calls == ["old"]
+
+    # the verdict of the background validation is reused when submitting
+    with pytest.raises(ValidationError):
+        validator.validate(Document("old"))
+    assert calls == ["old"]
+
+
+def test_debounced_validator_cancels_superseded_validation():
+    cancelled = []
+
+    async def validate(text):
+        try:
+            await asyncio.sleep(10)
+        except asyncio.CancelledError:
+            cancelled.append(text)
+            raise
+
+    validator = common.DebouncedValidator(validate, delay=0.01)
+    app = Mock()
+    app.current_buffer.text = "old"
+
+    async def type_new_text():
+        await asyncio.sleep(0.05)
+        app.current_buffer.text = "new"
+
+    async def run():
+        await asyncio.gather(validator.validate_async(Document("old")), type_new_text())
+
+    with patch.object(common, "get_app", return_value=app):
+        asyncio.run(run())
+
+    assert cancelled == ["old"]
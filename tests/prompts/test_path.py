@@ -1,10 +1,14 @@
 # -*- coding: utf-8 -*-
+import os
+from unittest.mock import patch
+
 import prompt_toolkit
 import pytest
 from prompt_toolkit.completion import Completer
 from prompt_toolkit.completion import Completion
 from prompt_toolkit.output import DummyOutput
 
+from questionary.prompts.path import DirectoryListingCache
 from questionary.prompts.path import path as path_prompt
 from tests.utils import KeyInputs
 from tests.utils import execute_with_input_pipe
@@ -182,3 +186,39 @@ def test_complete_custom_completer():
         "path", message, texts, 0.1, completer=CustomCompleter()
     )
     assert result == "baz" + test_path
+
+
+def test_directory_listing_cache(path_completion_tree):
+    cache = DirectoryListingCache(ttl=0)
+    directory = str(path_completion_tree / "foo")
+
+    assert cache.entries(directory) == [
+        ("baz.any", False),
+        ("buz", True),
+        ("foobar.any", False),
+    ]
+    assert cache.entries_with_prefix(directory, "b") == [
+        ("baz.any", False),
+        ("buz", True),
+    ]
+
+    with patch.object(DirectoryListingCache, "_scan") as scan:
+        # unchanged directories are not read again
+        cache.entries(directory)
+        assert not scan.called
+
+        os.utime(directory, ns=(0, 0))
+        cache.entries(directory)
+        assert scan.called
+
+
+def test_directory_listing_cache_evicts_least_recently_used(path_completion_tree):
+    cache = DirectoryListingCache(max_size=2)
+    foo, bar, baz = (str(path_completion_tree / d) for d in ("foo", "bar", "baz"))
+
+    cache.entries(foo)
+    cache.entries(bar)
+    cache.entries(foo)
+    cache.entries(baz)
+
+    assert list(cache._listings) == [foo, baz]
@@ -96,6 +96,61 @@ def test_to_many_choices():
         feed_cli_with_input("rawselect", message, text, **kwargs)
 
 
+def test_shortcut_pages():
+    message = "Foo message"
+    choices = [f"choice-{i}" for i in range(100)]
+    text = KeyInputs.PAGEDOWN + KeyInputs.PAGEDOWN + "3" + KeyInputs.ENTER + "\r"
+
+    result, cli = feed_cli_with_input(
+        "rawselect", message, text, choices=choices, shortcut_page_size=10
+    )
+    assert result == "choice-22"
+
+
+def test_shortcut_pages_wrap_around():
+    message = "Foo message"
+    choices = [f"choice-{i}" for i in range(100)]
+    text = KeyInputs.PAGEUP + "z" + KeyInputs.ENTER + "\r"
+
+    result, cli = feed_cli_with_input(
+        "rawselect", message, text, choices=choices, shortcut_page_size=36
+    )
+    # the last page holds choices 72 to 99, "z" is not assigned on it
+    assert result == "choice-72"
+
+
+def test_shortcut_pages_skip_separators():
+    message = "Foo message"
+    choices = ["foo", "bar", Separator(), Separator(), "bazz"]
+    text = KeyInputs.PAGEDOWN + "1" + KeyInputs.ENTER + "\r"
+
+    result, cli = feed_cli_with_input(
+        "rawselect", message, text, choices=choices, shortcut_page_size=2
+    )
+    assert result == "bazz"
+
+
+def test_invalid_shortcut_page_size():
+    message = "Foo message"
+    text = "1" + KeyInputs.ENTER + "\r"
+
+    with pytest.raises(ValueError):
+        feed_cli_with_input(
+            "rawselect", message, text, choices=["foo"], shortcut_page_size=37
+        )
+
+
+def test_number_jump():
+    message = "Foo message"
+    choices = [f"choice-{i}" for i in range(1, 201)]
+    text = "1" + "2" + "7" + KeyInputs.ENTER + "\r"
+
+    result, cli = feed_cli_with_input(
+        "rawselect", message, text, choices=choices, use_number_jump=True
+    )
+    assert result == "choice-127"
+
+
 def test_select_random_input():
     message = "Foo message"
     kwargs = {"choices": ["foo", "bazz"]}
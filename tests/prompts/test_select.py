@@ -5,6 +5,7 @@ import pytest
 from prompt_toolkit.output import DummyOutput
 
 from questionary import Choice
+from questionary import ChoiceTable
 from questionary import Separator
 from questionary import select
 from questionary.prompts.common import InquirerControl
@@ -12,6 +13,7 @@ from tests.utils import KeyInputs
 from tests.utils import execute_with_input_pipe
 from tests.utils import feed_cli_with_input
 from tests.utils import patched_prompt
+from tests.utils import prompt_toolkit_version
 
 
 def test_legacy_name():
@@ -181,6 +183,61 @@ def test_select_empty_choices():
         feed_cli_with_input("select", message, text, **kwargs)
 
 
+def test_shortcuts_share_a_single_binding():
+    def run(inp):
+        few = select(
+            "Foo message",
+            choices=["foo", "bar"],
+            use_shortcuts=True,
+            input=inp,
+            output=DummyOutput(),
+        )
+        many = select(
+            "Foo message",
+            choices=[f"choice-{i}" for i in range(30)],
+            use_shortcuts=True,
+            input=inp,
+            output=DummyOutput(),
+        )
+
+        assert len(many.application.key_bindings.bindings) == len(
+            few.application.key_bindings.bindings
+        )
+
+    execute_with_input_pipe(run)
+
+
+def test_number_jump_with_shortcuts_fails():
+    with pytest.raises(ValueError):
+        select("Foo message", choices=["foo"], use_shortcuts=True, use_number_jump=True)
+
+
+def test_page_down_skips_disabled_choices():
+    message = "Foo message"
+    choices = [f"choice-{i}" for i in range(300)]
+    choices[50:200] = [Choice(f"disabled-{i}", disabled=True) for i in range(150)]
+    text = KeyInputs.PAGEDOWN + KeyInputs.PAGEDOWN + KeyInputs.ENTER + "\r"
+
+    result, cli = feed_cli_with_input("select", message, text, choices=choices)
+    assert result == "choice-200"
+
+
+def test_select_from_choice_table():
+    message = "Foo message"
+    table = ChoiceTable(
+        ["foo", "bar", "bazz"], values=[1, 2, 3], disabled=[None, True, None]
+    )
+    text = KeyInputs.DOWN + KeyInputs.ENTER + "\r"
+
+    result, cli = feed_cli_with_input("select", message, text, choices=table)
+    assert result == 3
+
+
+def test_choice_table_with_shortcuts_fails():
+    with pytest.raises(ValueError):
+        select("Foo message", choices=ChoiceTable(["foo"]), use_shortcuts=True)
+
+
 def test_disallow_shortcut_key():
     message = "Foo message"
     kwargs = {
@@ -560,3 +617,131 @@ def test_select_default_not_rendered_as_selected():
         assert ic.get_pointed_at().value == "b"
 
     execute_with_input_pipe(run)
+
+
+def test_select_virtualized_long_list():
+    message = "Foo message"
+    kwargs = {"choices": [str(i) for i in range(1000)], "virtualize": True}
+    text = KeyInputs.UP + KeyInputs.UP + KeyInputs.ENTER + "\r"
+
+    result, cli = feed_cli_with_input("select", message, text, **kwargs)
+    assert result == "998"
+
+
+def test_select_lazy_choices():
+    pulled = []
+
+    def choices():
+        for i in range(100000):
+            pulled.append(i)
+            yield str(i)
+
+    message = "Foo message"
+    text = KeyInputs.DOWN + KeyInputs.DOWN + KeyInputs.ENTER + "\r"
+
+    result, cli = feed_cli_with_input("select", message, text, choices=choices())
+    assert result == "2"
+    assert len(pulled) < 100
+
+
+def test_select_lazy_choices_default():
+    message = "Foo message"
+    kwargs = {"choices": (str(i) for i in range(1000)), "default": "500"}
+    text = KeyInputs.DOWN + KeyInputs.ENTER + "\r"
+
+    result, cli = feed_cli_with_input("select", message, text, **kwargs)
+    assert result == "501"
+
+
+def test_select_lazy_choices_invalid_default():
+    message = "Foo message"
+    kwargs = {"choices": iter(["a", "b"]), "default": "c"}
+
+    with pytest.raises(ValueError):
+        feed_cli_with_input("select", message, KeyInputs.ENTER, **kwargs)
+
+
+def test_select_empty_lazy_choices():
+    message = "Foo message"
+
+    with pytest.raises(ValueError):
+        feed_cli_with_input("select", message, KeyInputs.ENTER, choices=iter([]))
+
+
+@pytest.mark.skipif(
+    prompt_toolkit_version < (3, 0, 0), reason="requires prompt toolkit >= 3.0"
+)
+def test_select_async_choices():
+    async def choices():
+        for c in ["foo", "bar", "bazz"]:
+            yield c
+
+    message = "Foo message"
+    text = ["", KeyInputs.DOWN + KeyInputs.ENTER + "\r"]
+
+    result, cli = feed_cli_with_input(
+        "select", message, text, sleep_time=0.1, choices=choices()
+    )
+    assert result == "bar"
+
+
+@pytest.mark.skipif(
+    prompt_toolkit_version >= (3, 0, 0), reason="requires prompt toolkit 2"
+)
+def test_select_async_choices_require_prompt_toolkit_3():
+    async def choices():
+        yield "foo"
+
+    with pytest.raises(ValueError, match="require prompt_toolkit 3"):
+        select("Foo message", choices=choices())
+
+
+@pytest.mark.skipif(
+    prompt_toolkit_version < (3, 0, 0), reason="requires prompt toolkit >= 3.0"
+)
+def test_select_async_choices_provider():
+    async def choices():
+        yield ["foo", "bar"]
+        yield [Choice("bazz", value=3)]
+
+    message = "Foo message"
+    text = ["", KeyInputs.UP + KeyInputs.ENTER + "\r"]
+
+    result, cli = feed_cli_with_input(
+        "select", message, text, sleep_time=0.1, choices=choices
+    )
+    assert result == 3
+
+
+def test_select_fuzzy_search_filter():
+    message = "Foo message"
+    kwargs = {"choices": ["apple", "banana", "pineapple", "grape"]}
+    text = "pe" + KeyInputs.ENTER + "\r"
+
+    result, cli = feed_cli_with_input(
+        "select",
+        message,
+        text,
+        use_search_filter=True,
+        use_fuzzy_search=True,
+        use_jk_keys=False,
+        **kwargs,
+    )
+    assert result == "grape"
+
+
+def test_select_fuzzy_search_with_matcher_exception():
+    message = "Foo message"
+    text = KeyInputs.ENTER + "\r"
+
+    with pytest.raises(ValueError):
+        feed_cli_with_input(
+            "select",
+            message,
+            text,
+            choices=["foo", "bar"],
+            use_search_filter=True,
+            use_fuzzy_search=True,
+            use_jk_keys=False,
+            search_matcher=lambda c, s: True,
+        )
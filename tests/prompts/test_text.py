@@ -1,10 +1,14 @@
 # -*- coding: utf-8 -*-
+import asyncio
 import re
 
+import pytest
+from prompt_toolkit.application import get_app
 from prompt_toolkit.validation import ValidationError
 from prompt_toolkit.validation import Validator
 
 from tests.utils import feed_cli_with_input
+from tests.utils import prompt_toolkit_version
 
 
 def test_legacy_name():
@@ -36,6 +40,36 @@ def test_text_validate():
     assert result == "Doe"
 
 
+def test_text_validate_with_coroutine_function():
+    async def validate(val):
+        await asyncio.sleep(0.01)
+        return val == "Doe" or "is your last name Doe?"
+
+    message = "What is your name"
+    text = "\rDoe\r"
+
+    result, cli = feed_cli_with_input("text", message, text, validate=validate)
+    assert result == "Doe"
+
+
+@pytest.mark.skipif(
+    prompt_toolkit_version < (3, 0, 0), reason="requires prompt toolkit >= 3.0"
+)
+def test_text_validate_with_coroutine_function_on_the_application_loop():
+    loops = []
+
+    async def validate(val):
+        loops.append(asyncio.get_running_loop() is get_app().loop)
+        await asyncio.sleep(0.01)
+        return val == "Doe" or "is your last name Doe?"
+
+    result, cli = feed_cli_with_input(
+        "text", "What is your name", "Doe\r", validate=validate
+    )
+    assert result == "Doe"
+    assert loops and all(loops)
+
+
 def test_text_validate_with_class():
     class SimpleValidator(Validator):
         def validate(self, document):
@@ -0,0 +1,194 @@
+import json
+
+import pytest
+
+import questionary
+from questionary import Choice
+from questionary.prompt import PromptParameterException
+
+QUESTIONS = [
+    {
+        "type": "text",
+        "name": "name",
+        "message": "Name?",
+        "validate": lambda t: len(t) > 0,
+    },
+    {"type": "confirm", "name": "deploy", "message": "Deploy?"},
+    {
+        "type": "select",
+        "name": "region",
+        "message": "Region?",
+        "choices": ["eu", "us", Choice("ap", disabled="full")],
+        "when": lambda answers: answers["deploy"],
+    },
+    {
+        "type": "checkbox",
+        "name": "features",
+        "message": "Features?",
+        "choices": lambda answers: ["a", "b", answers["name"]],
+        "filter": sorted,
+    },
+    {
+        "type": "text",
+        "name": "greeting",
+        "message": "Greeting?",
+        "default": lambda answers: f"Hello {answers['name']}",
+    },
+    {"type": "print", "name": "done", "message": "Done"},
+]
+
+
+def test_batch_prompt():
+    source = {"name": "x", "deploy": True, "region": "us", "features": ["x", "a"]}
+
+    result = questionary.batch_prompt(QUESTIONS, source)
+
+    assert result == {
+        "name": "x",
+        "deploy": True,
+        "region": "us",
+        "features": ["a", "x"],
+        "greeting": "Hello x",
+        "done": None,
+    }
+
+
+def test_batch_prompt_skips_questions():
+    result = questionary.batch_prompt(QUESTIONS, {"name": "x", "deploy": "no"})
+
+    assert "region" not in result
+    assert result["deploy"] is False
+    assert result["features"] == []
+
+
+def test_batch_prompt_answers_questions_without_input():
+    questions = [
+        {"type": "press_any_key_to_continue", "name": "intro"},
+        {
+            "type": "checkbox",
+            "name": "features",
+            "message": "Features?",
+            "choices": [Choice("a", checked=True), "b", Choice("c", checked=True)],
+        },
+    ]
+
+    result = questionary.batch_prompt(questions, {})
+
+    assert result == {"features": ["a", "c"]}
+
+
+def test_batch_prompt_defaults_like_the_questions():
+    questions = [
+        {
+            "type": "checkbox",
+            "name": "features",
+            "message": "Features?",
+            "choices": [Choice("x", checked=True), "a", "b"],
+            "default": "a",
+        },
+        {
+            "type": "select",
+            "name": "level",
+            "message": "Level?",
+            "choices": [Choice("A", value=1), Choice("B", value=2)],
+            "default": Choice("A", value=1),
+        },
+    ]
+
+    assert questionary.batch_prompt(questions, {}) == {
+        "features": ["x", "a"],
+        "level": 1,
+    }
+
+    questions[0]["default"] = "c"
+    with pytest.raises(ValueError, match="'c' is not a choice"):
+        questionary.batch_prompt(questions, {})
+
+
+@pytest.mark.parametrize(
+    "source, message",
+    [
+        ({"name": "", "deploy": False}, "Invalid answer for name question"),
+        ({"deploy": False}, "No answer for name question"),
+        ({"name": "x", "deploy": "maybe"}, "'maybe' is not yes or no"),
+        ({"name": "x", "deploy": True, "region": "ap"}, "'ap' is not a choice"),
+        (
+            {"name": "x", "deploy": False, "features": ["c"]},
+            "'c' is not a choice",
+        ),
+    ],
+)
+def test_batch_prompt_rejects_invalid_answers(source, message):
+    with pytest.raises(ValueError, match=message):
+        questionary.batch_prompt(QUESTIONS, source)
+
+
+def test_batch_prompt_checks_question_configs():
+    with pytest.raises(PromptParameterException):
+        questionary.batch_prompt([{"type": "select", "name": "a"}], {"a": 1})
+
+
+def test_batch_prompt_from_env():
+    environ = {
+        "QUESTIONARY_NAME": "x",
+        "QUESTIONARY_DEPLOY": "yes",
+        "QUESTIONARY_REGION": "eu",
+        "QUESTIONARY_FEATURES": "b, a",
+        "OTHER": "ignored",
+    }
+
+    source = questionary.answers_from_env(environ=environ)
+    result = questionary.batch_prompt(QUESTIONS, source)
+
+    assert source == {"name": "x", "deploy": "yes", "region": "eu", "features": "b, a"}
+    assert result["deploy"] is True
+    assert result["features"] == ["a", "b"]
+
+
+def test_batch_prompt_from_json_file(tmp_path):
+    json_file = tmp_path / "answers.json"
+    json_file.write_text(json.dumps({"name": "x", "deploy": False}))
+
+    assert questionary.batch_prompt(QUESTIONS, json_file)["name"] == "x"
+
+
+def test_batch_prompt_from_yaml_file(tmp_path):
+    pytest.importorskip("yaml")
+
+    yaml_file = tmp_path / "answers.yaml"
+    yaml_file.write_text("name: y\ndeploy: true\nregion: eu\n")
+
+    assert questionary.batch_prompt(QUESTIONS, str(yaml_file))["region"] == "eu"
+
+
+def test_answer_many_records(tmp_path):
+    records = tmp_path / "records.jsonl"
+    records.write_text(
+        "\n".join(json.dumps({"name": str(i), "deploy": False}) for i in range(100))
+    )
+
+    compiled = questionary.compile(QUESTIONS)
+    results = compiled.answer_many(questionary.iter_answer_records(records))
+
+    assert [r["greeting"] for r in results] == [f"Hello {i}" for i in range(100)]
+
+
+def test_iter_answer_records_from_yaml_documents(tmp_path):
+    pytest.importorskip("yaml")
+
+    records = tmp_path / "records.yml"
+    records.write_text("name: a\n---\n- name: b\n- name: c\n")
+
+    assert list(questionary.iter_answer_records(records)) == [
+        {"name": "a"},
+        {"name": "b"},
+        {"name": "c"},
+    ]
+
+
+def test_load_answers_requires_mapping(tmp_path):
+    answers = tmp_path / "answers.json"
+    answers.write_text("[1, 2]")
+
+    with pytest.raises(ValueError, match="must contain a mapping"):
+        questionary.load_answers(answers)
@@ -1,3 +1,5 @@
+import asyncio
+
 from prompt_toolkit.output import DummyOutput
 from pytest import fail
 
@@ -77,3 +79,85 @@ def test_ask_should_catch_keyboard_exception():
             fail("Keyboard Interrupt should be caught by `ask()`")
 
     execute_with_input_pipe(run)
+
+
+def test_form_in_single_application():
+    def run(inp):
+        inp.send_text("Y" + KeyInputs.DOWN + KeyInputs.ENTER + "Hi" + KeyInputs.ENTER)
+        f = form(
+            q1=questionary.confirm("Hello?", input=inp, output=DummyOutput()),
+            q2=questionary.select(
+                "World?", choices=["foo", "bar"], input=inp, output=DummyOutput()
+            ),
+            q3=questionary.text("Name?", input=inp, output=DummyOutput()).skip_if(
+                True, 42
+            ),
+            q4=questionary.text("Greeting?", input=inp, output=DummyOutput()),
+        )
+
+        result = f.unsafe_ask(single_application=True)
+
+        assert result == {"q1": True, "q2": "bar", "q3": 42, "q4": "Hi"}
+
+        # the questions are reset when the form is asked again
+        inp.send_text("n" + KeyInputs.ENTER + KeyInputs.ENTER)
+        result = f.unsafe_ask(single_application=True)
+
+        assert result == {"q1": False, "q2": "foo", "q3": 42, "q4": ""}
+
+    execute_with_input_pipe(run)
+
+
+def test_form_in_single_application_skips_all_questions():
+    def run(inp):
+        f = form(
+            q1=questionary.text("Hello?", input=inp, output=DummyOutput()).skip_if(
+                True, 42
+            )
+        )
+
+        assert f.unsafe_ask(single_application=True) == {"q1": 42}
+
+    execute_with_input_pipe(run)
+
+
+def test_form_in_single_application_catches_keyboard_exception():
+    def run(inp):
+        inp.send_text("Y" + KeyInputs.CONTROLC)
+        f = example_form(inp)
+
+        assert f.ask(single_application=True) == {}
+
+    execute_with_input_pipe(run)
+
+
+def test_form_in_single_application_async():
+    loop = asyncio.new_event_loop()
+
+    def run(inp):
+        inp.send_text("Y" + KeyInputs.ENTER)
+        f = example_form(inp)
+
+        result = loop.run_until_complete(f.ask_async(single_application=True))
+
+        assert result == {"q1": True, "q2": "foo"}
+
+    execute_with_input_pipe(run)
+
+
+def test_form_in_single_application_traces_questions():
+    def run(inp):
+        inp.send_text("Y" + KeyInputs.DOWN + KeyInputs.ENTER)
+        f = example_form(inp)
+        traces = [field.question.enable_tracing() for field in f.form_fields]
+
+        result = f.unsafe_ask(single_application=True)
+
+        assert result == {"q1": True, "q2": "bar"}
+        return traces
+
+    for trace in execute_with_input_pipe(run):
+        names = [e.name for e in trace.events]
+        assert names.count("ask") == 1
+        assert names.count("first render") == 1
+        assert trace.counters["key_presses"] > 0
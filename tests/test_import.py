@@ -0,0 +1,60 @@
+import subprocess
+import sys
+
+import pytest
+
+import questionary
+
+# generous limit for the cumulative import time in microseconds, importing
+# prompt_toolkit alone takes several times as long
+IMPORT_TIME_LIMIT = 100_000
+
+
+def _import_questionary(code: str = "") -> subprocess.CompletedProcess:
+    return subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import questionary\n{code}"],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+
+
+def test_import_does_not_load_prompt_toolkit():
+    result = _import_questionary(
+        "import sys\n" "print(any(m.startswith('prompt_toolkit') for m in sys.modules))"
+    )
+    assert result.stdout.strip() == "False"
+
+
+def test_import_time():
+    result = _import_questionary()
+
+    # lines look like "import time: self [us] | cumulative | imported package"
+    cumulative = [
+        int(line.split("|")[1])
+        for line in result.stderr.splitlines()
+        if line.split("|")[-1].strip() == "questionary"
+    ]
+    assert cumulative and cumulative[0] < IMPORT_TIME_LIMIT
+
+
+def test_lazy_attributes():
+    from questionary.form import form
+    from questionary.prompt import prompt
+
+    assert questionary.form is form
+    assert questionary.prompt is prompt
+    assert questionary.print.__name__ == "print_formatted_text"
+    assert set(questionary.__all__) <= set(dir(questionary))
+
+    with pytest.raises(AttributeError):
+        questionary.does_not_exist
+
+
+def test_available_prompts_are_loaded_lazily():
+    from questionary.prompts import AVAILABLE_PROMPTS
+    from questionary.prompts import prompt_by_name
+
+    assert "list" in AVAILABLE_PROMPTS
+    assert prompt_by_name("list") is questionary.select
+    assert prompt_by_name("does_not_exist") is None
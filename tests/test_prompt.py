@@ -1,7 +1,16 @@
+import asyncio
+import threading
+
 import pytest
+from prompt_toolkit.output import DummyOutput
 
 from questionary.prompt import PromptParameterException
+from questionary.prompt import _TrackedAnswers
+from questionary.prompt import compile
 from questionary.prompt import prompt
+from questionary.prompt import unsafe_prompt_async
+from tests.utils import KeyInputs
+from tests.utils import execute_with_input_pipe
 from tests.utils import patched_prompt
 
 
@@ -76,3 +85,94 @@ def test_print_with_name():
     questions = [{"name": "hello", "type": "print", "message": "Hello World"}]
     result = patched_prompt(questions, "")
     assert result == {"hello": None}
+
+
+def test_compile_validates_all_questions():
+    with pytest.raises(ValueError):
+        compile(
+            [
+                {"type": "confirm", "name": "continue", "message": "Continue?"},
+                {"type": "mytype", "name": "other", "message": "Other?"},
+            ]
+        )
+
+    with pytest.raises(PromptParameterException):
+        compile([{"type": "confirm", "name": "continue"}])
+
+
+def test_compiled_prompt_can_be_asked_repeatedly():
+    calls = []
+
+    def choices(answers):
+        calls.append(answers)
+        return ["a", "b"]
+
+    questions = [
+        {"type": "text", "name": "name", "message": "Name?"},
+        {
+            "type": "select",
+            "name": "letter",
+            "message": "Letter?",
+            "choices": choices,
+            "when": lambda answers: answers["name"] != "skip",
+        },
+    ]
+
+    def run(inp):
+        compiled = compile(questions, input=inp, output=DummyOutput())
+
+        inp.send_text("foo\r" + KeyInputs.DOWN + KeyInputs.ENTER)
+        first = compiled.unsafe_ask()
+        inp.send_text("skip\r")
+        second = compiled.unsafe_ask({"other": 1})
+        return first, second
+
+    first, second = execute_with_input_pipe(run)
+    assert first == {"name": "foo", "letter": "b"}
+    assert second == {"other": 1, "name": "skip"}
+    assert len(calls) == 1
+
+
+def test_prompt_async_prefetches_options():
+    threads = []
+
+    def choices(answers):
+        threads.append(threading.current_thread())
+        return ["a", "b"]
+
+    def default(answers):
+        threads.append(threading.current_thread())
+        return answers["name"].upper()
+
+    questions = [
+        {"type": "text", "name": "name", "message": "Name?"},
+        {"type": "select", "name": "letter", "message": "?", "choices": choices},
+        {"type": "text", "name": "shout", "message": "Shout?", "default": default},
+    ]
+
+    def run(inp):
+        inp.send_text("foo\r" + KeyInputs.DOWN + KeyInputs.ENTER + KeyInputs.ENTER)
+        return asyncio.run(
+            unsafe_prompt_async(
+                questions, prefetch=True, input=inp, output=DummyOutput()
+            )
+        )
+
+    result = execute_with_input_pipe(run)
+
+    assert result == {"name": "foo", "letter": "b", "shout": "FOO"}
+    # choices once, default before and after the name is known
+    assert len(threads) == 3
+    assert threading.main_thread() not in threads
+
+
+def test_tracked_answers_is_current():
+    tracked = _TrackedAnswers({"a": 1, "b": 2})
+    assert tracked.get("a") == 1 and "c" not in tracked
+
+    assert tracked.is_current({"a": 1, "b": 3})
+    assert not tracked.is_current({"a": 1, "c": 3})
+    assert not tracked.is_current({"b": 2})
+
+    list(tracked)
+    assert not tracked.is_current({"a": 1, "b": 3})
@@ -5,6 +5,9 @@ import pytest
 from prompt_toolkit.output import DummyOutput
 from pytest import fail
 
+from questionary import Choice
+from questionary import checkbox
+from questionary import select
 from questionary import text
 from questionary.utils import is_prompt_toolkit_3
 from tests.utils import KeyInputs
@@ -94,3 +97,39 @@ def test_multiline_text():
         assert response == "Hello\nworld"
 
     execute_with_input_pipe(run)
+
+
+def test_ask_question_again():
+    def run(inp):
+        question = text("Hello?", default="World", input=inp, output=DummyOutput())
+
+        inp.send_text("!" + KeyInputs.ENTER)
+        assert question.ask() == "World!"
+
+        inp.send_text(KeyInputs.ENTER)
+        assert question.ask() == "World"
+
+    execute_with_input_pipe(run)
+
+
+def test_ask_select_and_checkbox_again():
+    def run(inp):
+        question = select("Pick", ["a", "b", "c"], input=inp, output=DummyOutput())
+
+        inp.send_text(KeyInputs.DOWN + KeyInputs.ENTER)
+        assert question.ask() == "b"
+
+        inp.send_text(KeyInputs.ENTER)
+        assert question.ask() == "a"
+
+        question = checkbox(
+            "Pick", ["a", Choice("b", checked=True)], input=inp, output=DummyOutput()
+        )
+
+        inp.send_text(KeyInputs.SPACE + KeyInputs.ENTER)
+        assert question.ask() == ["a", "b"]
+
+        inp.send_text(KeyInputs.ENTER)
+        assert question.ask() == ["b"]
+
+    execute_with_input_pipe(run)
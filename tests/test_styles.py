@@ -0,0 +1,29 @@
+from prompt_toolkit.styles import Style
+
+from questionary import styles
+from questionary.constants import DEFAULT_STYLE
+
+
+def test_merge_styles_default_reuses_merged_style():
+    custom = Style([("qmark", "fg:red")])
+
+    merged = styles.merge_styles_default([custom])
+
+    assert styles.merge_styles_default([custom]) is merged
+    assert styles.merge_styles_default([None, custom]) is merged
+    assert styles.merge_styles_default([Style([("qmark", "fg:red")])]) is not merged
+    assert merged.get_attrs_for_style_str("class:qmark").color == "ff0000"
+
+
+def test_merge_styles_default_cache_is_bounded():
+    for _ in range(styles.MERGED_STYLES_CACHE_SIZE + 5):
+        styles.merge_styles_default([Style([])])
+
+    assert len(styles._merged_styles) <= styles.MERGED_STYLES_CACHE_SIZE
+
+
+def test_merge_styles_default_without_styles():
+    merged = styles.merge_styles_default([None])
+
+    assert styles.merge_styles_default([]) is merged
+    assert merged.style_rules == DEFAULT_STYLE.style_rules
@@ -0,0 +1,121 @@
+import json
+
+import pytest
+from prompt_toolkit.output import DummyOutput
+
+from questionary import autocomplete
+from questionary import select
+from questionary import text
+from questionary.tracing import QuestionTrace
+from tests.utils import KeyInputs
+from tests.utils import execute_with_input_pipe
+
+
+def test_trace_select():
+    def run(inp):
+        question = select("Pick", ["a", "b", "c"], input=inp, output=DummyOutput())
+        trace = question.enable_tracing()
+        assert question.enable_tracing() is trace
+
+        inp.send_text(KeyInputs.DOWN + KeyInputs.ENTER)
+        assert question.ask() == "b"
+        return trace
+
+    trace = execute_with_input_pipe(run)
+    names = [e.name for e in trace.events]
+
+    assert names.count("first render") == 1
+    assert names.count("ask") == 1
+    assert trace.counters["key_presses"] == 2
+    assert trace.counters["renders"] == names.count("render") + 1
+    assert trace.counters["tokens"] > 0
+    assert any(
+        e.name == "tokens" and e.args["control"] == "InquirerControl"
+        for e in trace.events
+    )
+
+
+def test_trace_validation_and_completion():
+    def run(inp):
+        question = autocomplete(
+            "Fruit?",
+            ["apple", "banana"],
+            validate=lambda t: t == "apple",
+            input=inp,
+            output=DummyOutput(),
+        )
+        trace = question.enable_tracing()
+
+        inp.send_text("ap" + KeyInputs.ENTER + "ple" + KeyInputs.ENTER)
+        assert question.ask() == "apple"
+        return trace
+
+    trace = execute_with_input_pipe(run)
+
+    validations = [e for e in trace.events if e.category == "validation"]
+    assert [e.args["valid"] for e in validations if e.name == "validate"][-1]
+    assert trace.counters["validations"] == len(validations)
+    assert trace.counters["completions"] > 0
+
+
+def test_write_trace(tmp_path):
+    def run(inp):
+        question = text("Name?", input=inp, output=DummyOutput())
+        trace = question.enable_tracing()
+
+        inp.send_text("bob" + KeyInputs.ENTER)
+        question.ask()
+        return trace
+
+    trace = execute_with_input_pipe(run)
+
+    trace.write(tmp_path / "trace.json")
+    data = json.loads((tmp_path / "trace.json").read_text())
+    assert len(data["events"]) == len(trace.events)
+    assert data["counters"]["key_presses"] == 4
+
+    trace.write(tmp_path / "chrome.json", format="chrome")
+    data = json.loads((tmp_path / "chrome.json").read_text())
+    assert {e["ph"] for e in data["traceEvents"]} == {"X", "C"}
+
+    with pytest.raises(ValueError):
+        trace.write(tmp_path / "trace.txt", format="txt")
+
+
+def test_trace_build_and_listen_to_phases():
+    recorded = []
+
+    def run(inp):
+        question = select(
+            "Pick", ["a", "b"], input=inp, output=DummyOutput(), trace=True
+        )
+        question.trace.add_listener(recorded.append)
+
+        inp.send_text(KeyInputs.ENTER)
+        assert question.ask() == "a"
+        return question.trace
+
+    trace = execute_with_input_pipe(run)
+
+    assert trace.events[0].name == "build"
+    assert trace.events[0].start >= 0
+    assert recorded == trace.events[1:]
+
+
+def test_share_a_trace_between_questions():
+    trace = QuestionTrace()
+
+    def run(inp):
+        inp.send_text("bob" + KeyInputs.ENTER + KeyInputs.ENTER)
+        name = text("Name?", input=inp, output=DummyOutput(), trace=trace)
+        pick = select("Pick", ["a"], input=inp, output=DummyOutput())
+        assert pick.enable_tracing(trace) is trace
+
+        assert name.ask() == "bob"
+        assert pick.ask() == "a"
+
+    execute_with_input_pipe(run)
+
+    names = [e.name for e in trace.events]
+    assert names.count("build") == 1
+    assert names.count("ask") == 2
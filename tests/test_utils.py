@@ -1,3 +1,6 @@
+import inspect
+from unittest.mock import patch
+
 from questionary import utils
 
 
@@ -95,3 +98,27 @@ def test_missing_arguments_of_no_args():
 
     defaults = utils.missing_arguments(f, {})
     assert defaults == set()
+
+
+def test_signature_info_is_cached():
+    def f(a, b=2, *, c=3):
+        pass
+
+    with patch.object(utils.inspect, "signature", wraps=inspect.signature) as sig:
+        for _ in range(3):
+            assert utils.missing_arguments(f, {}) == {"a"}
+            assert utils.used_kwargs({"a": 1, "c": 2, "d": 3}, f) == {"a": 1, "c": 2}
+
+    assert sig.call_count == 1
+
+
+def test_signature_info_of_unhashable_callable():
+    class Unhashable:
+        __hash__ = None
+
+        def __call__(self, a, b=2):
+            pass
+
+    info = utils.signature_info(Unhashable())
+    assert info.arguments == ("a", "b")
+    assert info.required == {"a"}
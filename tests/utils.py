@@ -17,6 +17,10 @@ class KeyInputs:
     UP = "\x1b[A"
     LEFT = "\x1b[D"
     RIGHT = "\x1b[C"
+    PAGEUP = "\x1b[5~"
+    PAGEDOWN = "\x1b[6~"
+    HOME = "\x1b[H"
+    END = "\x1b[F"
     ENTER = "\r"
     ESCAPE = "\x1b"
     CONTROLC = "\x03"